@@ -42,6 +42,8 @@ from .common import NotifyFormat
 from .common import NOTIFY_FORMATS
 from .common import OverflowMode
 from .common import OVERFLOW_MODES
+from .common import OverflowUnit
+from .common import OVERFLOW_UNITS
 from .common import ConfigFormat
 from .common import CONFIG_FORMATS
 from .common import ContentIncludeMode
@@ -50,6 +52,8 @@ from .common import ContentLocation
 from .common import CONTENT_LOCATIONS
 from .common import PersistentStoreMode
 from .common import PERSISTENT_STORE_MODES
+from .common import PersistentStoreCodec
+from .common import PERSISTENT_STORE_CODECS
 
 from .url import URLBase
 from .url import PrivacyMode
@@ -89,10 +93,12 @@ __all__ = [
     # Reference
     'NotifyType', 'NotifyImageSize', 'NotifyFormat', 'OverflowMode',
     'NOTIFY_TYPES', 'NOTIFY_IMAGE_SIZES', 'NOTIFY_FORMATS', 'OVERFLOW_MODES',
+    'OverflowUnit', 'OVERFLOW_UNITS',
     'ConfigFormat', 'CONFIG_FORMATS',
     'ContentIncludeMode', 'CONTENT_INCLUDE_MODES',
     'ContentLocation', 'CONTENT_LOCATIONS',
     'PersistentStoreMode', 'PERSISTENT_STORE_MODES',
+    'PersistentStoreCodec', 'PERSISTENT_STORE_CODECS',
     'PrivacyMode',
 
     # Managers
@@ -37,13 +37,13 @@ from .manager_plugins import NotificationManager
 from .utils import parse_list
 from .utils import parse_urls
 from .utils import cwe312_url
-from .emojis import apply_emojis
 from .logger import logger
 from .asset import AppriseAsset
 from .apprise_config import AppriseConfig
 from .apprise_attachment import AppriseAttachment
 from .locale import AppriseLocale
 from .config.base import ConfigBase
+from .config.base import ConfigEntry
 from .plugins.base import NotifyBase
 
 from . import plugins
@@ -321,6 +321,25 @@ class Apprise:
         #     tag=[('tagA', 'tagC'), 'tagB']  = (tagA and tagC) or tagB
         #     tag=[('tagB', 'tagC')]          = tagB and tagC
 
+        for server in self._find(tag, match_always=match_always):
+            if isinstance(server, ConfigEntry):
+                # Instantiate our configuration entry
+                server = server.instance()
+                if server is None:
+                    # The entry could not be loaded
+                    continue
+
+            yield server
+        return
+
+    def _find(self, tag=common.MATCH_ALL_TAG, match_always=True):
+        """
+        Identical to find() except that the services defined within our
+        configuration are returned as ConfigEntry objects; they are left to
+        the caller to instantiate.
+
+        """
+
         # A match_always flag allows us to pick up on our 'any' keyword
         # and notify these services under all circumstances
         match_always = common.MATCH_ALWAYS_TAG if match_always else None
@@ -329,8 +348,8 @@ class Apprise:
         for entry in self.servers:
 
             if isinstance(entry, (ConfigBase, AppriseConfig)):
-                # load our servers
-                servers = entry.servers()
+                # load our servers; they're only instantiated once matched
+                servers = entry.servers(lazy=True)
 
             else:
                 servers = [entry, ]
@@ -450,7 +469,11 @@ class Apprise:
         Internal generator function for _create_notify_calls().
         """
 
-        if len(self) == 0:
+        # Services loaded from configuration are not instantiated to perform
+        # this check; only those matching our tag(s) are created below
+        if not next((True for s in self.servers
+                     if not isinstance(s, (ConfigBase, AppriseConfig))
+                     or s.servers(lazy=True)), False):
             # Nothing to notify
             msg = "There are no service(s) to notify"
             logger.error(msg)
@@ -491,8 +514,25 @@ class Apprise:
         interpret_escapes = self.asset.interpret_escapes \
             if interpret_escapes is None else interpret_escapes
 
+        # Track whether or not we found anything to notify
+        found = False
+
+        # Track whether or not a service we matched could not be loaded
+        failed = False
+
         # Iterate over our loaded plugins
-        for server in self.find(tag, match_always=match_always):
+        for server in self._find(tag, match_always=match_always):
+            if isinstance(server, ConfigEntry):
+                # Instantiate our configuration entry
+                server = server.instance()
+                if server is None:
+                    # The entry could not be loaded
+                    failed = True
+                    continue
+
+            # Toggle our flag
+            found = True
+
             # If our code reaches here, we either did not define a tag (it
             # was set to None), or we did define a tag and the logic above
             # determined we need to notify the service it's associated with
@@ -510,54 +550,31 @@ class Apprise:
 
             if key not in conversion_title_map:
 
-                # Prepare our title
-                conversion_title_map[key] = '' if not title else title
-
                 # Conversion of title only occurs for services where the title
                 # is blended with the body (title_maxlen <= 0)
-                if conversion_title_map[key] and server.title_maxlen <= 0:
+                title_format = body_format \
+                    if title and server.title_maxlen <= 0 \
+                    else server.notify_format
+
+                try:
+                    # Prepare our title
                     conversion_title_map[key] = convert_between(
-                        body_format, server.notify_format,
-                        content=conversion_title_map[key])
-
-                # Our body is always converted no matter what
-                conversion_body_map[key] = \
-                    convert_between(
-                        body_format, server.notify_format, content=body)
-
-                if interpret_escapes:
-                    #
-                    # Escape our content
-                    #
-
-                    try:
-                        # Added overhead required due to Python 3 Encoding Bug
-                        # identified here: https://bugs.python.org/issue21331
-                        conversion_body_map[key] = \
-                            conversion_body_map[key]\
-                            .encode('ascii', 'backslashreplace')\
-                            .decode('unicode-escape')
-
-                        conversion_title_map[key] = \
-                            conversion_title_map[key]\
-                            .encode('ascii', 'backslashreplace')\
-                            .decode('unicode-escape')
-
-                    except AttributeError:
-                        # Must be of string type
-                        msg = 'Failed to escape message body'
-                        logger.error(msg)
-                        raise TypeError(msg)
-
-                if server.interpret_emojis:
-                    #
-                    # Convert our :emoji: definitions
-                    #
-
-                    conversion_body_map[key] = \
-                        apply_emojis(conversion_body_map[key])
-                    conversion_title_map[key] = \
-                        apply_emojis(conversion_title_map[key])
+                        title_format, server.notify_format,
+                        content='' if not title else title,
+                        escapes=interpret_escapes,
+                        emojis=server.interpret_emojis)
+
+                    # Our body is always converted no matter what
+                    conversion_body_map[key] = convert_between(
+                        body_format, server.notify_format, content=body,
+                        escapes=interpret_escapes,
+                        emojis=server.interpret_emojis)
+
+                except AttributeError:
+                    # Must be of string type
+                    msg = 'Failed to escape message body'
+                    logger.error(msg)
+                    raise TypeError(msg)
 
             kwargs = dict(
                 body=conversion_body_map[key],
@@ -568,6 +585,14 @@ class Apprise:
             )
             yield (server, kwargs)
 
+        if not found and failed:
+            # None of the services we matched could be loaded; there is
+            # nothing to notify.  Services that simply didn't match our
+            # tag(s) are never instantiated to make this check.
+            msg = "There are no service(s) to notify"
+            logger.error(msg)
+            raise TypeError(msg)
+
     @staticmethod
     def _notify_sequential(*servers_kwargs):
         """
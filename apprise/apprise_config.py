@@ -270,7 +270,7 @@ class AppriseConfig:
         return True
 
     def servers(self, tag=common.MATCH_ALL_TAG, match_always=True, *args,
-                **kwargs):
+                lazy=False, **kwargs):
         """
         Returns all of our servers dynamically build based on parsed
         configuration.
@@ -284,6 +284,9 @@ class AppriseConfig:
         If the anytag is set, then any notification that is found
         set with that tag are included in the response.
 
+        If lazy is set to True, then services that have not been
+        instantiated yet are returned as ConfigEntry objects instead.
+
         """
 
         # A match_always flag allows us to pick up on our 'any' keyword
@@ -310,7 +313,7 @@ class AppriseConfig:
                     match_always=match_always):
                 # Build ourselves a list of services dynamically and return the
                 # as a list
-                response.extend(entry.servers())
+                response.extend(entry.servers(lazy=lazy))
 
         return response
 
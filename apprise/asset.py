@@ -34,6 +34,8 @@ from os.path import isfile
 from os.path import abspath
 from .common import NotifyType
 from .common import PersistentStoreMode
+from .common import PersistentStoreCodec
+from .common import PERSISTENT_STORE_CODECS
 from .manager_plugins import NotificationManager
 
 
@@ -154,6 +156,16 @@ class AppriseAsset:
     # that you leave this option as is otherwise.
     secure_logging = True
 
+    # YAML based configuration is parsed using the libyaml (C) accelerated
+    # loader if PyYAML was built with it.  Set this to False to always use
+    # the (much slower) pure Python loader instead.
+    yaml_c_loader = True
+
+    # The maximum number of bytes of web based (http://) attachment content
+    # retained in our process wide cache so that it can be shared between
+    # notifications.  Set this to zero (0) to disable the cache entirely.
+    attach_cache_size = 104857600
+
     # Optionally specify one or more path to attempt to scan for Python modules
     # By default, no paths are scanned.
     __plugin_paths = []
@@ -174,6 +186,25 @@ class AppriseAsset:
     # Set storage to auto
     __storage_mode = PersistentStoreMode.AUTO
 
+    # Optionally journal persistent storage cache changes; when set, only
+    # the entries that changed are appended to disk on each flush instead of
+    # the entire cache being re-written.
+    __storage_journal = False
+
+    # Optionally defer the writing of persistent storage changes (made in
+    # FLUSH mode) by this many seconds so that they can be batched together.
+    # Set this to zero (0) to write them as they are made.
+    __storage_flush_interval = 0
+
+    # Define the format persistent storage cache files are written in. Cache
+    # files written in any of the supported formats can always be read back.
+    __storage_codec = PersistentStoreCodec.GZIP
+
+    # Optionally prune our persistent storage path (of content older than
+    # 30 days) in the background at most this often (in seconds). Set this
+    # to zero (0) to leave pruning to the `apprise storage prune` command.
+    __storage_prune_interval = 0
+
     # All internal/system flags are prefixed with an underscore (_)
     # These can only be initialized using Python libraries and are not picked
     # up from (yaml) configuration files (if set)
@@ -190,7 +221,9 @@ class AppriseAsset:
 
     def __init__(self, plugin_paths=None, storage_path=None,
                  storage_mode=None, storage_salt=None,
-                 storage_idlen=None, **kwargs):
+                 storage_idlen=None, storage_journal=None,
+                 storage_flush_interval=None, storage_codec=None,
+                 storage_prune_interval=None, **kwargs):
         """
         Asset Initialization
 
@@ -228,6 +261,45 @@ class AppriseAsset:
             # Store value
             self.__storage_idlen = storage_idlen
 
+        if storage_journal is not None:
+            # Define whether or not our persistent storage is journaled
+            self.__storage_journal = bool(storage_journal)
+
+        if storage_flush_interval is not None:
+            # Define how long persistent storage changes can be deferred for
+            if not isinstance(storage_flush_interval, (int, float)) \
+                    or storage_flush_interval < 0:
+                # Unsupported type
+                raise ValueError(
+                    'AppriseAsset storage_flush_interval(): Value must '
+                    'be a number and >= 0')
+
+            # Store value
+            self.__storage_flush_interval = storage_flush_interval
+
+        if storage_codec is not None:
+            # Define the format our persistent storage cache is written in
+            if storage_codec not in PERSISTENT_STORE_CODECS:
+                # Unsupported type
+                raise ValueError(
+                    'AppriseAsset storage_codec(): Value must be one of: '
+                    '{}'.format(', '.join(PERSISTENT_STORE_CODECS)))
+
+            # Store value
+            self.__storage_codec = storage_codec
+
+        if storage_prune_interval is not None:
+            # Define how often our persistent storage is pruned
+            if not isinstance(storage_prune_interval, (int, float)) \
+                    or storage_prune_interval < 0:
+                # Unsupported type
+                raise ValueError(
+                    'AppriseAsset storage_prune_interval(): Value must '
+                    'be a number and >= 0')
+
+            # Store value
+            self.__storage_prune_interval = storage_prune_interval
+
         if storage_salt is not None:
             # Define the number of characters utilized from our namespace lengh
 
@@ -453,3 +525,37 @@ class AppriseAsset:
         """
 
         return self.__storage_idlen
+
+    @property
+    def storage_journal(self):
+        """
+        Return whether or not persistent storage changes are journaled
+        """
+
+        return self.__storage_journal
+
+    @property
+    def storage_flush_interval(self):
+        """
+        Return the number of seconds persistent storage changes can be
+        deferred for before they are written to disk
+        """
+
+        return self.__storage_flush_interval
+
+    @property
+    def storage_codec(self):
+        """
+        Return the format persistent storage cache files are written in
+        """
+
+        return self.__storage_codec
+
+    @property
+    def storage_prune_interval(self):
+        """
+        Return the number of seconds between background prunes of our
+        persistent storage path
+        """
+
+        return self.__storage_prune_interval
@@ -28,6 +28,8 @@
 
 import os
 import time
+import mmap
+import hashlib
 import mimetypes
 import base64
 from .. import exception
@@ -69,6 +71,15 @@ class AttachBase(URLBase):
     # 1 GB = 1048576000 bytes
     max_file_size = 1048576000
 
+    # The number of bytes read into memory at a time when streaming the
+    # content of our attachment (see chunks())
+    chunk_size = 65536
+
+    # Set to True if our content can be memory mapped while it is streamed.
+    # This allows the blocks returned by chunks() to directly reference our
+    # content without first copying it into memory.
+    mmap_support = False
+
     # By default all attachments types are inaccessible.
     # Developers of items identified in the attachment plugin directory
     # are requried to set a location
@@ -153,6 +164,10 @@ class AttachBase(URLBase):
         # Track open file pointers
         self.__pointers = set()
 
+        # Our content hash (once calculated) along with the path it was
+        # calculated against
+        self.__sha256 = None
+
         # Set our cache flag; it can be True, False, None, or a (positive)
         # integer... nothing else
         if cache is not None:
@@ -291,12 +306,14 @@ class AttachBase(URLBase):
 
         return False if not retrieve_if_missing else self.download()
 
-    def base64(self, encoding='ascii'):
+    def chunks(self, size=None):
         """
-        Returns the attachment object as a base64 string otherwise
-        None is returned if an error occurs.
+        A generator that returns the content of our attachment in blocks of
+        (at most) size bytes; chunk_size is used if no size is specified.
 
-        If encoding is set to None, then it is not encoded when returned
+        This allows our content to be processed without ever having to read
+        all of it into memory at once.  Each block is a bytes-like object
+        that should not be referenced once the next one has been requested.
         """
         if not self:
             # We could not access the attachment
@@ -305,23 +322,116 @@ class AttachBase(URLBase):
                     self.url(privacy=True)))
             raise exception.AppriseFileNotFound("Attachment Missing")
 
+        if not size or size < 1:
+            size = self.chunk_size
+
         try:
             with self.open() as f:
-                # Prepare our Attachment in Base64
-                return base64.b64encode(f.read()).decode(encoding) \
-                    if encoding else base64.b64encode(f.read())
+                mm = None
+                if self.mmap_support:
+                    try:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+                    except (ValueError, OSError):
+                        # Empty files (and some file systems) can not be
+                        # memory mapped; we'll just read our content instead
+                        pass
+
+                if mm is not None:
+                    view = memoryview(mm)
+                    try:
+                        for offset in range(0, len(view), size):
+                            yield view[offset:offset + size]
+
+                    finally:
+                        view.release()
+                        try:
+                            mm.close()
+
+                        except BufferError:
+                            # A block is still referenced by our caller; our
+                            # map is closed once it is garbage collected
+                            pass
+
+                else:
+                    while True:
+                        chunk = f.read(size)
+                        if not chunk:
+                            break
+
+                        yield chunk
 
         except (TypeError, FileNotFoundError):
             # We no longer have a path to open
             raise exception.AppriseFileNotFound("Attachment Missing")
 
-        except (TypeError, OSError, IOError) as e:
+        except (OSError, IOError) as e:
             self.logger.warning(
                 'An I/O error occurred while reading {}.'.format(
                     self.name if self else 'attachment'))
             self.logger.debug('I/O Exception: %s' % str(e))
             raise exception.AppriseDiskIOError("Attachment Access Error")
 
+    def base64_chunks(self, encoding='ascii', size=None):
+        """
+        A generator that returns our attachment base64 encoded in blocks
+        which can simply be joined together to form the entire payload.
+
+        If encoding is set to None, then the blocks are not decoded from
+        bytes when returned
+        """
+        # Our blocks must be read along a 3 byte boundary so that they can
+        # be encoded independently of one another
+        size = size if size and size > 0 else self.chunk_size
+        size = max(3, size - (size % 3))
+
+        try:
+            for chunk in self.chunks(size=size):
+                yield base64.b64encode(chunk).decode(encoding) \
+                    if encoding else base64.b64encode(chunk)
+
+        except exception.AppriseException:
+            # Already handled by chunks()
+            raise
+
+        except (OSError, IOError) as e:
+            self.logger.warning(
+                'An I/O error occurred while reading {}.'.format(
+                    self.name if self else 'attachment'))
+            self.logger.debug('I/O Exception: %s' % str(e))
+            raise exception.AppriseDiskIOError("Attachment Access Error")
+
+    def sha256(self):
+        """
+        Returns the sha256 hex digest of our attachment content.
+
+        Plugins can use this to recognize content they have already uploaded
+        to their upstream service.  The result is calculated only once for
+        each file we reference.
+        """
+        path = self.path
+        if self.__sha256 and self.__sha256[0] == path:
+            return self.__sha256[1]
+
+        digest = hashlib.sha256()
+        for chunk in self.chunks():
+            digest.update(chunk)
+
+        self.__sha256 = (path, digest.hexdigest())
+        return self.__sha256[1]
+
+    def base64(self, encoding='ascii'):
+        """
+        Returns the attachment object as a base64 string otherwise
+        None is returned if an error occurs.
+
+        If encoding is set to None, then it is not encoded when returned
+        """
+        # Our content is encoded a block at a time; this prevents us from
+        # having to also hold a full copy of our unencoded content in memory
+        return ('' if encoding else b'').join(
+            self.base64_chunks(encoding=encoding))
+
     def invalidate(self):
         """
         Release any temporary data that may be open by child classes.
@@ -341,6 +451,7 @@ class AttachBase(URLBase):
         self.detected_name = None
         self.download_path = None
         self.detected_mimetype = None
+        self.__sha256 = None
         return
 
     def download(self):
@@ -49,6 +49,9 @@ class AttachFile(AttachBase):
     # being called (server-side)
     location = ContentLocation.LOCAL
 
+    # Our content is read directly from its source
+    mmap_support = True
+
     def __init__(self, path, **kwargs):
         """
         Initialize Local File Attachment Object
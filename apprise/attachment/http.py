@@ -28,14 +28,282 @@
 
 import re
 import os
+import time
+import atexit
+import shutil
+import hashlib
 import requests
 import threading
+from collections import OrderedDict
 from tempfile import NamedTemporaryFile
+from tempfile import mkdtemp
 from .base import AttachBase
 from ..common import ContentLocation
 from ..url import PrivacyMode
+from ..asset import AppriseAsset
 from ..locale import gettext_lazy as _
 
+# Used to extract the max-age (in seconds) from a Cache-Control header
+CACHE_CONTROL_MAX_AGE_RE = re.compile(r'\bmax-age\s*=\s*"?(?P<age>\d+)', re.I)
+
+# Used to detect directives that prevent (or limit) our content reuse
+CACHE_CONTROL_NO_STORE_RE = re.compile(r'\bno-store\b', re.I)
+CACHE_CONTROL_NO_CACHE_RE = re.compile(r'\bno-cache\b', re.I)
+
+
+class HTTPContentCache:
+    """
+    A process wide cache of the content retrieved by AttachHTTP objects.
+
+    Entries are keyed on the request made (URL, credentials, headers and
+    query string) and reference content stored on disk by its SHA-256 hash;
+    identical content retrieved from different URLs is only stored once.
+
+    Content is evicted in least recently used order once the total size of
+    everything stored exceeds max_size (in bytes).  AttachHTTP objects apply
+    the limit defined by their AppriseAsset (attach_cache_size) instead; a
+    limit of zero (0) disables the cache entirely.
+    """
+
+    def __init__(self, max_size=None):
+        """
+        Initialize our cache
+        """
+        # The maximum number of bytes we will store on disk
+        self.max_size = AppriseAsset.attach_cache_size \
+            if max_size is None else max_size
+
+        # Thread safety
+        self._lock = threading.RLock()
+
+        # Our request entries keyed by request
+        self._entries = {}
+
+        # The size of our stored content keyed by hash and tracked in least
+        # recently used order
+        self._content = OrderedDict()
+
+        # The number of readers still using our content keyed by hash; content
+        # that is in use is not removed from disk until it is released
+        self._readers = {}
+
+        # The directory our content is stored in; created on demand
+        self._path = None
+
+        # Track our cache effectiveness
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self):
+        """
+        Returns the directory our content is written to (creating it if
+        required)
+        """
+        with self._lock:
+            if self._path is None:
+                self._path = mkdtemp(prefix='apprise-attach-')
+
+            return self._path
+
+    @property
+    def size(self):
+        """
+        Returns the total number of bytes currently stored
+        """
+        with self._lock:
+            return sum(self._content.values())
+
+    def get(self, key):
+        """
+        Returns a copy of the entry associated with the key specified or
+        None if there isn't one.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if not os.path.isfile(entry['path']):
+                # Our content was removed from underneath us
+                self._discard(entry['hash'])
+                return None
+
+            # Flag our content as recently used
+            self._content.move_to_end(entry['hash'])
+            return dict(entry)
+
+    def add(self, key, path, digest, size, max_size=None, **kwargs):
+        """
+        Moves the file identified by path into the cache and associates it
+        with the key specified.  Any additional keyword arguments are stored
+        along with the entry.
+
+        If a max_size is specified, it is used in place of our own.
+
+        The path to the cached content is returned, otherwise None is
+        returned if the content could not be cached in which case the file
+        at the specified path is left untouched.
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        with self._lock:
+            if size > max_size:
+                # We will not store content this large
+                return None
+
+            # Drop what we previously stored for this key (if anything)
+            self.remove(key)
+
+            dst = os.path.join(self.path, digest)
+            if digest in self._content:
+                # We already have this content; drop our copy and refresh
+                # the age of our existing one
+                os.unlink(path)
+                os.utime(dst)
+                self._content.move_to_end(digest)
+
+            else:
+                os.replace(path, dst)
+                self._content[digest] = size
+
+            self._entries[key] = dict(
+                kwargs, hash=digest, size=size, path=dst,
+                fetched=time.time())
+
+            # Keep our cache within its limits
+            while sum(self._content.values()) > max_size:
+                self._discard(next(iter(self._content)))
+
+            return dst
+
+    def refresh(self, key, **kwargs):
+        """
+        Flags the entry associated with the key as being fresh again (such as
+        after a successful re-validation with the remote server).  Any
+        additional keyword arguments update the stored entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+
+            try:
+                os.utime(entry['path'])
+
+            except OSError:
+                self._discard(entry['hash'])
+                return False
+
+            entry.update(kwargs, fetched=time.time())
+            return True
+
+    def remove(self, key):
+        """
+        Removes the entry associated with the key specified; the content it
+        referenced is only removed if nothing else references it.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+
+            if not any(e['hash'] == entry['hash']
+                       for e in self._entries.values()):
+                self._discard(entry['hash'])
+
+            return True
+
+    def acquire(self, digest):
+        """
+        Flags the content identified by the digest as being in use; it is not
+        removed from disk until it has been released again.
+        """
+        with self._lock:
+            self._readers[digest] = self._readers.get(digest, 0) + 1
+
+    def release(self, digest):
+        """
+        Releases content previously acquired; content that was discarded
+        while in use is removed once its last reader releases it.
+        """
+        with self._lock:
+            count = self._readers.pop(digest, 0) - 1
+            if count > 0:
+                self._readers[digest] = count
+
+            elif digest not in self._content:
+                self._unlink(digest)
+
+    def track(self, hit):
+        """
+        Tracks the effectiveness of our cache; hit is set to True if cached
+        content was used and False if it had to be retrieved.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+
+            else:
+                self.misses += 1
+
+    def clear(self):
+        """
+        Removes all cached content and resets our metrics
+        """
+        with self._lock:
+            self._entries.clear()
+            self._content.clear()
+            self._readers.clear()
+            self.hits = 0
+            self.misses = 0
+
+            if self._path is not None:
+                shutil.rmtree(self._path, ignore_errors=True)
+                self._path = None
+
+    def _discard(self, digest):
+        """
+        Removes the content identified by the digest along with every entry
+        referencing it.  The file itself is left in place for as long as it
+        is still being read.
+        """
+        self._content.pop(digest, None)
+        for key in [
+                k for k, e in self._entries.items() if e['hash'] == digest]:
+            del self._entries[key]
+
+        if digest not in self._readers:
+            self._unlink(digest)
+
+    def _unlink(self, digest):
+        """
+        Removes the content identified by the digest from disk
+        """
+        if self._path is None:
+            # There is nothing to remove
+            return
+
+        try:
+            os.unlink(os.path.join(self._path, digest))
+
+        except OSError:
+            pass
+
+    def __len__(self):
+        """
+        Returns the number of entries in our cache
+        """
+        return len(self._entries)
+
+
+# Our process wide content cache shared by all AttachHTTP objects
+HTTP_CACHE = HTTPContentCache()
+
+# Tidy our content on exit
+atexit.register(HTTP_CACHE.clear)
+
 
 class AttachHTTP(AttachBase):
     """
@@ -58,7 +326,7 @@ class AttachHTTP(AttachBase):
     location = ContentLocation.HOSTED
 
     # thread safe loading
-    _lock = threading.Lock()
+    _lock = threading.RLock()
 
     def __init__(self, headers=None, **kwargs):
         """
@@ -84,6 +352,9 @@ class AttachHTTP(AttachBase):
         # Where our content is written to upon a call to download.
         self._temp_file = None
 
+        # The cache and digest of the shared content we're reading (if any)
+        self._cached = None
+
         # Our Query String Dictionary; we use this to track arguments
         # specified that aren't otherwise part of this class
         self.qsd = {k: v for k, v in kwargs.get('qsd', {}).items()
@@ -130,12 +401,43 @@ class AttachHTTP(AttachBase):
                 # handled the retrieval in which case we can safely move on
                 self.logger.trace(
                     'HTTP Attachment %s already retrieved',
-                    self._temp_file.name)
+                    self.download_path)
                 return True
 
             # Ensure any existing content set has been invalidated
             self.invalidate()
 
+            # Our shared content cache is only used if caching hasn't been
+            # explicitly disabled for this attachment
+            max_size = self.asset.attach_cache_size
+            cache = HTTP_CACHE if max_size > 0 and \
+                (self.cache is None or self.cache) else None
+
+            # Our cache key; content is only ever shared between identical
+            # requests
+            key = (
+                url, self.user, self.password,
+                tuple(sorted(headers.items())),
+                tuple(sorted(self.qsd.items())),
+            )
+
+            entry = cache.get(key) if cache is not None else None
+            if entry:
+                if self.__is_fresh(entry) and self.__load(cache, entry):
+                    self.logger.trace(
+                        'HTTP Attachment %s retrieved from cache',
+                        entry['path'])
+                    cache.track(hit=True)
+                    return True
+
+                # Our content has expired; give the server an opportunity to
+                # tell us that it hasn't changed
+                if entry['etag']:
+                    headers['If-None-Match'] = entry['etag']
+
+                if entry['last_modified']:
+                    headers['If-Modified-Since'] = entry['last_modified']
+
             self.logger.debug(
                 'HTTP Attachment Fetch URL: %s (cert_verify=%r)' % (
                     url, self.verify_certificate))
@@ -154,6 +456,35 @@ class AttachHTTP(AttachBase):
                     # Handle Errors
                     r.raise_for_status()
 
+                    # Acquire our caching instructions from the server
+                    store, expires = self.__cache_control(r.headers)
+
+                    if entry and r.status_code == requests.codes.not_modified:
+                        # Our cached content is still valid
+                        if 'Cache-Control' not in r.headers:
+                            # Preserve our original instructions
+                            store, expires = True, entry['expires']
+
+                        if not store or \
+                                not cache.refresh(key, expires=expires) or \
+                                not self.__load(cache, entry):
+                            # We can no longer rely on our cached content;
+                            # retrieve it again without any conditions
+                            cache.remove(key)
+                            self.logger.debug(
+                                'HTTP Attachment cache could not be '
+                                'revalidated; retrieving {} again'.format(
+                                    self.url(privacy=True)))
+
+                            # Release our connection before we make another
+                            r.close()
+                            return self.download(**kwargs)
+
+                        self.logger.trace(
+                            'HTTP Attachment %s revalidated', entry['path'])
+                        cache.track(hit=True)
+                        return True
+
                     # Get our file-size (if known)
                     try:
                         file_size = int(r.headers.get('Content-Length', '0'))
@@ -189,7 +520,11 @@ class AttachHTTP(AttachBase):
                     # to False or it isn't compatible with Microsoft Windows
                     # instances. In lieu of this, __del__ will clean up the
                     # file for us.
-                    self._temp_file = NamedTemporaryFile(delete=False)
+                    # Content destined for our cache is written alongside it
+                    # so that it can be moved into place once retrieved.
+                    self._temp_file = NamedTemporaryFile(
+                        delete=False,
+                        dir=cache.path if cache is not None else None)
 
                     # Get our chunk size
                     chunk_size = self.chunk_size
@@ -197,12 +532,16 @@ class AttachHTTP(AttachBase):
                     # Track all bytes written to disk
                     bytes_written = 0
 
+                    # Our content hash
+                    sha256 = hashlib.sha256()
+
                     # If we get here, we can now safely write our content to
                     # disk
                     for chunk in r.iter_content(chunk_size=chunk_size):
                         # filter out keep-alive chunks
                         if chunk:
                             self._temp_file.write(chunk)
+                            sha256.update(chunk)
                             bytes_written = self._temp_file.tell()
 
                             # Prevent a case where Content-Length isn't
@@ -240,6 +579,33 @@ class AttachHTTP(AttachBase):
                     if not self.detected_name:
                         self.detected_name = os.path.basename(self.fullpath)
 
+                    if cache is not None and store:
+                        cache.track(hit=False)
+
+                        # Hand our content over to our shared cache; we
+                        # register ourselves as a reader first so that it
+                        # can't be removed from underneath us
+                        digest = sha256.hexdigest()
+                        cache.acquire(digest)
+                        self._temp_file.close()
+                        path = cache.add(
+                            key, self._temp_file.name, digest, bytes_written,
+                            max_size=max_size,
+                            name=self.detected_name,
+                            mimetype=self.detected_mimetype,
+                            etag=r.headers.get('ETag'),
+                            last_modified=r.headers.get('Last-Modified'),
+                            expires=expires)
+
+                        if path:
+                            # Our cache now owns our content
+                            self._temp_file = None
+                            self._cached = (cache, digest)
+                            self.download_path = path
+
+                        else:
+                            cache.release(digest)
+
             except requests.RequestException as e:
                 self.logger.error(
                     'A Connection error occurred retrieving HTTP '
@@ -270,6 +636,58 @@ class AttachHTTP(AttachBase):
         # Return our success
         return True
 
+    def __is_fresh(self, entry):
+        """
+        Returns True if the cached entry specified can be used as is.
+        """
+        now = time.time()
+        if entry['expires'] is not None and now >= entry['expires']:
+            # The server told us not to use it past this point
+            return False
+
+        cache = self.template_args['cache']['default'] \
+            if self.cache is None else self.cache
+
+        return cache is True or (now - entry['fetched']) <= cache
+
+    def __load(self, cache, entry):
+        """
+        Applies the cached entry specified to this object; False is returned
+        if its content is no longer available.
+        """
+        cache.acquire(entry['hash'])
+        if not os.path.isfile(entry['path']):
+            # Our content was removed from underneath us
+            cache.release(entry['hash'])
+            return False
+
+        self._cached = (cache, entry['hash'])
+        self.download_path = entry['path']
+        self.detected_name = entry['name']
+        self.detected_mimetype = entry['mimetype']
+        return True
+
+    @staticmethod
+    def __cache_control(headers):
+        """
+        Interprets the Cache-Control header (if present) and returns a tuple
+        of whether the content may be stored and the time (if any) it should
+        no longer be used without first revalidating it.
+        """
+        control = headers.get('Cache-Control', '')
+        if CACHE_CONTROL_NO_STORE_RE.search(control):
+            return (False, None)
+
+        if CACHE_CONTROL_NO_CACHE_RE.search(control):
+            # We must always revalidate our content
+            return (True, 0)
+
+        result = CACHE_CONTROL_MAX_AGE_RE.search(control)
+        if result:
+            return (True, time.time() + int(result.group('age')))
+
+        return (True, None)
+
     def invalidate(self):
         """
         Close our temporary file
@@ -290,6 +708,12 @@ class AttachHTTP(AttachBase):
             # this block again
             self._temp_file = None
 
+        if self._cached:
+            # We're no longer reading our shared content
+            cache, digest = self._cached
+            self._cached = None
+            cache.release(digest)
+
         super().invalidate()
 
     def __del__(self):
@@ -43,7 +43,7 @@ from . import AppriseAsset
 from . import AppriseConfig
 from . import PersistentStore
 
-from .utils import dir_size, bytes_to_str, parse_list, path_decode
+from .utils import bytes_to_str, parse_list, path_decode
 from .common import NOTIFY_TYPES
 from .common import NOTIFY_FORMATS
 from .common import PERSISTENT_STORE_MODES
@@ -808,15 +808,14 @@ def main(ctx, body, title, config, attach, urls, notification_type, theme, tag,
                 uids[_id]['plugins'].append(plugin)
 
         if action == PersistentStorageMode.LIST:
-            detected_uid = PersistentStore.disk_scan(
+            detected_uid = PersistentStore.disk_usage(
                 # Use our asset path as it has already been properly parsed
                 path=asset.storage_path,
 
                 # Provide filter if specified
                 namespace=filter_uids,
             )
-            for _id in detected_uid:
-                size, _ = dir_size(os.path.join(asset.storage_path, _id))
+            for _id, size in detected_uid.items():
                 if _id in uids:
                     uids[_id]['state'] = PersistentStoreState.ACTIVE
                     uids[_id]['size'] = size
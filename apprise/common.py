@@ -110,6 +110,34 @@ OVERFLOW_MODES = (
 )
 
 
+class OverflowUnit:
+    """
+    The unit a notification service measures its maximum message size in;
+    this is what the overflow handling counts when truncating or splitting
+    the text.
+    """
+
+    # Python characters (the default)
+    CHARACTER = 'character'
+
+    # UTF-8 encoded bytes
+    BYTE = 'byte'
+
+    # SMS septets; content that can be represented by the GSM 03.38
+    # alphabet costs 1 (or 2 for its extension table) per character,
+    # otherwise the message is sent as UCS-2 where 70 characters take up the
+    # same space as 160 septets
+    SMS = 'sms'
+
+
+# Define our units so we can verify if we need to
+OVERFLOW_UNITS = (
+    OverflowUnit.CHARACTER,
+    OverflowUnit.BYTE,
+    OverflowUnit.SMS,
+)
+
+
 class ConfigFormat:
     """
     A list of pre-defined config formats that can be passed via the
@@ -207,6 +235,32 @@ PERSISTENT_STORE_MODES = (
 )
 
 
+class PersistentStoreCodec:
+    """
+    Defines the formats a persistent storage cache file can be written in
+    """
+    # gzip compressed JSON; the original format and the only one readable
+    # by older versions of Apprise
+    GZIP = 'gzip'
+
+    # zlib (level 1) compressed JSON; much quicker to write
+    ZLIB = 'zlib'
+
+    # Uncompressed JSON; the quickest to read and write but the largest
+    JSON = 'json'
+
+    # A compact binary encoding (requires the msgpack library)
+    MSGPACK = 'msgpack'
+
+
+PERSISTENT_STORE_CODECS = (
+    PersistentStoreCodec.GZIP,
+    PersistentStoreCodec.ZLIB,
+    PersistentStoreCodec.JSON,
+    PersistentStoreCodec.MSGPACK,
+)
+
+
 class PersistentStoreState:
     """
     Defines the persistent states describing what has been cached
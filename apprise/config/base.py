@@ -35,6 +35,8 @@ from .. import plugins
 from .. import common
 from ..asset import AppriseAsset
 from ..url import URLBase
+from ..exception import AppriseException
+from ..logger import logger
 from ..utils import GET_SCHEMA_RE
 from ..utils import parse_list
 from ..utils import parse_bool
@@ -53,6 +55,103 @@ N_MGR = NotificationManager()
 # Grant access to our Configuration Manager Singleton
 C_MGR = ConfigurationManager()
 
+# Our YAML Loader; PyYAML built against libyaml offers a C accelerated safe
+# loader which is considerably faster then it's pure Python equivalent.
+# Setting the APPRISE_YAML_PURE environment variable to a true value (such as
+# yes or 1) forces the pure Python loader to always be used.
+YAML_C_LOADER = None if parse_bool(os.environ.get('APPRISE_YAML_PURE', ''))\
+    else getattr(yaml, 'CSafeLoader', None)
+
+
+class ConfigReadException(AppriseException):
+    """
+    Thrown when streamed configuration content could not be (completely) read
+    """
+
+
+class ConfigEntry:
+    """
+    A lightweight reference to a notification service defined within our
+    configuration.  Only the tags are kept readily available; the service
+    itself is instantiated (and then cached) the first time it is needed.
+    """
+
+    __slots__ = ('tags', '_asset', '_url', '_results', '_error', '_instance')
+
+    def __init__(self, tags, asset, error, url=None, results=None):
+        """
+        Initialize our entry.  Our service is instantiated from the parsed
+        results specified, otherwise they are (re-)acquired from the url
+        provided once they are needed.  The error is what we log if this
+        fails; if a url is specified, it is placed into the error message
+        (in a loggable format) as well.
+        """
+
+        # Our tags are all that are needed to determine if we match; we keep
+        # our own copy of them (as they were at this point of our parsing)
+        self.tags = set(tags)
+
+        # The asset our service is instantiated with
+        self._asset = asset
+
+        # The URL we were defined by
+        self._url = url
+
+        # The arguments to pass into our plugin on instantiation (if they
+        # can't be acquired from our URL); our asset and tags are applied
+        # when they're used
+        self._results = None if results is None else {
+            k: v for k, v in results.items() if k not in ('asset', 'tag')}
+
+        # The warning message to display if we fail to load
+        self._error = error
+
+        # Our instantiated plugin (once loaded)
+        self._instance = None
+
+    def instance(self):
+        """
+        Returns the instantiated notification service or None if it could not
+        be loaded.
+        """
+
+        if self._instance is None and self._error is not None:
+            try:
+                # Acquire the parsed URL information (if we need to)
+                results = self._results if self._results is not None \
+                    else plugins.url_to_dict(
+                        self._url,
+                        secure_logging=self._asset.secure_logging)
+
+                # Attempt to create an instance of our plugin using the
+                # parsed URL information
+                results['tag'] = self.tags
+                results['asset'] = self._asset
+                plugin = N_MGR[results['schema']](**results)
+
+                # Create log entry of loaded URL
+                logger.debug(
+                    'Loaded URL: %s', plugin.url(
+                        privacy=self._asset.secure_logging))
+
+            except Exception as e:
+                if self._url is not None:
+                    # CWE-312 (Secure Logging) Handling
+                    self._error = self._error.format(
+                        self._url if not self._asset.secure_logging
+                        else cwe312_url(self._url))
+
+                # the arguments are invalid or can not be used.
+                logger.warning(self._error)
+                logger.debug('Loading Exception: %s' % str(e))
+                plugin = None
+
+            # We no longer need what we were defined by
+            self._instance, self._results, self._url, self._error = \
+                plugin, None, None, None
+
+        return self._instance
+
 
 class ConfigBase(URLBase):
     """
@@ -72,7 +171,9 @@ class ConfigBase(URLBase):
 
     # Don't read any more of this amount of data into memory as there is no
     # reason we should be reading in more. This is more of a safe guard then
-    # anything else. 128KB (131072B)
+    # anything else. 128KB (131072B).  This can be over-ridden on
+    # initialization for those who generate very large configuration files.
+    # Setting this to zero (0) disables the limit entirely.
     max_buffer_size = 131072
 
     # By default all configuration is not includable using the 'include'
@@ -83,7 +184,7 @@ class ConfigBase(URLBase):
     config_path = os.getcwd()
 
     def __init__(self, cache=True, recursion=0, insecure_includes=False,
-                 **kwargs):
+                 max_buffer_size=None, **kwargs):
         """
         Initialize some general logging and common server arguments that will
         keep things consistent when working with the configurations that
@@ -122,6 +223,12 @@ class ConfigBase(URLBase):
         configuration from memory (in a string format) that contains 'include'
         entries (even file:// based ones).  In these circumstances if you want
         these 'include' entries to be honored, this value must be set to True.
+
+        max_buffer_size allows you to over-ride the maximum amount of
+        configuration data (in bytes) that will be read from the source.
+        TEXT based configuration is streamed line by line as it is parsed so
+        this can safely be set much larger for those generating very large
+        lists of URLs.  Set this to zero (0) to disable the limit.
         """
 
         super().__init__(**kwargs)
@@ -170,27 +277,44 @@ class ConfigBase(URLBase):
             self.logger.warning(err)
             raise TypeError(err)
 
+        if max_buffer_size is not None:
+            try:
+                self.max_buffer_size = int(max_buffer_size)
+                if self.max_buffer_size < 0:
+                    raise ValueError()
+
+            except (ValueError, TypeError):
+                err = 'An invalid max_buffer_size ({}) was specified.'.format(
+                    max_buffer_size)
+                self.logger.warning(err)
+                raise TypeError(err)
+
         return
 
-    def servers(self, asset=None, **kwargs):
+    def servers(self, asset=None, lazy=False, **kwargs):
         """
         Performs reads loaded configuration and returns all of the services
         that could be parsed and loaded.
 
+        If lazy is set to True, then the services are not all instantiated
+        up front; ConfigEntry objects are returned in place of those that
+        have not been loaded yet.
+
         """
 
         if not self.expired():
             # We already have cached results to return; use them
-            return self._cached_servers
+            return self._cached_servers if lazy else self.__instantiate()
 
         # Our cached response object
         self._cached_servers = list()
 
-        # read() causes the child class to do whatever it takes for the
+        # stream() causes the child class to do whatever it takes for the
         # config plugin to load the data source and return unparsed content
-        # None is returned if there was an error or simply no data
-        content = self.read(**kwargs)
-        if not isinstance(content, str):
+        # (either as a string or an iterator of lines).  None is returned if
+        # there was an error or simply no data
+        content = self.stream(**kwargs)
+        if content is None:
             # Set the time our content was cached at
             self._cached_time = time.time()
 
@@ -209,9 +333,21 @@ class ConfigBase(URLBase):
         # Initialize our asset object
         asset = asset if isinstance(asset, AppriseAsset) else self.asset
 
-        # Execute our config parse function which always returns a tuple
-        # of our servers and our configuration
-        servers, configs = fn(content=content, asset=asset)
+        try:
+            if config_format != common.ConfigFormat.TEXT \
+                    and not isinstance(content, str):
+                # Only our TEXT parser can consume our content line by line
+                content = ''.join(content)
+
+            # Execute our config parse function which always returns a tuple
+            # of our servers and our configuration
+            servers, configs = fn(content=content, asset=asset, lazy=True)
+
+        except ConfigReadException:
+            # Our stream was interrupted; the error was already logged
+            self._cached_time = time.time()
+            return self._cached_servers
+
         self._cached_servers.extend(servers)
 
         # Configuration files were detected; recursively populate them
@@ -299,7 +435,7 @@ class ConfigBase(URLBase):
                 # if we reach here, we can now add this servers found
                 # in this configuration file to our list
                 self._cached_servers.extend(
-                    cfg_plugin.servers(asset=asset))
+                    cfg_plugin.servers(asset=asset, lazy=True))
 
                 # We no longer need our configuration object
                 del cfg_plugin
@@ -326,6 +462,20 @@ class ConfigBase(URLBase):
         # Set the time our content was cached at
         self._cached_time = time.time()
 
+        return self._cached_servers if lazy else self.__instantiate()
+
+    def __instantiate(self):
+        """
+        Instantiates all of our loaded entries (if not already) and returns
+        them.  Entries that fail to load are dropped.
+
+        """
+        if any(isinstance(s, ConfigEntry) for s in self._cached_servers):
+            self._cached_servers[:] = [
+                s for s in (
+                    s.instance() if isinstance(s, ConfigEntry) else s
+                    for s in self._cached_servers) if s is not None]
+
         return self._cached_servers
 
     def read(self):
@@ -335,6 +485,19 @@ class ConfigBase(URLBase):
         """
         return None
 
+    def stream(self, **kwargs):
+        """
+        Returns the configuration content to be parsed.  Child classes that
+        can read their content incrementally should over-ride this and return
+        an iterator of lines (with their line endings intact) instead.  Such an
+        iterator may throw a ConfigReadException if it fails part way through.
+
+        None is returned if there was an error or simply no data.
+
+        """
+        content = self.read(**kwargs)
+        return content if isinstance(content, str) else None
+
     def expired(self):
         """
         Simply returns True if the configuration should be considered
@@ -559,7 +722,8 @@ class ConfigBase(URLBase):
         return config_format
 
     @staticmethod
-    def config_parse(content, asset=None, config_format=None, **kwargs):
+    def config_parse(content, asset=None, config_format=None, lazy=False,
+                     **kwargs):
         """
         Takes the specified config content and loads it based on the specified
         config_format. If a format isn't specified, then it is auto detected.
@@ -586,14 +750,18 @@ class ConfigBase(URLBase):
         fn = getattr(ConfigBase, 'config_parse_{}'.format(config_format))
 
         # Execute our config parse function which always returns a list
-        return fn(content=content, asset=asset)
+        return fn(content=content, asset=asset, lazy=lazy)
 
     @staticmethod
-    def config_parse_text(content, asset=None):
+    def config_parse_text(content, asset=None, lazy=False):
         """
         Parse the specified content as though it were a simple text file only
         containing a list of URLs.
 
+        The content can either be a string or an iterable of lines (such as an
+        open file object). The latter is consumed one line at a time so that
+        very large configuration never has to be held in memory at once.
+
         Return a tuple that looks like (servers, configs) where:
           - servers contains a list of loaded notification plugins
           - configs contains a list of additional configuration files
@@ -601,6 +769,9 @@ class ConfigBase(URLBase):
 
         You may also optionally associate an asset with the notification.
 
+        If lazy is set to True, then the servers returned are ConfigEntry
+        objects that only instantiate their plugin once it is needed.
+
         The file syntax is:
 
             #
@@ -647,7 +818,8 @@ class ConfigBase(URLBase):
 
         try:
             # split our content up to read line by line
-            content = re.split(r'\r*\n', content)
+            content = re.split(r'\r*\n', content) \
+                if isinstance(content, str) else iter(content)
 
         except TypeError:
             # content was not expected string type
@@ -656,6 +828,15 @@ class ConfigBase(URLBase):
             return (list(), list())
 
         for line, entry in enumerate(content, start=1):
+            if not isinstance(entry, str):
+                # content was not expected string type
+                ConfigBase.logger.error(
+                    'Invalid Apprise TEXT based configuration specified.')
+                return (list(), list())
+
+            # Lines read from a stream still have their line endings
+            entry = entry.rstrip('\r\n')
+
             result = valid_line_re.match(entry)
             if not result:
                 # Invalid syntax
@@ -690,10 +871,6 @@ class ConfigBase(URLBase):
                 configs.append(config.strip())
                 continue
 
-            # CWE-312 (Secure Logging) Handling
-            loggable_url = url if not asset.secure_logging \
-                else cwe312_url(url)
-
             if assign:
                 groups = set(parse_list(result.group('tags'), cast=str))
                 if not groups:
@@ -725,6 +902,10 @@ class ConfigBase(URLBase):
             results = plugins.url_to_dict(
                 url, secure_logging=asset.secure_logging)
             if results is None:
+                # CWE-312 (Secure Logging) Handling
+                loggable_url = url if not asset.secure_logging \
+                    else cwe312_url(url)
+
                 # Failed to parse the server URL
                 ConfigBase.logger.warning(
                     'Unparseable URL {} on line {}.'.format(
@@ -742,7 +923,7 @@ class ConfigBase(URLBase):
             preloaded.append({
                 'results': results,
                 'line': line,
-                'loggable_url': loggable_url,
+                'url': url,
             })
 
         #
@@ -768,23 +949,18 @@ class ConfigBase(URLBase):
                          if tag in tags), False):
                     results['tag'].add(group)
 
-            try:
-                # Attempt to create an instance of our plugin using the
-                # parsed URL information
-                plugin = N_MGR[results['schema']](**results)
-
-                # Create log entry of loaded URL
-                ConfigBase.logger.debug(
-                    'Loaded URL: %s', plugin.url(
-                        privacy=results['asset'].secure_logging))
-
-            except Exception as e:
-                # the arguments are invalid or can not be used.
-                ConfigBase.logger.warning(
-                    'Could not load URL {} on line {}.'.format(
-                        entry['loggable_url'], entry['line']))
-                ConfigBase.logger.debug('Loading Exception: %s' % str(e))
-                continue
+            # Prepare our entry; our plugin is created on demand from the
+            # URL we were defined by (so we don't hold onto our results)
+            plugin = ConfigEntry(
+                results['tag'], asset,
+                'Could not load URL {{}} on line {}.'.format(entry['line']),
+                url=entry['url'], results=None if lazy else results)
+
+            if not lazy:
+                # Attempt to create an instance of our plugin now
+                plugin = plugin.instance()
+                if plugin is None:
+                    continue
 
             # if we reach here, we successfully loaded our data
             servers.append(plugin)
@@ -793,7 +969,7 @@ class ConfigBase(URLBase):
         return (servers, configs)
 
     @staticmethod
-    def config_parse_yaml(content, asset=None):
+    def config_parse_yaml(content, asset=None, lazy=False):
         """
         Parse the specified content as though it were a yaml file
         specifically formatted for Apprise.
@@ -805,6 +981,9 @@ class ConfigBase(URLBase):
 
         You may optionally associate an asset with the notification.
 
+        If lazy is set to True, then the servers returned are ConfigEntry
+        objects that only instantiate their plugin once it is needed.
+
         """
 
         # A list of loaded Notification Services
@@ -820,11 +999,19 @@ class ConfigBase(URLBase):
         # Track our entries to preload
         preloaded = []
 
+        # Prepare our Asset Object
+        asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
+
+        # Use the libyaml (C) loader if it's available to us and permitted
+        loader = YAML_C_LOADER \
+            if YAML_C_LOADER and asset.yaml_c_loader else yaml.SafeLoader
+
         try:
             # Load our data (safely)
-            result = yaml.load(content, Loader=yaml.SafeLoader)
+            result = yaml.load(content, Loader=loader)
 
         except (AttributeError,
+                TypeError,
                 yaml.parser.ParserError,
                 yaml.error.MarkedYAMLError) as e:
             # Invalid content
@@ -851,7 +1038,6 @@ class ConfigBase(URLBase):
         #
         # global asset object
         #
-        asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
         tokens = result.get('asset', None)
         if tokens and isinstance(tokens, dict):
             for k, v in tokens.items():
@@ -1217,25 +1403,20 @@ class ConfigBase(URLBase):
                          if tag in tags), False):
                     results['tag'].add(group)
 
-            # Now we generate our plugin
-            try:
-                # Attempt to create an instance of our plugin using the
-                # parsed URL information
-                plugin = N_MGR[results['schema']](**results)
-
-                # Create log entry of loaded URL
-                ConfigBase.logger.debug(
-                    'Loaded URL: %s', plugin.url(
-                        privacy=results['asset'].secure_logging))
-
-            except Exception as e:
-                # the arguments are invalid or can not be used.
-                ConfigBase.logger.warning(
-                    'Could not load Apprise YAML configuration '
-                    'entry #{}, item #{}'
-                    .format(entry['entry'], entry['item']))
-                ConfigBase.logger.debug('Loading Exception: %s' % str(e))
-                continue
+            # Prepare our entry; our plugin is created on demand.  Our
+            # results can't be re-acquired from our URL alone (as our YAML
+            # may have altered them) so they're retained
+            plugin = ConfigEntry(
+                results['tag'], asset,
+                'Could not load Apprise YAML configuration '
+                'entry #{}, item #{}'.format(entry['entry'], entry['item']),
+                results=results)
+
+            if not lazy:
+                # Attempt to create an instance of our plugin now
+                plugin = plugin.instance()
+                if plugin is None:
+                    continue
 
             # if we reach here, we successfully loaded our data
             servers.append(plugin)
@@ -1254,7 +1435,7 @@ class ConfigBase(URLBase):
             self.servers()
 
         # Pop the element off of the stack
-        return self._cached_servers.pop(index)
+        return self.__instantiate().pop(index)
 
     @staticmethod
     def _special_token_handler(schema, tokens):
@@ -1392,7 +1573,7 @@ class ConfigBase(URLBase):
             # Generate ourselves a list of content we can pull from
             self.servers()
 
-        return self._cached_servers[index]
+        return self.__instantiate()[index]
 
     def __iter__(self):
         """
@@ -1402,7 +1583,7 @@ class ConfigBase(URLBase):
             # Generate ourselves a list of content we can pull from
             self.servers()
 
-        return iter(self._cached_servers)
+        return iter(self.__instantiate())
 
     def __len__(self):
         """
@@ -1412,7 +1593,7 @@ class ConfigBase(URLBase):
             # Generate ourselves a list of content we can pull from
             self.servers()
 
-        return len(self._cached_servers)
+        return len(self.__instantiate())
 
     def __bool__(self):
         """
@@ -1423,4 +1604,4 @@ class ConfigBase(URLBase):
             # Generate ourselves a list of content we can pull from
             self.servers()
 
-        return True if self._cached_servers else False
+        return True if self.__instantiate() else False
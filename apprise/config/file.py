@@ -29,6 +29,7 @@
 import re
 import os
 from .base import ConfigBase
+from .base import ConfigReadException
 from ..utils import path_decode
 from ..common import ConfigFormat
 from ..common import ContentIncludeMode
@@ -102,7 +103,23 @@ class ConfigFile(ConfigBase):
         Perform retrieval of the configuration based on the specified request
         """
 
-        response = None
+        content = self.stream(**kwargs)
+        if content is None:
+            return None
+
+        try:
+            # Return our response object
+            return ''.join(content)
+
+        except ConfigReadException:
+            # Return None (signifying a failure)
+            return None
+
+    def stream(self, **kwargs):
+        """
+        Perform retrieval of the configuration based on the specified request
+        returning an iterator that reads our file one line at a time
+        """
 
         try:
             if self.max_buffer_size > 0 and \
@@ -125,24 +142,16 @@ class ConfigFile(ConfigBase):
         self.throttle()
 
         try:
-            with open(self.path, "rt", encoding=self.encoding) as f:
-                # Store our content for parsing
-                response = f.read()
-
-        except (ValueError, UnicodeDecodeError):
-            # A result of our strict encoding check; if we receive this
-            # then the file we're opening is not something we can
-            # understand the encoding of..
+            fp = open(self.path, "rt", encoding=self.encoding)
 
+        except (ValueError, LookupError):
+            # An encoding we can't use was specified
             self.logger.error(
                 'File not using expected encoding ({}) : {}'.format(
                     self.encoding, self.path))
             return None
 
         except (IOError, OSError):
-            # IOError is present for backwards compatibility with Python
-            # versions older then 3.3.  >= 3.3 throw OSError now.
-
             # Could not open and/or read the file; this is not a problem since
             # we scan a lot of default paths.
             self.logger.error(
@@ -157,8 +166,31 @@ class ConfigFile(ConfigBase):
             # YAML Filename Detected
             self.default_config_format = ConfigFormat.YAML
 
-        # Return our response object
-        return response
+        return self.__readlines(fp)
+
+    def __readlines(self, fp):
+        """
+        A generator that yields each line of the file pointer specified and
+        closes it once we're done.
+        """
+
+        try:
+            with fp:
+                yield from fp
+
+        except (ValueError, UnicodeDecodeError):
+            # A result of our strict encoding check; if we receive this
+            # then the file we're opening is not something we can
+            # understand the encoding of..
+            self.logger.error(
+                'File not using expected encoding ({}) : {}'.format(
+                    self.encoding, self.path))
+            raise ConfigReadException('File encoding error')
+
+        except (IOError, OSError):
+            self.logger.error(
+                'File can not be read: {}'.format(self.path))
+            raise ConfigReadException('File read error')
 
     @staticmethod
     def parse_url(url):
@@ -27,8 +27,10 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import re
+import codecs
 import requests
 from .base import ConfigBase
+from .base import ConfigReadException
 from ..common import ConfigFormat
 from ..common import ContentIncludeMode
 from ..url import PrivacyMode
@@ -67,6 +69,9 @@ class ConfigHTTP(ConfigBase):
     # from queries to services that may be untrusted.
     max_error_buffer_size = 2048
 
+    # The number of bytes in memory to read from the remote source at a time
+    chunk_size = 8192
+
     # Configuration file inclusion can always include this type
     allow_cross_includes = ContentIncludeMode.ALWAYS
 
@@ -151,6 +156,24 @@ class ConfigHTTP(ConfigBase):
         Perform retrieval of the configuration based on the specified request
         """
 
+        content = self.stream(**kwargs)
+        if content is None:
+            return None
+
+        try:
+            # Return our response object
+            return ''.join(content)
+
+        except ConfigReadException:
+            # Return None (signifying a failure)
+            return None
+
+    def stream(self, **kwargs):
+        """
+        Perform retrieval of the configuration based on the specified request
+        returning an iterator that yields each line as it is downloaded
+        """
+
         # prepare XML Object
         headers = {
             'User-Agent': self.app_id,
@@ -173,9 +196,6 @@ class ConfigHTTP(ConfigBase):
             url, self.verify_certificate,
         ))
 
-        # Prepare our response object
-        response = None
-
         # Where our request object will temporarily live.
         r = None
 
@@ -183,76 +203,135 @@ class ConfigHTTP(ConfigBase):
         self.throttle()
 
         try:
-            # Make our request
-            with requests.post(
-                    url,
-                    headers=headers,
-                    auth=auth,
-                    verify=self.verify_certificate,
-                    timeout=self.request_timeout,
-                    stream=True) as r:
-
-                # Handle Errors
-                r.raise_for_status()
-
-                # Get our file-size (if known)
-                try:
-                    file_size = int(r.headers.get('Content-Length', '0'))
-                except (TypeError, ValueError):
-                    # Handle edge case where Content-Length is a bad value
-                    file_size = 0
-
-                # Store our response
-                if self.max_buffer_size > 0 \
-                        and file_size > self.max_buffer_size:
+            # Make our request; our response is closed by __readlines() once
+            # it has been consumed
+            r = requests.post(
+                url,
+                headers=headers,
+                auth=auth,
+                verify=self.verify_certificate,
+                timeout=self.request_timeout,
+                stream=True)
+
+            # Handle Errors
+            r.raise_for_status()
+
+            # Get our file-size (if known)
+            try:
+                file_size = int(r.headers.get('Content-Length', '0'))
+            except (TypeError, ValueError):
+                # Handle edge case where Content-Length is a bad value
+                file_size = 0
+
+            if self.max_buffer_size > 0 \
+                    and file_size > self.max_buffer_size:
+
+                # Provide warning of data truncation
+                self.logger.error(
+                    'HTTP config response exceeds maximum buffer length '
+                    '({}KB);'.format(int(self.max_buffer_size / 1024)))
+
+                # Return None - buffer execeeded
+                r.close()
+                return None
+
+            # Detect config format based on mime if the format isn't
+            # already enforced
+            content_type = r.headers.get(
+                'Content-Type', 'application/octet-stream')
+            if self.config_format is None and content_type:
+                if MIME_IS_YAML.match(content_type) is not None:
+
+                    # YAML data detected based on header content
+                    self.default_config_format = ConfigFormat.YAML
+
+                elif MIME_IS_TEXT.match(content_type) is not None:
+
+                    # TEXT data detected based on header content
+                    self.default_config_format = ConfigFormat.TEXT
 
-                    # Provide warning of data truncation
-                    self.logger.error(
-                        'HTTP config response exceeds maximum buffer length '
-                        '({}KB);'.format(int(self.max_buffer_size / 1024)))
+        except requests.RequestException as e:
+            self.logger.error(
+                'A Connection error occurred retrieving HTTP '
+                'configuration from %s.' % self.host)
+            self.logger.debug('Socket Exception: %s' % str(e))
 
-                    # Return None - buffer execeeded
-                    return None
+            if r is not None:
+                r.close()
 
-                # Store our result (but no more than our buffer length)
-                response = r.text[:self.max_buffer_size + 1]
+            # Return None (signifying a failure)
+            return None
+
+        return self.__readlines(r)
+
+    def __readlines(self, r):
+        """
+        A generator that yields the response content one line at a time (with
+        it's line endings intact) as it arrives; the response is closed once
+        we're done.
+        """
+
+        # Track the number of characters we've read so far
+        buffered = 0
 
-                # Verify that our content did not exceed the buffer size:
-                if len(response) > self.max_buffer_size:
+        # Tracks the trailing (incomplete) line of our last chunk
+        remainder = ''
+
+        try:
+            for content in self.__decode(r):
+                buffered += len(content)
+
+                # Verify that our content did not exceed the buffer size
+                if self.max_buffer_size > 0 \
+                        and buffered > self.max_buffer_size:
                     # Provide warning of data truncation
                     self.logger.error(
                         'HTTP config response exceeds maximum buffer length '
                         '({}KB);'.format(int(self.max_buffer_size / 1024)))
+                    raise ConfigReadException('Buffer length exceeded')
 
-                    # Return None - buffer execeeded
-                    return None
-
-                # Detect config format based on mime if the format isn't
-                # already enforced
-                content_type = r.headers.get(
-                    'Content-Type', 'application/octet-stream')
-                if self.config_format is None and content_type:
-                    if MIME_IS_YAML.match(content_type) is not None:
-
-                        # YAML data detected based on header content
-                        self.default_config_format = ConfigFormat.YAML
+                lines = (remainder + content).split('\n')
+                remainder = lines.pop()
+                for line in lines:
+                    yield line + '\n'
 
-                    elif MIME_IS_TEXT.match(content_type) is not None:
-
-                        # TEXT data detected based on header content
-                        self.default_config_format = ConfigFormat.TEXT
+            if remainder:
+                # Yield whatever content is left over
+                yield remainder
 
         except requests.RequestException as e:
             self.logger.error(
                 'A Connection error occurred retrieving HTTP '
                 'configuration from %s.' % self.host)
             self.logger.debug('Socket Exception: %s' % str(e))
+            raise ConfigReadException('Connection error')
 
-            # Return None (signifying a failure)
-            return None
+        finally:
+            r.close()
+
+    def __decode(self, r):
+        """
+        A generator that yields the response content decoded as it arrives.
+        """
+
+        if not r.encoding:
+            # The server didn't tell us how it's content is encoded; requests
+            # detects this from the content itself (once it's downloaded)
+            yield r.text
+            return
+
+        try:
+            decoder = codecs.getincrementaldecoder(r.encoding)(
+                errors='replace')
+
+        except LookupError:
+            # Unsupported encoding; fall back to utf-8
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        for chunk in r.iter_content(chunk_size=self.chunk_size):
+            yield decoder.decode(chunk)
 
-        # Return our response object
-        return response
+        yield decoder.decode(b'', final=True)
 
     @staticmethod
     def parse_url(url):
@@ -27,21 +27,174 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import re
-from markdown import markdown
+import hashlib
+import threading
+from collections import OrderedDict
+from markdown import Markdown
 from .common import NotifyFormat
+from .emojis import apply_emojis
 from .url import URLBase
 
+from html import unescape
 from html.parser import HTMLParser
 
 
-def convert_between(from_format, to_format, content):
+class ConversionCache:
+    """
+    A bounded (least recently used) cache of converted content shared
+    across notify() calls; the same templated content sent to different
+    services (or tags) in rapid succession is only converted once.
+    """
+
+    # The maximum number of conversions retained
+    max_size = 256
+
+    # Content larger than this (in characters) is not cached
+    max_content_length = 65536
+
+    def __init__(self, max_size=None):
+        """
+        Initialize our cache
+        """
+
+        if max_size is not None:
+            try:
+                self.max_size = int(max_size)
+                if self.max_size < 0:
+                    raise ValueError()
+
+            except (TypeError, ValueError):
+                raise AttributeError(
+                    f'An invalid cache size ({max_size}) was specified.')
+
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(content, from_format, to_format, escapes=False, emojis=False):
+        """
+        Returns the key our content is cached against or None if the content
+        can not be cached.
+        """
+
+        if not isinstance(content, str) \
+                or len(content) > ConversionCache.max_content_length:
+            return None
+
+        return (
+            hashlib.sha256(content.encode('utf-8')).digest(),
+            from_format, to_format, bool(escapes), bool(emojis))
+
+    def get(self, key):
+        """
+        Returns the cached content or None if there was no match
+        """
+
+        with self.__lock:
+            try:
+                content = self.__entries[key]
+
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            return content
+
+    def set(self, key, content):
+        """
+        Caches our converted content
+        """
+
+        if not self.max_size:
+            # Caching is disabled
+            return
+
+        with self.__lock:
+            self.__entries[key] = content
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Empties our cache and resets our metrics
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        """
+        Returns the ratio (0.0 to 1.0) of lookups served from our cache
+        """
+
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+    def stats(self):
+        """
+        Returns a dictionary of our cache metrics
+        """
+
+        with self.__lock:
+            return {
+                'size': len(self.__entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hit_rate,
+            }
+
+    def __len__(self):
+        """
+        Returns the number of conversions cached
+        """
+        return len(self.__entries)
+
+
+# Our shared conversion cache
+CONVERSION_CACHE = ConversionCache()
+
+
+def convert_between(from_format, to_format, content, escapes=False,
+                    emojis=False, cache=True):
     """
     Converts between different suported formats. If no conversion exists,
     or the selected one fails, the original text will be returned.
 
+    If escapes is set, then escape sequences (such as \\n) found in the
+    converted content are interpreted.  If emojis is set, then :emoji:
+    definitions are converted afterwards.
+
+    Results are re-used from (and stored in) the shared conversion cache
+    unless cache is set to False.
+
     This function returns the content translated (if required)
     """
 
+    key = ConversionCache.key(
+        content, from_format, to_format, escapes=escapes, emojis=emojis) \
+        if cache else None
+
+    if key is not None:
+        result = CONVERSION_CACHE.get(key)
+        if result is not None:
+            return result
+
     converters = {
         (NotifyFormat.MARKDOWN, NotifyFormat.HTML): markdown_to_html,
         (NotifyFormat.TEXT, NotifyFormat.HTML): text_to_html,
@@ -51,15 +204,52 @@ def convert_between(from_format, to_format, content):
     }
 
     convert = converters.get((from_format, to_format))
-    return convert(content) if convert else content
+    result = convert(content) if convert else content
+
+    if escapes:
+        # Added overhead required due to Python 3 Encoding Bug
+        # identified here: https://bugs.python.org/issue21331
+        # An AttributeError is thrown if our content is not a string
+        result = result\
+            .encode('ascii', 'backslashreplace')\
+            .decode('unicode-escape')
+
+    if emojis:
+        result = apply_emojis(result)
+
+    if key is not None:
+        CONVERSION_CACHE.set(key, result)
+
+    return result
+
+
+# The extensions our Markdown renderer is prepared with
+MARKDOWN_EXTENSIONS = (
+    'markdown.extensions.nl2br',
+    'markdown.extensions.tables',
+)
+
+# Markdown renderers are not thread-safe; each thread prepares (and then
+# re-uses) its own so that the extensions are only loaded once
+_MARKDOWN = threading.local()
 
 
 def markdown_to_html(content):
     """
     Converts specified content from markdown to HTML.
     """
-    return markdown(content, extensions=[
-        'markdown.extensions.nl2br', 'markdown.extensions.tables'])
+
+    renderer = getattr(_MARKDOWN, 'renderer', None)
+    if renderer is None:
+        renderer = _MARKDOWN.renderer = Markdown(
+            extensions=list(MARKDOWN_EXTENSIONS))
+
+    try:
+        return renderer.convert(content)
+
+    finally:
+        # Clear any state left behind by our conversion
+        renderer.reset()
 
 
 def text_to_html(content):
@@ -77,7 +267,11 @@ def html_to_text(content):
     """
 
     parser = HTMLConverter()
-    parser.feed(content)
+    if not parser.convert(content):
+        # Our content requires the complete (but slower) HTML parser
+        parser = HTMLConverter()
+        parser.feed(content)
+
     parser.close()
     return parser.converted
 
@@ -86,20 +280,36 @@ class HTMLConverter(HTMLParser, object):
     """An HTML to plain text converter tuned for email messages."""
 
     # The following tags must start on a new line
-    BLOCK_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                  'div', 'td', 'th', 'code', 'pre', 'label', 'li',)
+    BLOCK_TAGS = frozenset((
+        'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+        'div', 'td', 'th', 'code', 'pre', 'label', 'li',))
 
     # the folowing tags ignore any internal text
-    IGNORE_TAGS = (
+    IGNORE_TAGS = frozenset((
         'form', 'input', 'textarea', 'select', 'ul', 'ol', 'style', 'link',
-        'meta', 'title', 'html', 'head', 'script')
-
-    # Condense Whitespace
-    WS_TRIM = re.compile(r'[\s]+', re.DOTALL | re.MULTILINE)
-
-    # Sentinel value for block tag boundaries, which may be consolidated into a
-    # single line break.
-    BLOCK_END = {}
+        'meta', 'title', 'html', 'head', 'script'))
+
+    # Well formed start and end tags our fast path (see convert()) handles;
+    # the tag name is matched atomically (just as HTMLParser reads it) and
+    # unquoted attribute values may not contain a slash so that a trailing
+    # '/>' always identifies a self closing tag.
+    TAG_RE = re.compile(
+        r'<(?:(?P<end>/)\s*(?P<etag>[a-zA-Z][-.a-zA-Z0-9:_]*)\s*'
+        r'|(?=(?P<stag>[a-zA-Z][^\t\n\r\f />\x00<]*))(?P=stag)'
+        r'(?:\s+[^\s"\'<>/=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\''
+        r'|(?![\'"])[^\s<>/]+))?)*\s*(?P<close>/)?)>')
+
+    # A document type declaration
+    DOCTYPE_RE = re.compile(r'<!doctype([^>]*)>', re.I)
+
+    # Elements whose content is not parsed for tags (and how they end)
+    CDATA_TAGS = {
+        tag: re.compile(r'</\s*%s\s*>' % tag, re.I)
+        for tag in ('script', 'style')}
+
+    # Trailing text HTMLParser withholds (a possibly incomplete character
+    # reference); see convert()
+    TRAILING_REF_RE = re.compile(r'&[^\s;]*$')
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -107,49 +317,122 @@ class HTMLConverter(HTMLParser, object):
         # Shoudl we store the text content or not?
         self._do_store = True
 
-        # Initialize internal result list
-        self._result = []
+        # The lines we've completed
+        self._lines = []
+
+        # The content accumulated since our last block boundary; None if
+        # nothing has been accumulated since
+        self._accum = None
 
         # Initialize public result field (not populated until close() is
         # called)
         self.converted = ""
 
-    def close(self):
-        string = ''.join(self._finalize(self._result))
-        self.converted = string.strip()
-
-    def _finalize(self, result):
+    def convert(self, content):
         """
-        Combines and strips consecutive strings, then converts consecutive
-        block ends into singleton newlines.
+        A single pass conversion of the content specified driving the same
+        handlers HTMLParser would; this is considerably faster than feed().
 
-        [ {be} " Hello " {be} {be} " World!" ] -> "\nHello\nWorld!"
+        Content making use of markup this fast path does not handle (such
+        as comments, declarations, stray '<' characters or malformed tags)
+        stops the conversion and False is returned; the converter should be
+        discarded and a new one fed() the content instead.
         """
 
-        # None means the last visited item was a block end.
-        accum = None
+        if not isinstance(content, str):
+            # Let HTMLParser handle (and report on) what we were given
+            return False
+
+        handle_data = self.handle_data
+        handle_starttag = self.handle_starttag
+        handle_endtag = self.handle_endtag
+        match_tag = self.TAG_RE.match
+        find = content.find
+
+        index = 0
+        length = len(content)
+        while index < length:
+            start = find('<', index)
+            if start < 0:
+                if self.TRAILING_REF_RE.search(
+                        content, max(index, length - 34)):
+                    # HTMLParser withholds this content
+                    return False
+
+                start = length
+
+            if index < start:
+                data = content[index:start]
+                handle_data(unescape(data) if '&' in data else data)
+
+                if start == length:
+                    break
+
+            match = match_tag(content, start)
+            if not match:
+                match = self.DOCTYPE_RE.match(content, start)
+                if not match:
+                    return False
+
+                self.handle_decl('DOCTYPE' + match.group(1))
+                index = match.end()
+                continue
+
+            end, etag, stag, close = \
+                match.group('end', 'etag', 'stag', 'close')
+            index = match.end()
+
+            if end:
+                handle_endtag(etag.lower())
+                continue
+
+            tag = stag.lower()
+            if close:
+                self.handle_startendtag(tag, [])
+                continue
+
+            handle_starttag(tag, [])
+            if tag in self.CDATA_TAGS:
+                # Seek the end of our script/style content
+                match = self.CDATA_TAGS[tag].search(content, index)
+                if not match:
+                    return False
+
+                if index < match.start():
+                    handle_data(content[index:match.start()])
+
+                handle_endtag(tag)
+                index = match.end()
+
+        return True
 
-        for item in result:
-            if item == self.BLOCK_END:
-                # Multiple consecutive block ends; do nothing.
-                if accum is None:
-                    continue
+    def close(self):
+        if self._accum is not None:
+            self._lines.append(''.join(self._accum).strip())
+            self._accum = None
 
-                # First block end; yield the current string, plus a newline.
-                yield accum.strip() + '\n'
-                accum = None
+        self.converted = ''.join(self._lines).strip()
 
-            # Multiple consecutive strings; combine them.
-            elif accum is not None:
-                accum += item
+    def _append(self, content):
+        """
+        Accumulates our content
+        """
 
-            # First consecutive string; store it.
-            else:
-                accum = item
+        if self._accum is None:
+            self._accum = [content]
 
-        # Yield the last string if we have not already done so.
-        if accum is not None:
-            yield accum.strip()
+        else:
+            self._accum.append(content)
+
+    def _block_end(self):
+        """
+        Marks a block boundary; consecutive boundaries are consolidated into
+        a single line break.
+        """
+
+        if self._accum is not None:
+            self._lines.append(''.join(self._accum).strip() + '\n')
+            self._accum = None
 
     def handle_data(self, data, *args, **kwargs):
         """
@@ -159,9 +442,16 @@ class HTMLConverter(HTMLParser, object):
         # initialize our previous flag
         if self._do_store:
 
-            # Tidy our whitespace
-            content = self.WS_TRIM.sub(' ', data)
-            self._result.append(content)
+            # Tidy our whitespace; condensing each run of it into a single
+            # space
+            words = data.split()
+            if not words:
+                self._append(' ' if data else '')
+                return
+
+            self._append(
+                (' ' if data[0].isspace() else '') + ' '.join(words)
+                + (' ' if data[-1].isspace() else ''))
 
     def handle_starttag(self, tag, attrs):
         """
@@ -171,24 +461,22 @@ class HTMLConverter(HTMLParser, object):
         self._do_store = tag not in self.IGNORE_TAGS
 
         if tag in self.BLOCK_TAGS:
-            self._result.append(self.BLOCK_END)
+            self._block_end()
 
         if tag == 'li':
-            self._result.append('- ')
+            self._append('- ')
 
         elif tag == 'br':
-            self._result.append('\n')
+            self._append('\n')
 
         elif tag == 'hr':
-            if self._result and isinstance(self._result[-1], str):
-                self._result[-1] = self._result[-1].rstrip(' ')
-            else:
-                pass
+            if self._accum:
+                self._accum[-1] = self._accum[-1].rstrip(' ')
 
-            self._result.append('\n---\n')
+            self._append('\n---\n')
 
         elif tag == 'blockquote':
-            self._result.append(' >')
+            self._append(' >')
 
     def handle_endtag(self, tag):
         """
@@ -197,4 +485,4 @@ class HTMLConverter(HTMLParser, object):
         self._do_store = True
 
         if tag in self.BLOCK_TAGS:
-            self._result.append(self.BLOCK_END)
+            self._block_end()
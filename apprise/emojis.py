@@ -26,6 +26,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import os
 import re
 import time
 from .logger import logger
@@ -2244,8 +2245,89 @@ EMOJI_MAP = {
     DELIM + r'wales' + DELIM: '🏴󠁧󠁢󠁷󠁬󠁳󠁿',
 }
 
-# Define our singlton
-EMOJI_COMPILED_MAP = None
+# Our lookup table of every (lowercase) shortcode found within the
+# delimiters to the emoji it represents; prepared on first use
+EMOJI_LOOKUP = None
+
+# The length of our longest shortcode
+EMOJI_MAX_LEN = 0
+
+# Identifies shortcodes in our EMOJI_MAP that are not simple literals
+EMOJI_SPECIAL_RE = re.compile(r'[\\()|?]')
+
+
+def _expand(pattern):
+    """
+    Returns every string the simple regular expression specified (as used in
+    our EMOJI_MAP) can match; only literals, escaped characters, groups of
+    alternatives and the optional (?) modifier are supported.
+    """
+
+    def alternatives(index):
+        # Parses our alternatives up until the end of our current group
+        results = []
+        current = ['']
+        while index < len(pattern):
+            char = pattern[index]
+            if char == '|':
+                results.extend(current)
+                current = ['']
+                index += 1
+                continue
+
+            if char == ')':
+                break
+
+            if char == '(':
+                choices, index = alternatives(index + 1)
+                # Skip over our closing bracket
+                index += 1
+
+            elif char == '\\':
+                choices = [pattern[index + 1]]
+                index += 2
+
+            else:
+                choices = [char]
+                index += 1
+
+            if index < len(pattern) and pattern[index] == '?':
+                choices = [''] + choices
+                index += 1
+
+            current = [c + choice for c in current for choice in choices]
+
+        results.extend(current)
+        return results, index
+
+    return alternatives(0)[0]
+
+
+def warmup():
+    """
+    Prepares our emoji lookup table; this otherwise takes place the first
+    time apply_emojis() is called.
+    """
+
+    global EMOJI_LOOKUP
+    global EMOJI_MAX_LEN
+
+    if EMOJI_LOOKUP is not None:
+        return
+
+    t_start = time.time()
+    lookup = {}
+    for pattern, emoji in EMOJI_MAP.items():
+        pattern = pattern[len(DELIM):-len(DELIM)]
+        for shortcode in (_expand(pattern) if EMOJI_SPECIAL_RE.search(
+                pattern) else (pattern, )):
+            # The first definition of a shortcode wins
+            lookup.setdefault(shortcode.lower(), emoji)
+
+    EMOJI_MAX_LEN = max(len(shortcode) for shortcode in lookup)
+    EMOJI_LOOKUP = lookup
+    logger.trace(
+        'Emoji engine loaded in {:.4f}s'.format((time.time() - t_start)))
 
 
 def apply_emojis(content):
@@ -2254,20 +2336,44 @@ def apply_emojis(content):
     utf-8 encoded mapping
     """
 
-    global EMOJI_COMPILED_MAP
+    if not isinstance(content, str):
+        # No change; but force string return
+        return ''
+
+    if DELIM not in content:
+        # Nothing to do
+        return content
 
-    if EMOJI_COMPILED_MAP is None:
-        t_start = time.time()
-        # Perform our compilation
-        EMOJI_COMPILED_MAP = re.compile(
-            r'(' + '|'.join(EMOJI_MAP.keys()) + r')',
-            re.IGNORECASE)
-        logger.trace(
-            'Emoji engine loaded in {:.4f}s'.format((time.time() - t_start)))
+    if EMOJI_LOOKUP is None:
+        warmup()
 
-    try:
-        return EMOJI_COMPILED_MAP.sub(lambda x: EMOJI_MAP[x.group()], content)
+    # Every shortcode is found between 2 delimiters
+    parts = content.split(DELIM)
+    result = [parts[0]]
 
-    except TypeError:
-        # No change; but force string return
-        return ''
+    index = 1
+    last = len(parts) - 1
+    while index <= last:
+        part = parts[index]
+        emoji = EMOJI_LOOKUP.get(part.lower()) \
+            if index < last and len(part) <= EMOJI_MAX_LEN else None
+
+        if emoji is None:
+            # Restore our delimiter
+            result.append(DELIM)
+            result.append(part)
+            index += 1
+            continue
+
+        # Swap our shortcode (and both of it's delimiters) with our emoji
+        result.append(emoji)
+        result.append(parts[index + 1])
+        index += 2
+
+    return ''.join(result)
+
+
+if os.environ.get('APPRISE_EMOJI_WARMUP', '').strip().lower() in \
+        ('1', 'yes', 'true', 'on'):
+    # Prepare our lookup table at import time
+    warmup()
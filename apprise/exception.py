@@ -51,3 +51,12 @@ class AppriseFileNotFound(AppriseDiskIOError, FileNotFoundError):
     """
     def __init__(self, message):
         super().__init__(message, error_code=errno.ENOENT)
+
+
+class AppriseUnsupportedFormat(AppriseDiskIOError):
+    """
+    Thrown when content read from disk is in a format we recognize but are
+    unable to decode
+    """
+    def __init__(self, message):
+        super().__init__(message, error_code=errno.ENOTSUP)
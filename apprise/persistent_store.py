@@ -35,11 +35,38 @@ from . import exception
 from itertools import chain
 from datetime import datetime, timezone, timedelta
 import time
+import atexit
 import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
 from .common import PersistentStoreMode, PERSISTENT_STORE_MODES
+from .common import PersistentStoreCodec, PERSISTENT_STORE_CODECS
 from .utils import path_decode
 from .logger import logger
 
+try:
+    # Used to coordinate access to our storage between processes
+    import fcntl
+
+except ImportError:
+    # Advisory file locking isn't available (such as on Microsoft Windows);
+    # no problem; we just can't coordinate with other processes
+    fcntl = None
+
+try:
+    # Used for our (optional) compact binary cache file format
+    import msgpack
+
+    # msgpack based cache files are supported
+    MSGPACK_SUPPORT = True
+
+except ImportError:
+    # No problem; we just can't read or write msgpack based cache files
+    MSGPACK_SUPPORT = False
+
 # Used for writing/reading time stored in cache file
 EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
@@ -47,6 +74,59 @@ EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 AWARE_DATE_ISO_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
 NAIVE_DATE_ISO_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
 
+# Our original cache file format (gzip compressed JSON) carries no header of
+# it's own; we identify it by the gzip magic number
+GZIP_MAGIC = b'\x1f\x8b'
+
+# All other cache files start with this header followed by a single byte
+# identifying the version of the header and another identifying the codec
+# the remaining content was encoded with
+CACHE_HEADER_MAGIC = b'APSC'
+CACHE_HEADER_VERSION = 1
+
+# Our codec identifiers as they're written into our cache file header
+CACHE_CODEC_IDS = {
+    PersistentStoreCodec.JSON: 1,
+    PersistentStoreCodec.ZLIB: 2,
+    PersistentStoreCodec.MSGPACK: 3,
+}
+
+# The PersistentStore objects whose changes may still need to be written to
+# disk when our interpreter exits
+_PENDING_STORES = weakref.WeakSet()
+
+
+def _flush_pending_stores():
+    """
+    Writes any outstanding changes to disk; called when our interpreter exits
+    """
+    for store in list(_PENDING_STORES):
+        store.flush()
+
+
+atexit.register(_flush_pending_stores)
+
+# The time (per storage path) our next background prune is due
+_PRUNE_SCHEDULE = {}
+_PRUNE_LOCK = threading.Lock()
+
+# The size (in bytes per index path) our storage index can be appended to
+# before it is next checked to see if it needs compacting
+_INDEX_LIMITS = {}
+
+
+def _synchronized(fn):
+    """
+    Serializes access to a PersistentStore object; write-behind flushes take
+    place from a background thread
+    """
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with self._mutex:
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
 
 def _ntf_tidy(ntf):
     """
@@ -213,7 +293,9 @@ class CacheObject:
                     f'CacheObject (dt) corrupted loading from {content}')
                 return None
 
-        elif class_name == 'bytes':
+        elif class_name == 'bytes' and not isinstance(value, bytes):
+            # Binary content is base64 encoded unless our codec supports
+            # storing it natively
             try:
                 # Convert our object back to a bytes
                 value = base64.b64decode(value)
@@ -314,6 +396,315 @@ class CacheJSONEncoder(json.JSONEncoder):
         return super().default(entry)
 
 
+def _dir_stat(path, max_depth=3, _depth=0):
+    """
+    Scans a provided path and returns a tuple of the total size (in bytes)
+    of the files within it and the modification time of the oldest one (or
+    None if no files were found)
+    """
+
+    total = 0
+    oldest = None
+    if _depth > max_depth:
+        return (total, oldest)
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        total += st.st_size
+                        if oldest is None or st.st_mtime < oldest:
+                            oldest = st.st_mtime
+
+                    elif entry.is_dir(follow_symlinks=False):
+                        size, mtime = _dir_stat(
+                            entry.path, max_depth=max_depth,
+                            _depth=_depth + 1)
+                        total += size
+                        if mtime is not None and (
+                                oldest is None or mtime < oldest):
+                            oldest = mtime
+
+                except (OSError, IOError):
+                    # FileNotFoundError, or Permission error of some kind
+                    continue
+
+    except (OSError, IOError):
+        # FileNotFoundError, or Permission error of some kind
+        pass
+
+    return (total, oldest)
+
+
+class PersistentStoreIndex:
+    """
+    An index of the namespaces found within a persistent storage path, their
+    size and the age of the oldest file within them.  It allows a storage
+    path with a large number of namespaces to be listed and pruned without
+    having to scan each of them from disk.
+
+    The index is an append-only log of JSON records; the last record written
+    for a namespace is the one that applies.  A record without a size marks
+    a namespace that has been removed.
+
+    Records are only written when a namespace is created and when our
+    storage path is pruned; what they hold is only as current as that.
+    """
+
+    # Our index file (placed in the root of our storage path)
+    filename = '.psindex'
+
+    # Our index is re-written once it holds this many more records than it
+    # does namespaces
+    compact_threshold = 1024
+
+    # File encoding to use
+    encoding = 'utf-8'
+
+    def __init__(self, path):
+        """
+        Initialize our index for the storage path specified
+        """
+
+        # Our storage path
+        self.__path = path
+
+        # The number of records read from our index
+        self.__records = 0
+
+        # The last time our storage path was pruned (if ever)
+        self.__pruned = None
+
+    @contextmanager
+    def __lock(self, exclusive=True):
+        """
+        Acquires an advisory lock on our storage path; appending to our index
+        only requires a shared lock while re-writing it requires an
+        exclusive one.
+        """
+
+        fd = None
+        if fcntl is not None:
+            try:
+                fd = os.open(self.__path, os.O_RDONLY)
+                fcntl.flock(
+                    fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+            except (OSError, IOError) as e:
+                # We'll carry on without our lock
+                logger.debug(
+                    'Could not lock persistent storage index: %s', self.path)
+                logger.debug('Persistent Storage Exception: %s', str(e))
+
+        try:
+            yield
+
+        finally:
+            if fd is not None:
+                # Closing our descriptor releases our lock
+                os.close(fd)
+
+    def load(self):
+        """
+        Reads our index and returns a dictionary of the namespaces in it; each
+        entry identifies the size ('s') of the namespace, the time it was last
+        written to ('a') and the modification time of the oldest file in it
+        ('o').
+        """
+
+        entries, size = self.__read()
+        if self.__records > len(entries) + self.compact_threshold:
+            # Tidy our index
+            self.compact()
+
+        else:
+            self.__limit(size)
+
+        return entries
+
+    def __read(self):
+        """
+        Reads our index and returns a tuple of the namespaces in it (see
+        load()) and the number of bytes read.
+        """
+
+        entries = {}
+        self.__records = 0
+        size = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    size += len(line)
+                    try:
+                        record = json.loads(line.decode(self.encoding))
+                        if 'p' in record:
+                            # Track when we were last pruned
+                            self.__pruned = float(record['p'])
+                            continue
+
+                        namespace = record['n']
+                        if 's' in record:
+                            entries[namespace] = record
+
+                        else:
+                            entries.pop(namespace, None)
+
+                    except (UnicodeDecodeError, json.decoder.JSONDecodeError,
+                            TypeError, KeyError, ValueError):
+                        # A torn (partially written) record; move along
+                        continue
+
+                    self.__records += 1
+
+        except FileNotFoundError:
+            # No index has been written yet
+            pass
+
+        except (OSError, IOError) as e:
+            # Permission error of some kind or disk problem...
+            logger.warning(
+                'Could not read persistent storage index: %s', self.path)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+
+        return (entries, size)
+
+    @staticmethod
+    def record(namespace, size=None, oldest=None, accessed=None):
+        """
+        Returns the index record of a namespace; the size of the namespace
+        is recorded along with the modification time of the oldest file
+        within it.  A namespace that has been removed has no size.
+        """
+        if size is None:
+            return {'n': namespace}
+
+        return {
+            'n': namespace,
+            's': size,
+            'a': time.time() if accessed is None else accessed,
+            'o': oldest,
+        }
+
+    def append(self, *records):
+        """
+        Appends the records provided (see record()) to our index
+        """
+
+        if not records:
+            return True
+
+        content = ''.join(
+            json.dumps(r, separators=(',', ':')) + '\n' for r in records)
+        try:
+            with self.__lock(exclusive=False):
+                with open(self.path, 'ab') as f:
+                    f.write(content.encode(self.encoding))
+                    size = f.tell()
+
+        except (OSError, IOError) as e:
+            # Our index is only an optimization; our storage is re-scanned
+            # for the namespaces it doesn't identify
+            logger.debug(
+                'Could not write to persistent storage index: %s', self.path)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            return False
+
+        self.__records += len(records)
+        if size > _INDEX_LIMITS.get(self.path, 0):
+            # Our index may have grown enough that it needs compacting
+            self.load()
+
+        return True
+
+    def update(self, namespace, size, oldest=None, accessed=None):
+        """
+        Records the size of a namespace and the modification time of the
+        oldest file within it
+        """
+        return self.append(self.record(namespace, size, oldest, accessed))
+
+    def remove(self, *namespaces):
+        """
+        Records the removal of one or more namespaces
+        """
+        return self.append(*[self.record(ns) for ns in namespaces])
+
+    def prune(self):
+        """
+        Records that our storage path was just pruned
+        """
+        self.__pruned = time.time()
+        return self.append({'p': self.__pruned})
+
+    def compact(self):
+        """
+        Re-writes our index so that it only holds the records that still
+        apply.  Our index is read again once we hold our exclusive lock so
+        that nothing appended to it in the meantime is lost.
+        """
+
+        ntf = None
+        try:
+            with self.__lock():
+                entries, _ = self.__read()
+
+                records = [r for r in entries.values()]
+                if self.__pruned is not None:
+                    records.append({'p': self.__pruned})
+
+                content = ''.join(
+                    json.dumps(r, separators=(',', ':')) + '\n'
+                    for r in records).encode(self.encoding)
+
+                ntf = tempfile.NamedTemporaryFile(
+                    mode='wb', dir=self.__path, prefix=self.filename,
+                    delete=False)
+
+                with ntf:
+                    ntf.write(content)
+
+                os.replace(ntf.name, self.path)
+
+        except (OSError, IOError) as e:
+            logger.debug(
+                'Could not compact persistent storage index: %s', self.path)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+
+            # Tidy our Named Temporary File
+            _ntf_tidy(ntf)
+            return False
+
+        self.__records = len(entries)
+        self.__limit(len(content))
+        return True
+
+    def __limit(self, size):
+        """
+        Sets the size our index (currently size bytes long) can be appended
+        to before it is next checked for compaction; this is roughly the
+        size of compact_threshold more records.
+        """
+        _INDEX_LIMITS[self.path] = size + self.compact_threshold * (
+            size // self.__records if self.__records else 0)
+
+    @property
+    def path(self):
+        """
+        Returns the full path to our index
+        """
+        return os.path.join(self.__path, self.filename)
+
+    @property
+    def pruned(self):
+        """
+        Returns the time our storage path was last pruned (if ever) as of
+        when our index was last loaded
+        """
+        return self.__pruned
+
+
 class PersistentStore:
     """
     An object to make working with persistent storage easier
@@ -351,6 +742,24 @@ class PersistentStore:
     # Identify our backup file extension
     __backup_extension = '._psbak'
 
+    # Identify our cache journal file extension
+    __journal_extension = '.pslog'
+
+    # The zlib compression level used by the zlib codec; favour speed
+    zlib_compress_level = 1
+
+    # When journaling, the entries that change are appended to a journal
+    # instead of the entire cache being re-written on every flush. Once the
+    # journal contains more records than this (or than there are entries in
+    # our cache), it is compacted back into our cache file.
+    journal_compact_threshold = 256
+
+    # When a flush interval is specified, changes made in FLUSH mode are
+    # written to disk in the background (at most) flush_interval seconds
+    # after they are made.  Once this many entries have changed, they're
+    # written immediately instead.
+    flush_max_changes = 100
+
     # Used to verify the key specified is valid
     #  - must start with an alpha_numeric
     #  - following optional characters can include period, underscore and
@@ -360,17 +769,39 @@ class PersistentStore:
     # Reference only
     __not_found_ref = (None, None)
 
-    def __init__(self, path=None, namespace='default', mode=None):
+    def __init__(self, path=None, namespace='default', mode=None,
+                 journal=False, flush_interval=0, codec=None,
+                 prune_interval=0):
         """
         Provide the namespace to work within. namespaces can only contain
         alpha-numeric characters with the exception of '-' (dash), '_'
         (underscore), and '.' (period). The namespace must be be relative
         to the current URL being controlled.
+
+        If journal is set to True, then flush() only appends the cache
+        entries that changed to disk (see journal_compact_threshold).
+
+        If a flush_interval (in seconds) is specified, then changes made in
+        FLUSH mode are written to disk in the background instead of as they
+        are made (see flush_max_changes).
+
+        The codec identifies the format our cache file is written in (see
+        PersistentStoreCodec); cache files written in any of the supported
+        formats can always be read back.
+
+        If a prune_interval (in seconds) is specified, then the storage path
+        is pruned (see disk_prune()) in the background at most this often.
         """
         # Initalize our mode so __del__() calls don't go bad on the
         # error checking below
         self.__mode = None
 
+        # Serializes our access (see _synchronized)
+        self._mutex = threading.RLock()
+
+        # Our write-behind timer (if one is active)
+        self.__timer = None
+
         # Populated only once and after size() is called
         self.__exclude_list = None
 
@@ -404,22 +835,95 @@ class PersistentStore:
             raise AttributeError(
                 f"Persistent Storage mode ({mode}) provided is invalid")
 
+        try:
+            self.__flush_interval = float(flush_interval or 0)
+            if self.__flush_interval < 0:
+                raise ValueError()
+
+        except (TypeError, ValueError):
+            raise AttributeError(
+                f"Persistent Storage flush interval ({flush_interval}) "
+                "provided is invalid")
+
+        try:
+            prune_interval = float(prune_interval or 0)
+            if prune_interval < 0:
+                raise ValueError()
+
+        except (TypeError, ValueError):
+            raise AttributeError(
+                f"Persistent Storage prune interval ({prune_interval}) "
+                "provided is invalid")
+
+        if codec is None:
+            # Store Default
+            codec = PERSISTENT_STORE_CODECS[0]
+
+        if codec not in PERSISTENT_STORE_CODECS:
+            raise AttributeError(
+                f"Persistent Storage codec ({codec}) provided is invalid")
+
+        if codec == PersistentStoreCodec.MSGPACK and not MSGPACK_SUPPORT:
+            logger.warning(
+                'Persistent Storage msgpack codec is unavailable; '
+                'falling back to the zlib codec')
+            codec = PersistentStoreCodec.ZLIB
+
+        # Store our codec
+        self.__codec = codec
+
         # Store our mode
         self.__mode = mode
 
         # Tracks when we have content to flush
         self.__dirty = False
 
+        # Whether or not we journal our cache changes
+        self.__journal = True if journal else False
+
+        # The cache keys that changed since our last flush; kept in the order
+        # they changed in so that they're journaled in that same order
+        self.__changes = {}
+
+        # The number of records in our journal
+        self.__journal_records = 0
+
+        # Set when our journal can no longer be appended to and our cache
+        # must be re-written in its entirety
+        self.__compact = False
+
+        # The state of our cache (and journal) on disk when we last read or
+        # wrote it; used to detect changes made by other processes
+        self.__disk_state = None
+
+        # Tracks our (re-entrant) use of our advisory lock
+        self.__lock_depth = 0
+
         # A caching value to track persistent storage disk size
-        self.__cache_size = None
+        self.__cache_size = {}
         self.__cache_files = {}
 
+        # The size and modification time of each of our files (once scanned);
+        # these are updated as we write to disk so we don't have to re-scan
+        self.__file_stats = None
+
         # Internal Cache
         self._cache = None
 
         # Prepare our environment
         self.__prepare()
 
+        if self.__mode is PersistentStoreMode.AUTO or (
+                self.__mode is PersistentStoreMode.FLUSH
+                and self.__flush_interval):
+            # Ensure our changes are written before our interpreter exits
+            _PENDING_STORES.add(self)
+
+        if prune_interval and self.__mode != PersistentStoreMode.MEMORY:
+            # Prune our storage path in the background (when due)
+            PersistentStore.disk_prune_schedule(
+                os.path.dirname(self.__base_path), prune_interval)
+
     def read(self, key=None, compress=True, expires=False):
         """
         Returns the content of the persistent store object
@@ -597,9 +1101,9 @@ class PersistentStore:
             _ntf_tidy(ntf)
             return False
 
-        # Resetour reference variables
-        self.__cache_size = None
-        self.__cache_files.clear()
+        # Update our reference variables
+        self.__account(io_file, io_file[:-len(self.__backup_extension)] +
+                       self.__backup_extension)
 
         # Content installed
         return True
@@ -734,6 +1238,7 @@ class PersistentStore:
             logger.debug('Persistent Storage Exception: %s', str(e))
             raise exception.AppriseDiskIOError(str(e))
 
+    @_synchronized
     def get(self, key, default=None, lazy=True):
         """
         Fetches from cache
@@ -742,16 +1247,21 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             return default
 
+        # Acquire any changes made by other processes
+        self.__refresh()
+
         if key in self._cache and \
                 not self.__mode == PersistentStoreMode.MEMORY and \
                 not self.__dirty:
 
             # ensure we renew our content
             self.__renew.add(self.cache_file)
+            self.__renew.add(self.journal_file)
 
         return self._cache[key].value \
             if key in self._cache and self._cache[key] else default
 
+    @_synchronized
     def set(self, key, value, expires=None, persistent=True, lazy=True):
         """
         Cache reference
@@ -760,6 +1270,10 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             return False
 
+        if lazy:
+            # Acquire any changes made by other processes before we compare
+            self.__refresh()
+
         cache = CacheObject(value, expires, persistent=persistent)
         # Fetch our cache value
         try:
@@ -772,16 +1286,15 @@ class PersistentStore:
 
         # Store our new cache
         self._cache[key] = CacheObject(value, expires, persistent=persistent)
+        self.__changed(key)
 
         # Set our dirty flag
         self.__dirty = persistent
 
-        if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
-            # Flush changes to disk
-            return self.flush()
-
-        return True
+        # Flush changes to disk (if required)
+        return self.__flush_changes()
 
+    @_synchronized
     def clear(self, *args):
         """
         Remove one or more cache entry by it's key
@@ -800,6 +1313,7 @@ class PersistentStore:
 
                 try:
                     del self._cache[arg]
+                    self.__changed(arg)
 
                     # Set our dirty flag (if not set already)
                     self.__dirty = True
@@ -814,12 +1328,13 @@ class PersistentStore:
             self.__dirty = True
 
             # Reset our object
+            self.__changed(*self._cache.keys())
             self._cache.clear()
 
-        if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
-            # Flush changes to disk
-            return self.flush()
+        # Flush changes to disk (if required)
+        return self.__flush_changes()
 
+    @_synchronized
     def prune(self):
         """
         Eliminates expired cache entries
@@ -838,53 +1353,87 @@ class PersistentStore:
                     # Set our dirty flag
                     self.__dirty = True
 
+                if self._cache[key].persistent:
+                    self.__changed(key)
+
                 del self._cache[key]
 
         if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
             # Flush changes to disk
-            return self.flush()
+            return self.__flush_changes()
 
         return change
 
-    def __load_cache(self, _recovery=False):
+    def __load_cache(self):
         """
         Loads our cache
+        """
+        with self.__lock(exclusive=False):
+            return self.__read_cache()
+
+    def __read_cache(self, state=None, _recovery=False):
+        """
+        Reads our cache from disk; this should only be called while our
+        lock is held.
+
+        The state (as returned by __disk_stat()) of our cache and journal can
+        be specified if it was already acquired.
 
         _recovery is reserved for internal usage and should not be changed
         """
 
         # Prepare our dirty flag
         self.__dirty = False
+        self.__changes.clear()
+        self.__compact = False
 
         if self.__mode == PersistentStoreMode.MEMORY:
             # Nothing further to do
             self._cache = {}
             return True
 
+        # Track the state of what we're about to read
+        self.__disk_state = self.__disk_stat() if state is None else state
+
         # Prepare our cache file
         cache_file = self.cache_file
         try:
-            with gzip.open(cache_file, 'rb') as f:
-                # Read our ontent from disk
-                self._cache = {}
-                for k, v in json.loads(f.read().decode(self.encoding)).items():
-                    co = CacheObject.instantiate(v)
-                    if co:
-                        # Verify our object before assigning it
-                        self._cache[k] = co
+            # Read our content from disk
+            codec, data = self.__read_cache_file(cache_file)
+            cache = {}
+            for k, v in self.__decode_cache(codec, data).items():
+                co = CacheObject.instantiate(v)
+                if co:
+                    # Verify our object before assigning it
+                    cache[k] = co
+
+                elif not self.__dirty:
+                    # Track changes from our loadset
+                    self.__dirty = True
+                    self.__compact = True
 
-                    elif not self.__dirty:
-                        # Track changes from our loadset
-                        self.__dirty = True
+            self._cache = cache
+
+        except exception.AppriseUnsupportedFormat as e:
+            # The cache file is valid, but was written in a format we can't
+            # decode (such as by a newer version of Apprise); it belongs to
+            # whoever wrote it so we leave it be
+            logger.warning(
+                'Unsupported persistent cache content: %s', cache_file)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            return False
 
         except (UnicodeDecodeError, json.decoder.JSONDecodeError, zlib.error,
-                TypeError, AttributeError, EOFError):
+                TypeError, AttributeError, EOFError, ValueError):
 
             # Let users known there was a problem
             logger.warning(
                 'Corrupted access persistent cache content: %s',
                 cache_file)
 
+            # Nothing we've read can be trusted
+            self._cache = {}
+
             if not _recovery:
                 try:
                     os.unlink(cache_file)
@@ -904,7 +1453,7 @@ class PersistentStore:
                         cache_file)
                     logger.debug('Persistent Storage Exception: %s', str(e))
                     return False
-                return self.__load_cache(_recovery=True)
+                return self.__read_cache(state=state, _recovery=True)
 
             return False
 
@@ -921,64 +1470,425 @@ class PersistentStore:
             logger.debug('Persistent Storage Exception: %s', str(e))
             return False
 
-        # Ensure our dirty flag is set to False
-        return True
+        # Apply the changes journaled since our cache file was written
+        return self.__load_journal()
 
-    def __prepare(self, flush=True):
+    def __read_cache_file(self, cache_file):
         """
-        Prepares a working environment
+        Reads the content of our cache file returning a tuple of the codec it
+        was written with (detected from it's header) and it's encoded content
         """
-        if self.__mode != PersistentStoreMode.MEMORY:
-            # Ensure our path exists
-            try:
-                os.makedirs(self.__base_path, mode=0o770, exist_ok=True)
 
-            except (OSError, IOError) as e:
-                # Permission error
-                logger.debug(
-                    'Could not create persistent store directory %s',
-                    self.__base_path)
-                logger.debug('Persistent Storage Exception: %s', str(e))
+        with open(cache_file, 'rb') as f:
+            header = f.read(len(CACHE_HEADER_MAGIC) + 2)
+            if header.startswith(CACHE_HEADER_MAGIC):
+                data = f.read()
 
-                # Mode changed back to MEMORY
-                self.__mode = PersistentStoreMode.MEMORY
+        if header.startswith(GZIP_MAGIC):
+            # Our original header-less format
+            with gzip.open(cache_file, 'rb') as f:
+                return (PersistentStoreCodec.GZIP, f.read())
 
-            # Ensure our path exists
-            try:
-                os.makedirs(self.__temp_path, mode=0o770, exist_ok=True)
+        if not header.startswith(CACHE_HEADER_MAGIC) \
+                or len(header) != len(CACHE_HEADER_MAGIC) + 2:
+            raise ValueError('Unrecognized cache file format')
 
-            except (OSError, IOError) as e:
-                # Permission error
-                logger.debug(
-                    'Could not create persistent store directory %s',
-                    self.__temp_path)
-                logger.debug('Persistent Storage Exception: %s', str(e))
+        version, codec_id = header[-2], header[-1]
+        if version > CACHE_HEADER_VERSION:
+            raise exception.AppriseUnsupportedFormat(
+                f'Unsupported cache file version ({version})')
 
-                # Mode changed back to MEMORY
-                self.__mode = PersistentStoreMode.MEMORY
+        for codec, _id in CACHE_CODEC_IDS.items():
+            if _id == codec_id:
+                return (codec, data)
 
-            try:
-                os.makedirs(self.__data_path, mode=0o770, exist_ok=True)
+        raise exception.AppriseUnsupportedFormat(
+            f'Unsupported cache file codec ({codec_id})')
 
-            except (OSError, IOError) as e:
-                # Permission error
-                logger.debug(
-                    'Could not create persistent store directory %s',
-                    self.__data_path)
-                logger.debug('Persistent Storage Exception: %s', str(e))
+    def __decode_cache(self, codec, data):
+        """
+        Decodes the content read from our cache file
+        """
 
-                # Mode changed back to MEMORY
-                self.__mode = PersistentStoreMode.MEMORY
+        if codec == PersistentStoreCodec.MSGPACK:
+            if not MSGPACK_SUPPORT:
+                raise exception.AppriseUnsupportedFormat(
+                    'msgpack cache files are not supported')
 
-            if self.__mode is PersistentStoreMode.MEMORY:
-                logger.warning(
-                    'The persistent storage could not be fully initialized; '
-                    'operating in MEMORY mode')
+            return msgpack.unpackb(data, raw=False)
+
+        if codec == PersistentStoreCodec.ZLIB:
+            data = zlib.decompress(data)
+
+        return json.loads(data.decode(self.encoding))
+
+    def __encode_cache(self, cache_file, content):
+        """
+        Writes our content to the cache file specified using our codec
+        """
+
+        if self.__codec == PersistentStoreCodec.GZIP:
+            # Our original header-less format
+            with gzip.open(cache_file, 'wb') as f:
+                f.write(json.dumps(
+                    content, separators=(',', ':'),
+                    cls=CacheJSONEncoder).encode(self.encoding))
+            return
+
+        if self.__codec == PersistentStoreCodec.MSGPACK:
+            data = msgpack.packb(
+                content, use_bin_type=True,
+                default=CacheJSONEncoder().default)
+
+        else:
+            data = json.dumps(
+                content, separators=(',', ':'),
+                cls=CacheJSONEncoder).encode(self.encoding)
+
+            if self.__codec == PersistentStoreCodec.ZLIB:
+                data = zlib.compress(data, self.zlib_compress_level)
+
+        with open(cache_file, 'wb') as f:
+            f.write(CACHE_HEADER_MAGIC + bytes(
+                (CACHE_HEADER_VERSION, CACHE_CODEC_IDS[self.__codec])))
+            f.write(data)
+
+    def __load_journal(self, offset=0, inode=None):
+        """
+        Applies the records of our journal (if one exists) to our cache
+
+        If an offset is specified, then only the records found beyond it
+        are applied.  If an inode is specified, then False is returned
+        (and nothing is applied) if our journal is no longer that file.
+        """
+
+        if not offset:
+            self.__journal_records = 0
+
+        journal_file = self.journal_file
+        try:
+            with open(journal_file, 'rb') as f:
+                if inode is not None and os.fstat(f.fileno()).st_ino != inode:
+                    # Our journal was replaced
+                    return False
+
+                f.seek(offset)
+                for line in f:
+                    try:
+                        record = json.loads(line.decode(self.encoding))
+                        key = record['k']
+                        if not isinstance(key, str):
+                            raise TypeError('Key not expected string')
+
+                    except (json.decoder.JSONDecodeError, TypeError,
+                            KeyError) as e:
+                        # A partially written (or corrupted) record; we
+                        # can no longer safely append to this journal
+                        logger.trace(
+                            'Persistent cache journal record skipped: %s',
+                            journal_file)
+                        logger.trace(
+                            'Persistent Storage Exception: %s', str(e))
+                        self.__compact = True
+                        continue
+
+                    self.__journal_records += 1
+
+                    co = CacheObject.instantiate(record['v']) \
+                        if 'v' in record else None
+                    if co:
+                        self._cache[key] = co
+
+                    else:
+                        # Removed (or otherwise no longer valid)
+                        self._cache.pop(key, None)
+
+        except FileNotFoundError:
+            # No problem; there is no journal to apply (unless we were
+            # expecting one)
+            return inode is None
+
+        except UnicodeDecodeError as e:
+            # Let users known there was a problem
+            logger.warning(
+                'Corrupted access persistent cache journal: %s',
+                journal_file)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            self.__compact = True
+
+        except (OSError, IOError) as e:
+            # Permission error of some kind or disk problem...
+            # There is nothing we can do at this point
+            logger.warning(
+                'Could not load persistent cache journal for namespace %s',
+                os.path.basename(self.__base_path))
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            return False
+
+        if self.__compact or not self.__journal:
+            # Fold our journal back into our cache file on our next flush
+            self.__dirty = True
+            self.__compact = True
+
+        return True
+
+    def __changed(self, *keys):
+        """
+        Tracks the cache keys specified as having changed since our last
+        flush; a key that changes again is moved to the end.
+        """
+        for key in keys:
+            self.__changes.pop(key, None)
+            self.__changes[key] = None
+
+    def __append_journal(self):
+        """
+        Appends the cache entries that changed since our last flush to our
+        journal.
+
+        Function returns True if successful and False if not.
+        """
+
+        lines = []
+        try:
+            for key in self.__changes:
+                co = self._cache.get(key)
+                lines.append(json.dumps(
+                    {'k': key, 'v': co} if co and co.persistent
+                    else {'k': key}, separators=(',', ':'),
+                    cls=CacheJSONEncoder))
+
+        except TypeError as e:
+            # JSON object contains content that can not be encoded to disk
+            logger.error(
+                'Persistent cache journal can not be written to '
+                'due to bad input data: %s', self.journal_file)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            return False
+
+        if not lines:
+            # Nothing to write
+            return True
+
+        try:
+            with open(self.journal_file, 'a+b') as f:
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        # Terminate a previously partially written record
+                        lines.insert(0, '')
+
+                f.write(('\n'.join(lines) + '\n').encode(self.encoding))
+
+        except (OSError, IOError, UnicodeEncodeError) as e:
+            logger.warning(
+                'Could not append to persistent cache journal: %s',
+                self.journal_file)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            return False
+
+        logger.trace(
+            'Journaled %d persistent cache change(s): %s',
+            len(self.__changes), self.journal_file)
+
+        self.__journal_records += len(self.__changes)
+        self.__changes.clear()
+        return True
+
+    def __disk_stat(self):
+        """
+        Returns a tuple identifying the current state of our cache and
+        journal on disk
+        """
+
+        def _stat(path):
+            try:
+                st = os.stat(path)
+                return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+            except (OSError, IOError):
+                # FileNotFoundError, or Permission error of some kind
+                return None
+
+        return (_stat(self.cache_file), _stat(self.journal_file))
+
+    def __refresh(self):
+        """
+        Reloads our cache if another process changed it on disk since we
+        last read (or wrote) it.  Our own changes that have yet to be
+        flushed are applied on top of what is loaded.
+
+        Function returns True if our cache is current and False if not.
+        """
+
+        if self._cache is None or self.__mode == PersistentStoreMode.MEMORY:
+            # Nothing to refresh
+            return True
+
+        # We only ever stat our files once; if they change after this point
+        # (but before we acquire our lock) we'll pick this up on our next
+        # call as what we record is this state
+        state = self.__disk_stat()
+        if state == self.__disk_state:
+            # Nothing has changed
+            return True
+
+        with self.__lock(exclusive=False):
+            # Track our own changes
+            pending = {key: self._cache.get(key) for key in self.__changes}
+            dirty, compact = self.__dirty, self.__compact
+
+            prev = self.__disk_state
+
+            if prev and prev[0] == state[0] and prev[1] and state[1] \
+                    and prev[1][0] == state[1][0] \
+                    and prev[1][1] < state[1][1]:
+                # Only new records were appended to our journal
+                logger.trace(
+                    'Persistent cache journal updated externally: %s',
+                    self.journal_file)
+                self.__disk_state = state
+                result = self.__load_journal(
+                    offset=prev[1][1], inode=state[1][0])
+
+                if not result:
+                    # Our journal was compacted in the mean time
+                    result = self.__read_cache(state=state)
+
+            else:
+                logger.trace(
+                    'Persistent cache updated externally: %s',
+                    self.cache_file)
+                result = self.__read_cache(state=state)
+
+            # Apply our own changes on top of what was loaded
+            for key, co in pending.items():
+                if co is None:
+                    self._cache.pop(key, None)
+
+                else:
+                    self._cache[key] = co
+
+            self.__changed(*pending)
+            self.__dirty = self.__dirty or dirty
+            self.__compact = self.__compact or compact
+
+            if not result:
+                # Ensure we try again next time
+                self.__disk_state = None
+
+        return result
+
+    @contextmanager
+    def __lock(self, exclusive=True):
+        """
+        Acquires an advisory lock on our namespace which is used to
+        coordinate reading and writing our cache with other processes.
+        Our lock is re-entrant; nested requests are granted immediately.
+        """
+
+        if fcntl is None or self.__lock_depth \
+                or self.__mode == PersistentStoreMode.MEMORY:
+            # Nothing to lock (or we already hold it)
+            self.__lock_depth += 1
+            try:
+                yield
+
+            finally:
+                self.__lock_depth -= 1
+            return
+
+        fd = None
+        try:
+            # We lock our namespace directory itself; this prevents us from
+            # having to manage (and prune) a lock file
+            fd = os.open(self.__base_path, os.O_RDONLY)
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+        except (OSError, IOError) as e:
+            # We'll carry on without our lock
+            logger.debug(
+                'Could not lock persistent store namespace %s',
+                os.path.basename(self.__base_path))
+            logger.debug('Persistent Storage Exception: %s', str(e))
+
+        self.__lock_depth += 1
+        try:
+            yield
+
+        finally:
+            self.__lock_depth -= 1
+            if fd is not None:
+                # Closing our descriptor releases our lock
+                os.close(fd)
+
+    def __prepare(self, flush=True):
+        """
+        Prepares a working environment
+        """
+        if self.__mode != PersistentStoreMode.MEMORY:
+            # Ensure our path exists
+            created = False
+            try:
+                os.makedirs(self.__base_path, mode=0o770)
+                created = True
+
+            except FileExistsError:
+                # Our namespace already exists
+                pass
+
+            except (OSError, IOError) as e:
+                # Permission error
+                logger.debug(
+                    'Could not create persistent store directory %s',
+                    self.__base_path)
+                logger.debug('Persistent Storage Exception: %s', str(e))
+
+                # Mode changed back to MEMORY
+                self.__mode = PersistentStoreMode.MEMORY
+
+            # Ensure our path exists
+            try:
+                os.makedirs(self.__temp_path, mode=0o770, exist_ok=True)
+
+            except (OSError, IOError) as e:
+                # Permission error
+                logger.debug(
+                    'Could not create persistent store directory %s',
+                    self.__temp_path)
+                logger.debug('Persistent Storage Exception: %s', str(e))
+
+                # Mode changed back to MEMORY
+                self.__mode = PersistentStoreMode.MEMORY
+
+            try:
+                os.makedirs(self.__data_path, mode=0o770, exist_ok=True)
+
+            except (OSError, IOError) as e:
+                # Permission error
+                logger.debug(
+                    'Could not create persistent store directory %s',
+                    self.__data_path)
+                logger.debug('Persistent Storage Exception: %s', str(e))
+
+                # Mode changed back to MEMORY
+                self.__mode = PersistentStoreMode.MEMORY
+
+            if self.__mode is PersistentStoreMode.MEMORY:
+                logger.warning(
+                    'The persistent storage could not be fully initialized; '
+                    'operating in MEMORY mode')
+
+            else:
+                if created:
+                    # Our namespace is new; add it to the index of our path
+                    PersistentStoreIndex(os.path.dirname(self.__base_path))\
+                        .update(os.path.basename(self.__base_path), 0)
 
-            else:
                 if self._cache:
                     # Recovery taking place
                     self.__dirty = True
+                    self.__compact = True
                     logger.warning(
                         'The persistent storage environment was disrupted')
 
@@ -986,15 +1896,24 @@ class PersistentStore:
                         # Flush changes to disk
                         return self.flush(_recovery=True)
 
+    @_synchronized
     def flush(self, force=False, _recovery=False):
         """
         Save's our cache to disk
         """
 
+        if self.__timer is not None:
+            # We're flushing now; there is no need to do so again later
+            self.__timer.cancel()
+            self.__timer = None
+
         if self._cache is None or self.__mode == PersistentStoreMode.MEMORY:
             # nothing to do
             return True
 
+        # Track whether our content on disk is as we last left it
+        prior = self.__disk_stat() if self.__renew else None
+
         while self.__renew:
             # update our files
             path = self.__renew.pop()
@@ -1014,22 +1933,103 @@ class PersistentStore:
                 logger.debug('Could not update file timestamp: %s', path)
                 logger.debug('Persistent Storage Exception: %s', str(e))
 
+        if prior is not None and prior == self.__disk_state:
+            # Our own timestamp changes are not changes to our content
+            self.__disk_state = self.__disk_stat()
+
         if not force and self.__dirty is False:
             # Nothing further to do
             logger.trace('Persistent cache is consistent with memory map')
             return True
 
+        with self.__lock():
+            # Merge the changes made by other processes (if any) with our own
+            self.__refresh()
+
+            result = self.__flush(force=force, _recovery=_recovery)
+
+            # Update our reference variables
+            cache_file = self.cache_file
+            self.__account(
+                cache_file, self.journal_file,
+                cache_file[:-len(self.__backup_extension)] +
+                self.__backup_extension)
+
+            if not result:
+                return False
+
+            # Track the state of what we wrote
+            self.__disk_state = self.__disk_stat()
+
+        return True
+
+    def __flush_changes(self):
+        """
+        Writes our changes to disk if we're operating in FLUSH mode; if a
+        flush interval was specified, then this is deferred to a background
+        thread (unless we've accumulated too many changes).
+
+        Function returns True if successful and False if not.
+        """
+
+        if not (self.__dirty and self.__mode == PersistentStoreMode.FLUSH):
+            # Nothing to do
+            return True
+
+        if not self.__flush_interval \
+                or len(self.__changes) >= self.flush_max_changes:
+            # Write our changes now
+            return self.flush()
+
+        if self.__timer is None:
+            # Write our changes shortly
+            self.__timer = threading.Timer(
+                self.__flush_interval, self.__flush_behind)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+        return True
+
+    def __flush_behind(self):
+        """
+        Called from our write-behind timer
+        """
+        with self._mutex:
+            self.__timer = None
+            self.flush()
+
+    def __flush(self, force=False, _recovery=False):
+        """
+        Writes our cache to disk; this should only be called while our lock
+        is held.
+        """
+
         if _recovery:
             # Attempt to recover from a bad directory structure or setup
             self.__prepare(flush=False)
 
-        # Unset our size lazy setting
-        self.__cache_size = None
-        self.__cache_files.clear()
+        if self.__journal and not force and not self.__compact \
+                and self._cache and (
+                    self.__journal_records + len(self.__changes) <
+                    max(self.journal_compact_threshold, len(self._cache))) \
+                and self.__append_journal():
+            # Our changes were journaled
+            self.__dirty = False
+            return True
+
+        if self.__journal_records and not self.__compact:
+            # Journal our outstanding changes before we compact; if we're
+            # interrupted before our journal is removed below, re-applying
+            # it over our new cache file will not revert anything
+            self.__append_journal()
 
         # Prepare our cache file
         cache_file = self.cache_file
         if not self._cache:
+            # Our journal is of no further use
+            if not self.__remove_journal():
+                return False
+
             #
             # We're deleting the cache file s there are no entries left in it
             #
@@ -1072,6 +2072,11 @@ class PersistentStore:
                     cache_file)
                 logger.debug('Persistent Storage Exception: %s', str(e))
                 return False
+
+            # Ensure our dirty flag is set to False
+            self.__dirty = False
+            self.__changes.clear()
+            self.__compact = False
             return True
 
         #
@@ -1117,15 +2122,11 @@ class PersistentStore:
 
         try:
             # write our content currently saved to disk to our temporary file
-            with gzip.open(ntf.name, 'wb') as f:
-                # Write our content to disk
-                f.write(json.dumps(
-                    {k: v for k, v in self._cache.items()
-                     if v and v.persistent},
-                    separators=(',', ':'),
-                    cls=CacheJSONEncoder).encode(self.encoding))
+            self.__encode_cache(
+                ntf.name, {k: v for k, v in self._cache.items()
+                           if v and v.persistent})
 
-        except TypeError as e:
+        except (TypeError, ValueError, OverflowError) as e:
             # JSON object contains content that can not be encoded to disk
             logger.error(
                 'Persistent temporary file can not be written to '
@@ -1157,9 +2158,41 @@ class PersistentStore:
             _ntf_tidy(ntf)
             return False
 
+        # Our journal has been compacted into our cache file
+        self.__remove_journal()
+
         # Ensure our dirty flag is set to False
         self.__dirty = False
+        self.__changes.clear()
+        self.__compact = False
+
+        return True
+
+    def __remove_journal(self):
+        """
+        Removes our journal (if one exists)
+
+        Function returns True if successful and False if not.
+        """
+        try:
+            os.unlink(self.journal_file)
+            logger.trace(
+                'Removed persistent cache journal: %s', self.journal_file)
+
+        except FileNotFoundError:
+            # no worries; we were removing it anyway
+            pass
 
+        except (OSError, IOError) as e:
+            # Permission error of some kind or disk problem...
+            # There is nothing we can do at this point
+            logger.warning(
+                'Could not remove persistent cache journal: %s',
+                self.journal_file)
+            logger.debug('Persistent Storage Exception: %s', str(e))
+            return False
+
+        self.__journal_records = 0
         return True
 
     def files(self, exclude=True, lazy=True):
@@ -1179,22 +2212,12 @@ class PersistentStore:
             self.__cache_files.update({True: [], False: []})
             return []
 
-        if not lazy or self.__exclude_list is None:
-            # A list of criteria that should be excluded from the size count
-            self.__exclude_list = (
-                # Exclude backup cache file from count
-                re.compile(re.escape(os.path.join(
-                    self.__base_path,
-                    f'{self.__cache_key}{self.__backup_extension}'))),
-
-                # Exclude temporary files
-                re.compile(re.escape(self.__temp_path) + r'[/\\].+'),
-
-                # Exclude custom backup persistent files
-                re.compile(
-                    re.escape(self.__data_path) + r'[/\\].+' + re.escape(
-                        self.__backup_extension)),
-            )
+        elif lazy and self.__file_stats is not None:
+            # Our files are already known to us
+            self.__cache_files[exclude] = \
+                [path for path in self.__file_stats.keys()
+                 if not exclude or not self.__excluded(path)]
+            return self.__cache_files[exclude]
 
         try:
             if exclude:
@@ -1202,8 +2225,7 @@ class PersistentStore:
                     [path for path in filter(os.path.isfile, glob.glob(
                         os.path.join(self.__base_path, '**', '*'),
                         recursive=True))
-                        if next((False for p in self.__exclude_list
-                                 if p.match(path)), True)]
+                        if not self.__excluded(path)]
 
             else:  # No exclusion list applied
                 self.__cache_files[exclude] = \
@@ -1217,21 +2239,85 @@ class PersistentStore:
 
         return self.__cache_files[exclude]
 
+    def __excluded(self, path):
+        """
+        Returns True if the path specified is excluded from our size count
+        """
+
+        if self.__exclude_list is None:
+            # A list of criteria that should be excluded from the size count
+            self.__exclude_list = (
+                # Exclude backup cache file from count
+                re.compile(re.escape(os.path.join(
+                    self.__base_path,
+                    f'{self.__cache_key}{self.__backup_extension}'))),
+
+                # Exclude temporary files
+                re.compile(re.escape(self.__temp_path) + r'[/\\].+'),
+
+                # Exclude custom backup persistent files
+                re.compile(
+                    re.escape(self.__data_path) + r'[/\\].+' + re.escape(
+                        self.__backup_extension)),
+            )
+
+        return next(
+            (True for p in self.__exclude_list if p.match(path)), False)
+
+    def __account(self, *paths):
+        """
+        Updates our size and file references for the paths specified (which
+        we just wrote to or removed) without re-scanning our namespace
+        """
+
+        for path in paths:
+            try:
+                st = os.stat(path)
+                stat = (st.st_size, st.st_mtime)
+
+            except (OSError, IOError):
+                # FileNotFoundError, or Permission error of some kind
+                stat = None
+
+            excluded = self.__excluded(path)
+            for exclude, files in self.__cache_files.items():
+                if exclude and excluded:
+                    continue
+
+                if stat is None and path in files:
+                    files.remove(path)
+
+                elif stat is not None and path not in files:
+                    files.append(path)
+
+            if self.__file_stats is None:
+                # Our file sizes are unknown; they'll be re-scanned when
+                # they're next needed
+                self.__cache_size.clear()
+                continue
+
+            prev = self.__file_stats.pop(path, None)
+            if stat is not None:
+                self.__file_stats[path] = stat
+
+            delta = (stat[0] if stat else 0) - (prev[0] if prev else 0)
+            for exclude in self.__cache_size.keys():
+                if not (exclude and excluded):
+                    self.__cache_size[exclude] += delta
+
     @staticmethod
-    def disk_scan(path, namespace=None, closest=True):
+    def __disk_index(path, namespace=None, closest=True):
         """
-        Scansk a path provided and returns namespaces detected
+        Scans a path provided and returns a tuple of it's index, a
+        dictionary of the namespaces detected and a list of the namespaces
+        our index holds that no longer exist; each namespace detected maps
+        to it's index entry (or None if it has yet to be indexed).
+
+        Our index is only ever read here.
         """
 
         logger.trace('Persistent path can of: %s', path)
 
-        def is_namespace(x):
-            """
-            Validate what was detected is a valid namespace
-            """
-            return os.path.isdir(os.path.join(path, x)) \
-                and PersistentStore.__valid_key.match(x)
-
         # Handle our namespace searching
         if namespace:
             if isinstance(namespace, str):
@@ -1242,20 +2328,15 @@ class PersistentStore:
                     "namespace must be None, a string, or a tuple/set/list "
                     "of strings")
 
+        index = PersistentStoreIndex(path)
         try:
             # Acquire all of the files in question
-            namespaces = \
-                [ns for ns in filter(is_namespace, os.listdir(path))
-                 if not namespace or next(
-                     (True for n in namespace if ns.startswith(n)), False)] \
-                if closest else  \
-                [ns for ns in filter(is_namespace, os.listdir(path))
-                 if not namespace or ns in namespace]
+            names = os.listdir(path)
 
         except FileNotFoundError:
             # no worries; Nothing to do
             logger.debug('Disk Prune path not found; nothing to clean.')
-            return []
+            return (index, {}, [])
 
         except (OSError, IOError) as e:
             # Permission error of some kind or disk problem...
@@ -1264,9 +2345,53 @@ class PersistentStore:
                 'Disk Scan detetcted inaccessible path: %s', path)
             logger.debug(
                 'Persistent Storage Exception: %s', str(e))
-            return []
+            return (index, {}, [])
+
+        entries = index.load()
 
-        return namespaces
+        # The namespaces that no longer exist
+        listed = set(names)
+        removed = [ns for ns in entries.keys() if ns not in listed]
+
+        namespaces = {}
+        for ns in names:
+            if not PersistentStore.__valid_key.match(ns):
+                continue
+
+            if namespace and (
+                    next((False for n in namespace if ns.startswith(n)), True)
+                    if closest else ns not in namespace):
+                continue
+
+            entry = entries.get(ns)
+            if entry is None and not os.path.isdir(os.path.join(path, ns)):
+                # Only namespaces we've yet to index need to be verified
+                continue
+
+            namespaces[ns] = entry
+
+        return (index, namespaces, removed)
+
+    @staticmethod
+    def disk_scan(path, namespace=None, closest=True):
+        """
+        Scansk a path provided and returns namespaces detected
+        """
+
+        return list(PersistentStore.__disk_index(
+            path, namespace=namespace, closest=closest)[1].keys())
+
+    @staticmethod
+    def disk_usage(path, namespace=None, closest=True):
+        """
+        Returns a dictionary of the namespaces detected in the path provided
+        and the disk space (in bytes) each of them use
+        """
+
+        return {
+            ns: _dir_stat(os.path.join(path, ns))[0]
+            for ns in PersistentStore.__disk_index(
+                path, namespace=namespace, closest=closest)[1].keys()}
 
     @staticmethod
     def disk_prune(path, namespace=None, expires=None, action=False):
@@ -1281,23 +2406,37 @@ class PersistentStore:
         if action is not set to False, directories to be removed are returned
         only
 
+        Only the namespaces our index identifies as holding content older
+        than our expiry (or that have yet to be indexed) are scanned.
+
         """
 
         # Prepare our File Expiry
-        expires = datetime.now() - timedelta(seconds=expires) \
-            if isinstance(expires, (float, int)) and expires >= 0 \
-            else PersistentStore.default_file_expiry
+        expires = datetime.now() - timedelta(
+            seconds=expires if isinstance(expires, (float, int))
+            and expires >= 0 else PersistentStore.default_file_expiry)
 
         # Get our namespaces
-        namespaces = PersistentStore.disk_scan(path, namespace)
+        index, namespaces, removed = \
+            PersistentStore.__disk_index(path, namespace)
+        prune_all = not namespace
+
+        # The records our index is updated with once we're done; the
+        # namespaces that no longer exist are dropped from it
+        records = [PersistentStoreIndex.record(ns) for ns in removed]
 
         # Track matches
         _map = {}
 
-        for namespace in namespaces:
+        for namespace, entry in namespaces.items():
             # Prepare our map
             _map[namespace] = []
 
+            if entry is not None and entry.get('o') is not None \
+                    and entry['o'] > expires.timestamp():
+                # Nothing within our namespace has expired
+                continue
+
             # Reference Directories
             base_dir = os.path.join(path, namespace)
             data_dir = os.path.join(base_dir, PersistentStore.data_dir)
@@ -1310,12 +2449,15 @@ class PersistentStore:
                              f'{PersistentStore.__extension}'),
                 os.path.join(base_dir, f'{PersistentStore.__cache_key}'
                              f'{PersistentStore.__backup_extension}'),
+                os.path.join(base_dir, f'{PersistentStore.__cache_key}'
+                             f'{PersistentStore.__journal_extension}'),
             ]
 
             # Update our files (applying what was defined above too)
             valid_data_re = re.compile(
                 r'.*(' + re.escape(PersistentStore.__extension) +
-                r'|' + re.escape(PersistentStore.__backup_extension) + r')$')
+                r'|' + re.escape(PersistentStore.__backup_extension) +
+                r'|' + re.escape(PersistentStore.__journal_extension) + r')$')
 
             files = [path for path in filter(
                 os.path.isfile, chain(glob.glob(
@@ -1414,43 +2556,111 @@ class PersistentStore:
                         except OSError:
                             # do nothing;
                             pass
+
+            # Update our index
+            if os.path.isdir(base_dir):
+                size, oldest = _dir_stat(base_dir)
+                records.append(PersistentStoreIndex.record(
+                    namespace, size, oldest,
+                    accessed=entry.get('a') if entry else None))
+
+            else:
+                records.append(PersistentStoreIndex.record(namespace))
+
+        index.append(*records)
+
+        if action and prune_all:
+            # Track when our path was last pruned in it's entirety
+            index.prune()
+
         return _map
 
+    @staticmethod
+    def disk_prune_schedule(path, interval, expires=None):
+        """
+        Prunes the path provided (see disk_prune()) in the background if it
+        hasn't been pruned by us (or another process) within the interval
+        (in seconds) specified.
+
+        The thread performing the prune is returned, otherwise None is
+        returned if a prune was not due.
+        """
+
+        now = time.time()
+        with _PRUNE_LOCK:
+            if _PRUNE_SCHEDULE.get(path, 0) > now:
+                # Not due yet
+                return None
+
+            _PRUNE_SCHEDULE[path] = now + interval
+
+        def _prune():
+            index = PersistentStoreIndex(path)
+            index.load()
+            if index.pruned is not None \
+                    and index.pruned + interval > time.time():
+                # Another process pruned our path recently
+                with _PRUNE_LOCK:
+                    _PRUNE_SCHEDULE[path] = index.pruned + interval
+                return
+
+            logger.debug('Persistent storage background prune of: %s', path)
+            PersistentStore.disk_prune(path, expires=expires, action=True)
+
+        thread = threading.Thread(
+            target=_prune, name='apprise-storage-prune', daemon=True)
+        thread.start()
+        return thread
+
     def size(self, exclude=True, lazy=True):
         """
         Returns the total size of the persistent storage in bytes
         """
 
-        if lazy and self.__cache_size is not None:
+        if lazy and exclude in self.__cache_size:
             # Take an early exit
-            return self.__cache_size
+            return self.__cache_size[exclude]
 
         elif self.__mode == PersistentStoreMode.MEMORY:
             # Take an early exit
-            self.__cache_size = 0
-            return self.__cache_size
+            self.__cache_size.update({True: 0, False: 0})
+            return self.__cache_size[exclude]
+
+        if not lazy or self.__file_stats is None:
+            # Get a list of files (file paths) in the given directory
+            file_stats = {}
+            for path in self.files(exclude=False, lazy=False):
+                try:
+                    st = os.stat(path)
+                    file_stats[path] = (st.st_size, st.st_mtime)
+
+                except (OSError, IOError):
+                    # FileNotFoundError, or Permission error of some kind
+                    continue
+
+            self.__file_stats = file_stats
 
-        # Get a list of files (file paths) in the given directory
         try:
-            self.__cache_size = sum(
-                [os.stat(path).st_size for path in
-                    self.files(exclude=exclude, lazy=lazy)])
+            self.__cache_size[exclude] = sum(
+                [size for path, (size, _) in self.__file_stats.items()
+                 if not exclude or not self.__excluded(path)])
 
         except (OSError, IOError):
             # We can't access the directory or it does not exist
-            self.__cache_size = 0
+            self.__cache_size[exclude] = 0
 
-        return self.__cache_size
+        return self.__cache_size[exclude]
 
     def __del__(self):
         """
         Deconstruction of our object
         """
 
-        if self.__mode == PersistentStoreMode.AUTO:
+        if self.__mode == PersistentStoreMode.AUTO or self.__timer:
             # Flush changes to disk
             self.flush()
 
+    @_synchronized
     def __delitem__(self, key):
         """
         Remove a cache entry by it's key
@@ -1462,6 +2672,7 @@ class PersistentStore:
             if self._cache[key].persistent:
                 # Set our dirty flag in advance
                 self.__dirty = True
+                self.__changed(key)
 
             # Store our new cache
             del self._cache[key]
@@ -1470,12 +2681,12 @@ class PersistentStore:
             # Nothing to do
             raise
 
-        if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
-            # Flush changes to disk
-            self.flush()
+        # Flush changes to disk (if required)
+        self.__flush_changes()
 
         return
 
+    @_synchronized
     def __contains__(self, key):
         """
         Verify if our storage contains the key specified or not.
@@ -1485,8 +2696,12 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             return False
 
+        # Acquire any changes made by other processes
+        self.__refresh()
+
         return key in self._cache and self._cache[key]
 
+    @_synchronized
     def __setitem__(self, key, value):
         """
         Sets a cache value without disrupting existing settings in place
@@ -1505,10 +2720,10 @@ class PersistentStore:
             if self._cache[key].persistent:
                 # Set our dirty flag in advance
                 self.__dirty = True
+                self.__changed(key)
 
-        if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
-            # Flush changes to disk
-            self.flush()
+        # Flush changes to disk (if required)
+        self.__flush_changes()
 
         return
 
@@ -1526,6 +2741,7 @@ class PersistentStore:
 
         return result
 
+    @_synchronized
     def keys(self):
         """
         Returns our keys
@@ -1534,8 +2750,12 @@ class PersistentStore:
             # There are no keys to return
             return {}.keys()
 
+        # Acquire any changes made by other processes
+        self.__refresh()
+
         return self._cache.keys()
 
+    @_synchronized
     def delete(self, *args, all=None, temp=None, cache=None, validate=True):
         """
         Manages our file space and tidys it up
@@ -1551,6 +2771,7 @@ class PersistentStore:
         valid_key_re = re.compile(
             r'^(?P<key>.+)(' +
             re.escape(self.__backup_extension) +
+            r'|' + re.escape(self.__journal_extension) +
             r'|' + re.escape(self.__extension) + r')$', re.I)
 
         # Default asignments
@@ -1566,8 +2787,11 @@ class PersistentStore:
             self._cache.clear()
             # Reset dirt flag
             self.__dirty = False
+            self.__changes.clear()
+            self.__compact = False
 
-        for path in self.files(exclude=False):
+        # Scan our namespace; content may have been placed in it by others
+        for path in self.files(exclude=False, lazy=False):
 
             # Some information we use to validate the actions of our clean()
             # call. This is so we don't remove anything we shouldn't
@@ -1645,9 +2869,14 @@ class PersistentStore:
                     'Failed to remove persistent file: %s', ppath)
                 logger.debug('Persistent Storage Exception: %s', str(e))
 
+        if cache:
+            # Our journal (if any) was removed above
+            self.__journal_records = 0
+
         # Reset our reference variables
-        self.__cache_size = None
+        self.__cache_size.clear()
         self.__cache_files.clear()
+        self.__file_stats = None
 
         return not has_error
 
@@ -1661,6 +2890,16 @@ class PersistentStore:
             f'{self.__cache_key}{self.__extension}',
         )
 
+    @property
+    def journal_file(self):
+        """
+        Returns the full path to the cache journal
+        """
+        return os.path.join(
+            self.__base_path,
+            f'{self.__cache_key}{self.__journal_extension}',
+        )
+
     @property
     def path(self):
         """
@@ -1668,9 +2907,145 @@ class PersistentStore:
         """
         return self.__base_path
 
+    @property
+    def journal(self):
+        """
+        Returns whether or not our cache changes are journaled
+        """
+        return self.__journal
+
+    @property
+    def codec(self):
+        """
+        Returns the codec our cache file is written with
+        """
+        return self.__codec
+
+    @property
+    def flush_interval(self):
+        """
+        Returns the number of seconds our changes may be held in memory
+        before they're written to disk (in FLUSH mode)
+        """
+        return self.__flush_interval
+
     @property
     def mode(self):
         """
         Returns the full path to the namespace directory
         """
         return self.__mode
+
+
+class PersistentStoreRegistry:
+    """
+    A process-wide registry that hands out the same PersistentStore object
+    to everyone requesting the same namespace (within the same storage path
+    and with the same settings).  A namespace's cache is therefore only ever
+    loaded from disk once no matter how many Apprise objects make use of it.
+
+    Stores are reference counted; they're flushed to disk once the last
+    reference to them is released and kept (idle) for re-use afterwards.
+    """
+
+    # The maximum number of idle (unreferenced) stores we hold on to
+    max_idle = 128
+
+    def __init__(self):
+        """
+        Initialize our registry
+        """
+
+        # Serializes access to our registry
+        self.__lock = threading.Lock()
+
+        # Our stores (and their reference count) keyed by their settings;
+        # ordered from the least to the most recently acquired
+        self.__stores = OrderedDict()
+
+        # Maps each of our stores back to their key
+        self.__keys = {}
+
+    def acquire(self, namespace='default', path=None, mode=None, **kwargs):
+        """
+        Returns the PersistentStore for the namespace specified; the same
+        arguments accepted by PersistentStore() are accepted here.
+
+        Memory based stores are never shared.
+        """
+
+        if not isinstance(path, str) or mode == PersistentStoreMode.MEMORY:
+            # There is nothing to gain by sharing our store
+            return PersistentStore(
+                namespace=namespace, path=path, mode=mode, **kwargs)
+
+        key = (path_decode(path), namespace, mode,
+               tuple(sorted(kwargs.items())))
+
+        with self.__lock:
+            entry = self.__stores.get(key)
+            if entry is None:
+                store = PersistentStore(
+                    namespace=namespace, path=path, mode=mode, **kwargs)
+
+                if store.mode == PersistentStoreMode.MEMORY:
+                    # Our store could not be initialized on disk
+                    return store
+
+                entry = self.__stores[key] = [store, 0]
+                self.__keys[id(store)] = key
+
+            # Update our reference count
+            entry[1] += 1
+            self.__stores.move_to_end(key)
+            return entry[0]
+
+    def release(self, store):
+        """
+        Releases a reference to a store previously acquired; once it is no
+        longer referenced it's changes are written to disk
+        """
+
+        with self.__lock:
+            key = self.__keys.get(id(store))
+            entry = self.__stores.get(key)
+            if entry is None or entry[0] is not store:
+                # Not a store we manage
+                return
+
+            entry[1] = max(0, entry[1] - 1)
+            if entry[1]:
+                # Still in use
+                return
+
+            # Drop our least recently used idle stores
+            self.__stores.move_to_end(key)
+            idle = [k for k, (_, refs) in self.__stores.items() if not refs]
+            for k in idle[:max(0, len(idle) - self.max_idle)]:
+                self.__keys.pop(id(self.__stores.pop(k)[0]), None)
+
+        # Keep our content on disk consistent with what we hold in memory
+        store.flush()
+
+    def clear(self):
+        """
+        Writes all of our stores to disk and forgets about them
+        """
+
+        with self.__lock:
+            stores = [store for store, _ in self.__stores.values()]
+            self.__stores.clear()
+            self.__keys.clear()
+
+        for store in stores:
+            store.flush()
+
+    def __len__(self):
+        """
+        Returns the number of stores we hold
+        """
+        return len(self.__stores)
+
+
+# Our process-wide PersistentStore registry
+STORE_REGISTRY = PersistentStoreRegistry()
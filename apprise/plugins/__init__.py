@@ -433,16 +433,14 @@ def url_to_dict(url, secure_logging=True):
     # swap hash (#) tag values with their html version
     _url = url.replace('/#', '/%23')
 
-    # CWE-312 (Secure Logging) Handling
-    loggable_url = url if not secure_logging else cwe312_url(url)
-
     # Attempt to acquire the schema at the very least to allow our plugins to
     # determine if they can make a better interpretation of a URL geared for
     # them.
     schema = GET_SCHEMA_RE.match(_url)
     if schema is None:
         # Not a valid URL; take an early exit
-        logger.error('Unsupported URL: {}'.format(loggable_url))
+        logger.error('Unsupported URL: {}'.format(
+            url if not secure_logging else cwe312_url(url)))
         return None
 
     # Ensure our schema is always in lower case
@@ -459,7 +457,8 @@ def url_to_dict(url, secure_logging=True):
                 break
 
         if not results:
-            logger.error('Unparseable URL {}'.format(loggable_url))
+            logger.error('Unparseable URL {}'.format(
+                url if not secure_logging else cwe312_url(url)))
             return None
 
         logger.trace('URL {} unpacked as:{}{}'.format(
@@ -472,7 +471,8 @@ def url_to_dict(url, secure_logging=True):
         results = N_MGR[schema].parse_url(_url)
         if not results:
             logger.error('Unparseable {} URL {}'.format(
-                N_MGR[schema].service_name, loggable_url))
+                N_MGR[schema].service_name,
+                url if not secure_logging else cwe312_url(url)))
             return None
 
         logger.trace('{} URL {} unpacked as:{}{}'.format(
@@ -35,6 +35,7 @@ import requests
 
 from .base import NotifyBase
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import is_phone_no
 from ..utils import parse_bool
 from ..utils import parse_phone_no
@@ -116,6 +117,9 @@ class NotifyAfricasTalking(NotifyBase):
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # The maximum amount of phone numbers that can reside within a single
     # batch transfer
     default_batch_size = 50
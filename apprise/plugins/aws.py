@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2024, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+# Common Amazon Web Services (AWS) handling shared by our AWS based
+# notification services (such as SNS and SES)
+#
+# Signature Version 4 (SigV4) Details:
+# - https://docs.aws.amazon.com/IAM/latest/UserGuide/\
+#       create-signed-request.html
+#
+import re
+import hmac
+import threading
+from hashlib import sha256
+from datetime import datetime
+from datetime import timezone
+from collections import OrderedDict
+from xml.etree import ElementTree
+
+# AWS Authentication Details
+AWS_AUTH_VERSION = 'AWS4'
+AWS_AUTH_ALGORITHM = 'AWS4-HMAC-SHA256'
+AWS_AUTH_REQUEST = 'aws4_request'
+
+# Define ourselves a set of directives we want to keep if found in an AWS
+# response and then identify the value we want to map them to in our
+# response object
+AWS_RESPONSE_KEEP_MAP = {
+    'RequestId': 'request_id',
+    'TopicArn': 'topic_arn',
+    'MessageId': 'message_id',
+
+    # Error Message Handling
+    'Type': 'error_type',
+    'Code': 'error_code',
+    'Message': 'error_message',
+}
+
+
+class SigningKeyCache:
+    """
+    A process wide cache of our derived AWS (SigV4) signing keys.
+
+    A signing key is the product of four chained HMAC operations and it only
+    changes daily for a given secret, region and service.
+    """
+
+    def __init__(self):
+        """
+        Initialize our cache
+        """
+        self.__lock = threading.Lock()
+        self.__entries = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, secret_access_key, date, region, service):
+        """
+        Returns the signing key for the specified date (in the format of
+        YYYYMMDD), region and service; it is only derived if it was not
+        already cached.
+        """
+
+        # We never keep a copy of the secret itself as part of our key
+        key = (
+            sha256(secret_access_key.encode('utf-8')).digest(),
+            region, service)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry and entry[0] == date:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+        signing_key = aws_signing_key(
+            secret_access_key, date, region, service)
+
+        with self.__lock:
+            # Any key derived for another day is simply replaced
+            self.__entries[key] = (date, signing_key)
+
+        return signing_key
+
+    def clear(self):
+        """
+        Empties our cache and resets our metrics
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        """
+        Returns the number of signing keys cached
+        """
+        return len(self.__entries)
+
+
+# Our signing keys are shared between all of our AWS instances
+SIGNING_KEY_CACHE = SigningKeyCache()
+
+
+def aws_signing_key(secret_access_key, date, region, service):
+    """
+    Derives the AWS (SigV4) signing key for the specified date (in the format
+    of YYYYMMDD), region and service.
+    """
+    signing_key = (AWS_AUTH_VERSION + secret_access_key).encode('utf-8')
+    for msg in (date, region, service, AWS_AUTH_REQUEST):
+        signing_key = hmac.new(
+            signing_key, msg.encode('utf-8'), sha256).digest()
+
+    return signing_key
+
+
+def aws_prepare_request(payload, access_key_id, secret_access_key, region,
+                        service, host, user_agent, canonical_uri='/',
+                        reference=None):
+    """
+    Takes the intended payload and returns the (signed) headers for it.
+
+    The payload is presumed to have been already urlencoded()
+
+    """
+
+    # Define our AWS header
+    headers = {
+        'User-Agent': user_agent,
+        'Content-Type': 'application/x-www-form-urlencoded; charset=utf-8',
+
+        # Populated below
+        'Content-Length': 0,
+        'Authorization': None,
+        'X-Amz-Date': None,
+    }
+
+    if reference is None:
+        # Get a reference time (used for header construction)
+        reference = datetime.now(timezone.utc)
+
+    # Provide Content-Length
+    headers['Content-Length'] = str(len(payload))
+
+    # Amazon Date Format
+    date = reference.strftime('%Y%m%d')
+    amzdate = reference.strftime('%Y%m%dT%H%M%SZ')
+    headers['X-Amz-Date'] = amzdate
+
+    # Credential Scope
+    scope = '{date}/{region}/{service}/{request}'.format(
+        date=date,
+        region=region,
+        service=service,
+        request=AWS_AUTH_REQUEST,
+    )
+
+    # Similar to headers; but a subset.  keys must be lowercase
+    signed_headers = OrderedDict([
+        ('content-type', headers['Content-Type']),
+        ('host', host),
+        ('x-amz-date', headers['X-Amz-Date']),
+    ])
+
+    #
+    # Build Canonical Request Object
+    #
+    canonical_request = '\n'.join([
+        # Method
+        u'POST',
+
+        # URL
+        canonical_uri,
+
+        # Query String (none set for POST)
+        '',
+
+        # Header Content (must include \n at end!)
+        # All entries except characters in amazon date must be
+        # lowercase
+        '\n'.join(['%s:%s' % (k, v)
+                  for k, v in signed_headers.items()]) + '\n',
+
+        # Header Entries (in same order identified above)
+        ';'.join(signed_headers.keys()),
+
+        # Payload
+        sha256(payload.encode('utf-8')).hexdigest(),
+    ])
+
+    # Prepare Unsigned Signature
+    to_sign = '\n'.join([
+        AWS_AUTH_ALGORITHM,
+        amzdate,
+        scope,
+        sha256(canonical_request.encode('utf-8')).hexdigest(),
+    ])
+
+    # Generate our signature using our (cached) signing key
+    signature = hmac.new(
+        SIGNING_KEY_CACHE.get(secret_access_key, date, region, service),
+        to_sign.encode('utf-8'), sha256).hexdigest()
+
+    # Our Authorization header
+    headers['Authorization'] = ', '.join([
+        '{algorithm} Credential={key}/{scope}'.format(
+            algorithm=AWS_AUTH_ALGORITHM,
+            key=access_key_id,
+            scope=scope,
+        ),
+        'SignedHeaders={signed_headers}'.format(
+            signed_headers=';'.join(signed_headers.keys()),
+        ),
+        'Signature={signature}'.format(signature=signature),
+    ])
+
+    return headers
+
+
+def aws_response_to_dict(aws_response):
+    """
+    Takes an AWS Response object as input and returns it as a dictionary
+    but not befor extracting out what is useful to us first.
+
+    eg:
+      IN:
+        <CreateTopicResponse
+              xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+          <CreateTopicResult>
+            <TopicArn>arn:aws:sns:us-east-1:000000000000:abcd</TopicArn>
+               </CreateTopicResult>
+           <ResponseMetadata>
+           <RequestId>604bef0f-369c-50c5-a7a4-bbd474c83d6a</RequestId>
+           </ResponseMetadata>
+       </CreateTopicResponse>
+
+      OUT:
+       {
+          type: 'CreateTopicResponse',
+          request_id: '604bef0f-369c-50c5-a7a4-bbd474c83d6a',
+          message_id: None,
+          topic_arn: 'arn:aws:sns:us-east-1:000000000000:abcd',
+       }
+    """
+
+    # A default response object that we'll manipulate as we pull more data
+    # from our AWS Response object
+    response = {
+        'type': None,
+        'request_id': None,
+        'message_id': None,
+    }
+
+    try:
+        # we build our tree, but not before first eliminating any
+        # reference to namespacing (if present) as it makes parsing
+        # the tree so much easier.
+        root = ElementTree.fromstring(
+            re.sub(' xmlns="[^"]+"', '', aws_response, count=1))
+
+        # Store our response tag object name
+        response['type'] = str(root.tag)
+
+        # Iterate over our AWS Response to extract the fields we're
+        # interested in in efforts to populate our response object.
+        for element in root.iter():
+            if len(element) == 0 and element.tag in AWS_RESPONSE_KEEP_MAP:
+                response[AWS_RESPONSE_KEEP_MAP[element.tag]] = \
+                    (element.text).strip()
+
+    except (ElementTree.ParseError, TypeError):
+        # bad data just causes us to generate a bad response
+        pass
+
+    return response
@@ -28,6 +28,9 @@
 
 import asyncio
 import re
+import weakref
+import threading
+import concurrent.futures as cf
 from functools import partial
 
 from ..url import URLBase
@@ -38,12 +41,248 @@ from ..common import NotifyFormat
 from ..common import NOTIFY_FORMATS
 from ..common import OverflowMode
 from ..common import OVERFLOW_MODES
+from ..common import OverflowUnit
 from ..common import PersistentStoreMode
 from ..locale import gettext_lazy as _
-from ..persistent_store import PersistentStore
+from ..persistent_store import STORE_REGISTRY
 from ..apprise_attachment import AppriseAttachment
 
 
+class TargetExecutor:
+    """
+    A process wide thread pool that plugins hand their per-target deliveries
+    to (see NotifyBase._send_targets()).  It is only created once it is
+    first needed.
+    """
+
+    # The maximum number of threads delivering to targets at once (across
+    # all plugins)
+    max_workers = 32
+
+    def __init__(self):
+        """
+        Initialize our executor
+        """
+        self.__lock = threading.Lock()
+        self.__executor = None
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedules fn(*args, **kwargs) to be executed and returns it's Future
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = cf.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='apprise-target')
+
+            return self.__executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """
+        Releases our threads; a new pool is created if we're used again
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Our shared per-target executor
+TARGET_EXECUTOR = TargetExecutor()
+
+# The GSM 03.38 alphabet; characters found in its extension table are sent
+# with an escape character (and therefore take up 2 septets each)
+GSM7_BASIC_CHARS = frozenset(
+    '@\u00a3$\u00a5\u00e8\u00e9\u00f9\u00ec\u00f2\u00c7\n\u00d8\u00f8\r'
+    '\u00c5\u00e5\u0394_\u03a6\u0393\u039b\u03a9\u03a0\u03a8\u03a3\u0398'
+    '\u039e\u00c6\u00e6\u00df\u00c9 !"#\u00a4%&\'()*+,-./0123456789:;<=>?'
+    '\u00a1ABCDEFGHIJKLMNOPQRSTUVWXYZ\u00c4\u00d6\u00d1\u00dc\u00a7\u00bf'
+    'abcdefghijklmnopqrstuvwxyz\u00e4\u00f6\u00f1\u00fc\u00e0')
+GSM7_EXTENDED_CHARS = frozenset('\f^{}\\[~]|\u20ac')
+GSM7_CHARS = GSM7_BASIC_CHARS | GSM7_EXTENDED_CHARS
+
+
+class OverflowCounter:
+    """
+    Measures text in the OverflowUnit specified.
+
+    The text as a whole is measured directly.  Running totals are only built
+    (looking at every character once) the first time part of the text has to
+    be measured; they allow any part of it to be measured (and split up)
+    without having to slice it first.
+    """
+
+    def __init__(self, text, unit=OverflowUnit.CHARACTER):
+        """
+        Initialize our counter
+        """
+        self.text = text
+        self.unit = unit
+
+        # The cost of our entire text (once measured)
+        self.__length = None
+
+        # Entry i holds the cost of text[:i]; built on demand
+        self.__cost = None
+
+        # SMS only; entry i holds the UCS-2 cost of text[:i] along with the
+        # number of characters in it that GSM 03.38 can't represent
+        self.__ucs2 = None
+        self.__other = None
+
+    def __measure(self):
+        """
+        Returns the cost of our entire text
+        """
+        if self.unit == OverflowUnit.BYTE:
+            return len(self.text.encode('utf-8', 'surrogatepass'))
+
+        if GSM7_CHARS.issuperset(self.text):
+            # Characters found in our extension table take up 2 septets
+            return len(self.text) + sum(
+                self.text.count(ch) for ch in GSM7_EXTENDED_CHARS)
+
+        # Our content must be sent as UCS-2; 16 bit characters measured in
+        # 7 bit septets
+        return (len(self.text.encode(
+            'utf-16-le', 'surrogatepass')) // 2 * 16 + 6) // 7
+
+    def __totals(self):
+        """
+        Builds our running totals (if they haven't been already)
+        """
+        if self.__cost is not None:
+            return
+
+        if self.unit == OverflowUnit.BYTE:
+            self.__cost = [0]
+            cost = 0
+            for ch in self.text:
+                o = ord(ch)
+                cost += 1 if o < 0x80 else 2 if o < 0x800 \
+                    else 3 if o < 0x10000 else 4
+                self.__cost.append(cost)
+
+        else:
+            self.__cost, self.__ucs2, self.__other = [0], [0], [0]
+            cost = ucs2 = other = 0
+            for ch in self.text:
+                if ch in GSM7_BASIC_CHARS:
+                    cost += 1
+
+                elif ch in GSM7_EXTENDED_CHARS:
+                    cost += 2
+
+                else:
+                    other += 1
+
+                ucs2 += 1 if ord(ch) < 0x10000 else 2
+                self.__cost.append(cost)
+                self.__ucs2.append(ucs2)
+                self.__other.append(other)
+
+    def length(self, start=0, end=None):
+        """
+        Returns the cost of text[start:end]
+        """
+        if self.unit not in (OverflowUnit.BYTE, OverflowUnit.SMS):
+            # Characters
+            return (len(self.text) if end is None else end) - start
+
+        if not start and (end is None or end == len(self.text)):
+            # Our entire text
+            if self.__length is None:
+                self.__length = self.__measure()
+            return self.__length
+
+        end = len(self.text) if end is None else end
+        self.__totals()
+
+        if self.__other is not None and \
+                self.__other[end] - self.__other[start]:
+            # Our content must be sent as UCS-2; 16 bit characters measured
+            # in 7 bit septets
+            return ((self.__ucs2[end] - self.__ucs2[start]) * 16 + 6) // 7
+
+        return self.__cost[end] - self.__cost[start]
+
+    def spans(self, limit, start=0):
+        """
+        A generator returning (start, end) index pairs that break up our
+        text (from start onwards) into blocks that cost no more than limit.
+
+        Blocks are broken on a line (or word) boundary so long as doing so
+        leaves them at least half full; they are cut where they have to be
+        otherwise.  Characters are simply counted off in fixed size blocks
+        when that is how we measure our text.
+        """
+        total = len(self.text)
+
+        if limit < 1:
+            # Nothing fits
+            return
+
+        if self.unit not in (OverflowUnit.BYTE, OverflowUnit.SMS):
+            # Fixed width blocks
+            for i in range(start, total, limit):
+                yield (i, min(i + limit, total))
+            return
+
+        while start < total:
+            end = start
+            line = word = 0
+            while end < total and self.length(start, end + 1) <= limit:
+                ch = self.text[end]
+                end += 1
+                if ch == '\n':
+                    line = end
+
+                elif ch.isspace():
+                    word = end
+
+            if end == total:
+                yield (start, end)
+                return
+
+            if end == start:
+                # A single character exceeds our limit; send it on its own
+                end = start + 1
+
+            elif line and (line - start) * 2 >= end - start:
+                # Break on our line so long as we're not left with a block
+                # that is less than half full
+                end = line
+
+            elif word and (word - start) * 2 >= end - start:
+                # The same applies to breaking on a word
+                end = word
+
+            yield (start, end)
+            start = end
+
+    def truncate(self, limit):
+        """
+        Returns the longest part of our text (from its start) that fits
+        within limit
+        """
+        if self.unit not in (OverflowUnit.BYTE, OverflowUnit.SMS):
+            return self.text[:limit]
+
+        # Our cost only ever grows with our text; find where we exceed limit
+        lo, hi = 0, len(self.text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.length(0, mid) <= limit:
+                lo = mid
+
+            else:
+                hi = mid - 1
+
+        return self.text[:lo]
+
+
 class NotifyBase(URLBase):
     """
     This is the base class for all notification services
@@ -122,6 +361,10 @@ class NotifyBase(URLBase):
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 32768
 
+    # The unit body_maxlen and title_maxlen are measured in when our content
+    # is truncated or split
+    overflow_unit = OverflowUnit.CHARACTER
+
     # Defines the maximum allowable characters in the title; set this to zero
     # if a title can't be used. Titles that are not used but are defined are
     # automatically placed into the body
@@ -160,6 +403,15 @@ class NotifyBase(URLBase):
     # isn't set in the same call to your notify() function.
     attachment_support = False
 
+    # The maximum number of targets a plugin delivers to at the same time
+    # when it hands them off to _send_targets(); set this to 1 to deliver to
+    # them one after another.
+    target_concurrency = 4
+
+    # Services whose upstream API accepts several recipients in a single
+    # request can raise this; _batches() groups targets by this size.
+    default_batch_size = 1
+
     # Default Title HTML Tagging
     # When a title is specified for a notification service that doesn't accept
     # titles, by default apprise tries to give a plesant view and convert the
@@ -591,6 +843,9 @@ class NotifyBase(URLBase):
             response.append({'body': body, 'title': title})
             return response
 
+        # Our content is measured in the unit our service counts it in
+        counter = OverflowCounter(body, self.overflow_unit)
+
         # a value of '2' allows for the \r\n that is applied when
         # amalgamating the title
         overflow_buffer = max(2, self.overflow_buffer) \
@@ -604,14 +859,16 @@ class NotifyBase(URLBase):
 
         # Handle situations where our body and title are amalamated into one
         # calculation
+        title_len = OverflowCounter(title, self.overflow_unit).length()
         title_maxlen = self.title_maxlen \
             if not self.overflow_amalgamate_title \
-            else min(len(title) + self.overflow_max_display_count_width,
+            else min(title_len + self.overflow_max_display_count_width,
                      self.title_maxlen, self.body_maxlen)
 
-        if len(title) > title_maxlen:
+        if title_len > title_maxlen:
             # Truncate our Title
-            title = title[:title_maxlen].rstrip()
+            title = OverflowCounter(title, self.overflow_unit) \
+                .truncate(title_maxlen).rstrip()
 
         if self.overflow_amalgamate_title and (
                 self.body_maxlen - overflow_buffer) >= title_maxlen:
@@ -623,14 +880,15 @@ class NotifyBase(URLBase):
                 if not self.overflow_amalgamate_title else \
                 (self.body_maxlen - overflow_buffer)
 
-        if body_maxlen > 0 and len(body) <= body_maxlen:
+        if body_maxlen > 0 and counter.length() <= body_maxlen:
             response.append({'body': body, 'title': title})
             return response
 
         if overflow == OverflowMode.TRUNCATE:
             # Truncate our body and return
             response.append({
-                'body': body[:body_maxlen].lstrip('\r\n\x0b\x0c').rstrip(),
+                'body': counter.truncate(body_maxlen)
+                .lstrip('\r\n\x0b\x0c').rstrip(),
                 'title': title,
             })
             # For truncate mode, we're done now
@@ -655,7 +913,7 @@ class NotifyBase(URLBase):
                 # forced off, but no body exists
                 self.overflow_amalgamate_title and body_maxlen <= 0):
 
-            show_counter = title and len(body) > body_maxlen and \
+            show_counter = title and counter.length() > body_maxlen and \
                 ((self.overflow_amalgamate_title and
                   body_maxlen >= self.overflow_display_count_threshold) or
                  (not self.overflow_amalgamate_title and
@@ -670,8 +928,8 @@ class NotifyBase(URLBase):
                 # introduce padding
                 body_maxlen -= overflow_buffer
 
-                count = int(len(body) / body_maxlen) \
-                    + (1 if len(body) % body_maxlen else 0)
+                spans = list(counter.spans(body_maxlen))
+                count = len(spans)
 
                 # Detect padding and prepare template
                 digits = len(str(count))
@@ -681,41 +939,39 @@ class NotifyBase(URLBase):
                 overflow_display_count_width = 4 + (digits * 2)
                 if overflow_display_count_width <= \
                         self.overflow_max_display_count_width:
-                    if len(title) > \
+                    if OverflowCounter(title, self.overflow_unit).length() > \
                             title_maxlen - overflow_display_count_width:
                         # Truncate our title further
-                        title = title[:title_maxlen -
-                                      overflow_display_count_width]
+                        title = OverflowCounter(title, self.overflow_unit) \
+                            .truncate(
+                                title_maxlen - overflow_display_count_width)
 
                 else:  # Way to many messages to display
                     show_counter = False
 
+            else:
+                spans = counter.spans(body_maxlen)
+
             response = [{
-                'body': body[i: i + body_maxlen]
-                .lstrip('\r\n\x0b\x0c').rstrip(),
+                'body': body[i: j].lstrip('\r\n\x0b\x0c').rstrip(),
                 'title': title + (
                     '' if not show_counter else
-                    template.format(idx, count))} for idx, i in
-                enumerate(range(0, len(body), body_maxlen), start=1)]
+                    template.format(idx, count))} for idx, (i, j) in
+                enumerate(spans, start=1)]
 
         else:   # Display title once and move on
             response = []
             try:
-                i = range(0, len(body), body_maxlen)[0]
+                i, j = next(iter(counter.spans(body_maxlen)))
 
                 response.append({
-                    'body': body[i: i + body_maxlen]
-                    .lstrip('\r\n\x0b\x0c').rstrip(),
+                    'body': body[i: j].lstrip('\r\n\x0b\x0c').rstrip(),
                     'title': title,
                 })
 
-            except (ValueError, IndexError):
-                # IndexError:
-                #  - This happens if there simply was no body to display
-
-                # ValueError:
-                #  - This happens when body_maxlen < 0 (due to title being
-                #    so large)
+            except StopIteration:
+                # This happens if there simply was no body to display or
+                # when body_maxlen <= 0 (due to title being so large)
 
                 # No worries; send title along
                 response.append({
@@ -724,18 +980,76 @@ class NotifyBase(URLBase):
                 })
 
                 # Ensure our start is set properly
-                body_maxlen = 0
+                j = 0
 
             # Now re-calculate based on the increased length
-            for i in range(body_maxlen, len(body), self.body_maxlen):
+            for i, j in counter.spans(self.body_maxlen, start=j):
                 response.append({
-                    'body': body[i: i + self.body_maxlen]
-                    .lstrip('\r\n\x0b\x0c').rstrip(),
+                    'body': body[i: j].lstrip('\r\n\x0b\x0c').rstrip(),
                     'title': '',
                 })
 
         return response
 
+    def _send_targets(self, send_fn, targets, *args, **kwargs):
+        """
+        Calls send_fn(target, *args, **kwargs) for each of the targets
+        specified and returns True only if every one of them did.
+
+        Up to target_concurrency targets are delivered to at the same time
+        using our shared TARGET_EXECUTOR.  Plugins continue to call
+        throttle() before each request as they always have; it is safe to do
+        so from several threads and keeps the requests spaced apart.
+        """
+
+        targets = list(targets)
+        concurrency = min(self.target_concurrency, len(targets))
+        if concurrency <= 1:
+            # Deliver to our targets one after another
+            return all([send_fn(target, *args, **kwargs)
+                        for target in targets])
+
+        has_error = False
+        pending = set()
+        for target in targets:
+            if len(pending) >= concurrency:
+                # Wait for a delivery to complete before starting another
+                done, pending = cf.wait(
+                    pending, return_when=cf.FIRST_COMPLETED)
+                for future in done:
+                    if not future.result():
+                        has_error = True
+
+            pending.add(
+                TARGET_EXECUTOR.submit(send_fn, target, *args, **kwargs))
+
+        for future in cf.as_completed(pending):
+            if not future.result():
+                has_error = True
+
+        return not has_error
+
+    def _batches(self, targets, batch_size=None):
+        """
+        Returns the targets specified grouped into lists of no more than
+        batch_size entries each (default_batch_size if not otherwise set).
+        """
+
+        batch_size = max(1, batch_size or self.default_batch_size)
+        targets = list(targets)
+        return [targets[index:index + batch_size]
+                for index in range(0, len(targets), batch_size)]
+
+    def _batch_count(self, targets, batch_size=None):
+        """
+        Returns the number of requests _batches() would produce for the
+        targets specified; handy when calculating len().
+        """
+
+        batch_size = max(1, batch_size or self.default_batch_size)
+        total = targets if isinstance(targets, int) else len(targets)
+        return int(total / batch_size) + (1 if total % batch_size else 0)
+
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
         Should preform the actual notification itself.
@@ -855,10 +1169,18 @@ class NotifyBase(URLBase):
 
         """
         if self.__store is None:
-            # Initialize our persistent store for use
-            self.__store = PersistentStore(
+            # Acquire our persistent store for use; it is shared with all
+            # other plugins using the same namespace (and storage path)
+            self.__store = STORE_REGISTRY.acquire(
                 namespace=self.url_id(),
                 path=self.asset.storage_path,
-                mode=self.asset.storage_mode)
+                mode=self.asset.storage_mode,
+                journal=self.asset.storage_journal,
+                flush_interval=self.asset.storage_flush_interval,
+                codec=self.asset.storage_codec,
+                prune_interval=self.asset.storage_prune_interval)
+
+            # Release our store once we're no longer in use
+            weakref.finalize(self, STORE_REGISTRY.release, self.__store)
 
         return self.__store
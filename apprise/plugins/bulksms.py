@@ -39,6 +39,7 @@ from itertools import chain
 from .base import NotifyBase
 from ..url import PrivacyMode
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import is_phone_no
 from ..utils import parse_phone_no
 from ..utils import parse_bool
@@ -100,6 +101,9 @@ class NotifyBulkSMS(NotifyBase):
     # The maximum length of the body
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # The maximum amount of texts that can go out in one batch
     default_batch_size = 4000
 
@@ -45,6 +45,7 @@ from json import dumps
 from .base import NotifyBase
 from ..url import PrivacyMode
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import is_phone_no
 from ..utils import parse_phone_no
 from ..utils import parse_bool
@@ -79,6 +80,9 @@ class NotifyClickSend(NotifyBase):
     # The maximum length of the body
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
@@ -26,18 +26,24 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import atexit
+import base64
 import dataclasses
 import os
 import re
 import smtplib
+import threading
+import time
 import typing as t
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
+from email.message import Message
 from email.utils import formataddr, make_msgid
 from email.header import Header
 from email import charset
+from email import encoders
 import hashlib
 
 from socket import error as SocketError
@@ -45,6 +51,7 @@ from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 
+from .. import exception
 from ..apprise_attachment import AppriseAttachment
 from .base import NotifyBase
 from ..url import PrivacyMode
@@ -347,6 +354,165 @@ class EmailMessage:
     body: str
 
 
+class SMTPConnectionPool:
+    """
+    Retains authenticated SMTP sessions between notifications so that the
+    connection, TLS handshake and login do not need to be repeated for
+    every email sent.
+
+    Sessions are keyed on the server, port, secure mode, certificate
+    verification and credentials used and are shared across all NotifyEmail
+    instances in the process.  Sessions idle for longer than idle_timeout
+    are closed the next time our pool is used.
+    """
+
+    # The number of seconds an idle session is retained for
+    idle_timeout = 60
+
+    # The maximum number of idle sessions retained per key
+    max_idle = 4
+
+    # The reply code a healthy server responds to a NOOP with
+    noop_reply_code = 250
+
+    def __init__(self):
+        """
+        Initialize our pool
+        """
+
+        self.__lock = threading.Lock()
+
+        # key -> list of (session, last used)
+        self.__idle = {}
+
+    @staticmethod
+    def key(host, port, secure_mode, user=None, password=None, verify=True):
+        """
+        Returns the key sessions are pooled against
+        """
+
+        return (
+            host, port, secure_mode, bool(verify), user,
+            hashlib.sha256(password.encode('utf-8')).hexdigest()
+            if password else None)
+
+    def acquire(self, key):
+        """
+        Returns a healthy idle session previously released under the key
+        specified or None if there isn't one.
+        """
+
+        while True:
+            with self.__lock:
+                # Drop every session that idled for too long
+                expired = self.__expire(time.monotonic())
+
+                sessions = self.__idle.get(key)
+                session = sessions.pop()[0] if sessions else None
+
+            for entry in expired:
+                self.close(entry)
+
+            if session is None:
+                return None
+
+            try:
+                # Verify our server is still listening to us
+                reply = session.noop()
+                if isinstance(reply, tuple) \
+                        and reply[0] == self.noop_reply_code:
+                    return session
+
+            except (SocketError, smtplib.SMTPException):
+                pass
+
+            # Our session is no longer usable
+            self.close(session)
+
+    def release(self, key, session):
+        """
+        Returns a session to our pool so that it can be re-used
+        """
+
+        now = time.monotonic()
+        with self.__lock:
+            sessions = self.__idle.setdefault(key, [])
+            sessions.append((session, now))
+
+            # Drop any sessions that exceed the number we retain
+            expired = [
+                entry[0] for entry in sessions[:-self.max_idle]]
+            del sessions[:-self.max_idle]
+
+            # Drop any sessions that idled for too long
+            expired.extend(self.__expire(now))
+
+        for entry in expired:
+            self.close(entry)
+
+    def __expire(self, now):
+        """
+        Removes (and returns) the sessions that have been idle for longer
+        than idle_timeout; this should only be called while our lock is held
+        """
+
+        expired = []
+        for key in list(self.__idle.keys()):
+            sessions = self.__idle[key]
+            while sessions and now - sessions[0][1] > self.idle_timeout:
+                expired.append(sessions.pop(0)[0])
+
+            if not sessions:
+                del self.__idle[key]
+
+        return expired
+
+    def clear(self):
+        """
+        Gracefully closes all of our idle sessions
+        """
+
+        with self.__lock:
+            sessions = [
+                entry[0] for entries in self.__idle.values()
+                for entry in entries]
+            self.__idle.clear()
+
+        for session in sessions:
+            self.close(session)
+
+    @staticmethod
+    def close(session):
+        """
+        Gracefully terminates a session with the server
+        """
+
+        try:
+            session.quit()
+
+        except (SocketError, smtplib.SMTPException, RuntimeError):
+            # Our connection was already lost
+            session.close()
+
+    def __len__(self):
+        """
+        Returns the number of idle sessions retained
+        """
+        return sum(len(entries) for entries in self.__idle.values())
+
+
+# Used to prepare our message content for submission when pipelining (see
+# NotifyEmail._sendmail()); just as smtplib.sendmail() does
+SMTP_EOL_RE = re.compile(r'(?:\r\n|\n|\r(?!\n))')
+SMTP_PERIOD_RE = re.compile(br'(?m)^\.')
+
+# Our shared pool of SMTP sessions
+SMTP_POOL = SMTPConnectionPool()
+
+# Gracefully close our sessions when we exit
+atexit.register(SMTP_POOL.clear)
+
+
 class NotifyEmail(NotifyBase):
     """
     A wrapper to Email Notifications
@@ -368,6 +534,11 @@ class NotifyEmail(NotifyBase):
     # Support attachments
     attachment_support = True
 
+    # The number of bytes of an attachment we read into memory at a time
+    # while encoding it; this must be a multiple of 57 so that our encoded
+    # content lines up along the 76 character lines email expects
+    attach_chunk_size = 57 * 1024
+
     # There is no reason a PGP Public Key should exceed 8K in size
     # If it is more than this, then it is not accepted
     max_pgp_public_key_size = 8000
@@ -482,6 +653,12 @@ class NotifyEmail(NotifyBase):
             'default': '',
             'map_to': 'pgp_key',
         },
+        'pool': {
+            'name': _('Reuse SMTP Sessions'),
+            'type': 'bool',
+            'default': True,
+            'map_to': 'use_pool',
+        },
     })
 
     # Define any kwargs we're using
@@ -494,7 +671,7 @@ class NotifyEmail(NotifyBase):
 
     def __init__(self, smtp_host=None, from_addr=None, secure_mode=None,
                  targets=None, cc=None, bcc=None, reply_to=None, headers=None,
-                 use_pgp=None, pgp_key=None, **kwargs):
+                 use_pgp=None, pgp_key=None, use_pool=None, **kwargs):
         """
         Initialize Email Object
 
@@ -537,6 +714,11 @@ class NotifyEmail(NotifyBase):
         self.use_pgp = use_pgp if not None \
             else self.template_args['pgp']['default']
 
+        # Our SMTP sessions are shared with other notifications unless
+        # we've been told otherwise
+        self.use_pool = self.template_args['pool']['default'] \
+            if use_pool is None else bool(use_pool)
+
         if self.use_pgp and not PGP_SUPPORT:
             self.logger.warning(
                 'PGP Support is not available on this installation; '
@@ -791,6 +973,76 @@ class NotifyEmail(NotifyBase):
             self.logger.warning('PGP Support unavailable')
             return False
 
+        # Prepare our message content (and attachments) once; it is shared
+        # by every recipient we notify
+        if self.notify_format == NotifyFormat.HTML:
+            base = MIMEMultipart("alternative")
+            base.attach(MIMEText(
+                convert_between(
+                    NotifyFormat.HTML, NotifyFormat.TEXT, body),
+                'plain', 'utf-8')
+            )
+            base.attach(MIMEText(body, 'html', 'utf-8'))
+        else:
+            base = MIMEText(body, 'plain', 'utf-8')
+
+        if attach and self.attachment_support:
+            mixed = MIMEMultipart("mixed")
+            mixed.attach(base)
+            # Now store our attachments
+            for no, attachment in enumerate(attach, start=1):
+                if not attachment:
+                    # We could not load the attachment; take an early
+                    # exit since this isn't what the end user wanted
+
+                    # We could not access the attachment
+                    self.logger.error(
+                        'Could not access attachment {}.'.format(
+                            attachment.url(privacy=True)))
+
+                    return False
+
+                self.logger.debug(
+                    'Preparing Email attachment {}'.format(
+                        attachment.url(privacy=True)))
+
+                try:
+                    # Encode our attachment a block at a time (along the
+                    # same 76 character line boundaries the email
+                    # package uses) instead of reading it all into
+                    # memory first
+                    app = MIMEApplication(''.join(
+                        base64.encodebytes(chunk).decode('ascii')
+                        for chunk in attachment.chunks(
+                            size=self.attach_chunk_size)),
+                        _encoder=encoders.encode_noop)
+
+                except exception.AppriseException:
+                    # We could not access the attachment
+                    self.logger.error(
+                        'Could not access attachment {}.'.format(
+                            attachment.url(privacy=True)))
+                    return False
+
+                app['Content-Transfer-Encoding'] = 'base64'
+                app.set_type(attachment.mimetype)
+
+                # Prepare our attachment name
+                filename = attachment.name \
+                    if attachment.name else f'file{no:03}.dat'
+
+                app.add_header(
+                    'Content-Disposition',
+                    'attachment; filename="{}"'.format(
+                        Header(filename, 'utf-8')),
+                )
+                mixed.attach(app)
+            base = mixed
+
+        # Our content is only rendered once; the headers unique to each
+        # recipient are inserted into it afterwards
+        content = self._split_message(base)
+
         messages: t.List[EmailMessage] = []
 
         # Create a copy of the targets list
@@ -841,75 +1093,30 @@ class NotifyEmail(NotifyBase):
             self.logger.debug(
                 'Delivery: {}:{}'.format(self.smtp_host, self.port))
 
-            # Prepare Email Message
-            if self.notify_format == NotifyFormat.HTML:
-                base = MIMEMultipart("alternative")
-                base.attach(MIMEText(
-                    convert_between(
-                        NotifyFormat.HTML, NotifyFormat.TEXT, body),
-                    'plain', 'utf-8')
-                )
-                base.attach(MIMEText(body, 'html', 'utf-8'))
-            else:
-                base = MIMEText(body, 'plain', 'utf-8')
-
-            if attach and self.attachment_support:
-                mixed = MIMEMultipart("mixed")
-                mixed.attach(base)
-                # Now store our attachments
-                for no, attachment in enumerate(attach, start=1):
-                    if not attachment:
-                        # We could not load the attachment; take an early
-                        # exit since this isn't what the end user wanted
-
-                        # We could not access the attachment
-                        self.logger.error(
-                            'Could not access attachment {}.'.format(
-                                attachment.url(privacy=True)))
-
-                        return False
-
-                    self.logger.debug(
-                        'Preparing Email attachment {}'.format(
-                            attachment.url(privacy=True)))
-
-                    with open(attachment.path, "rb") as abody:
-                        app = MIMEApplication(abody.read())
-                        app.set_type(attachment.mimetype)
-
-                        # Prepare our attachment name
-                        filename = attachment.name \
-                            if attachment.name else f'file{no:03}.dat'
-
-                        app.add_header(
-                            'Content-Disposition',
-                            'attachment; filename="{}"'.format(
-                                Header(filename, 'utf-8')),
-                        )
-                        mixed.attach(app)
-                base = mixed
-
+            message = content
             if self.use_pgp:
                 self.logger.debug("Securing email with PGP Encryption")
                 # Set our header information to include in the encryption
-                base['From'] = formataddr(
-                    (None, self.from_addr[1]), charset='utf-8')
-                base['To'] = formataddr((None, to_addr), charset='utf-8')
-                base['Subject'] = Header(title, self._get_charset(title))
+                # and apply it
+                encrypted_content = self.pgp_encrypt_message(
+                    self._join_message(content, (
+                        ('From', formataddr(
+                            (None, self.from_addr[1]), charset='utf-8')),
+                        ('To', formataddr((None, to_addr), charset='utf-8')),
+                        ('Subject', Header(title, self._get_charset(title))),
+                    )))
 
-                # Apply our encryption
-                encrypted_content = self.pgp_encrypt_message(base.as_string())
                 if not encrypted_content:
                     self.logger.warning('Unable to PGP encrypt email')
                     # Unable to send notification
                     return False
 
                 # prepare our messsage
-                base = MIMEMultipart(
+                encrypted = MIMEMultipart(
                     "encrypted", protocol="application/pgp-encrypted")
 
                 # Store Autocrypt header (DeltaChat Support)
-                base.add_header(
+                encrypted.add_header(
                     "Autocrypt",
                     "addr=%s; prefer-encrypt=mutual" % formataddr(
                         (False, to_addr), charset='utf-8'))
@@ -917,64 +1124,145 @@ class NotifyEmail(NotifyBase):
                 # Set Encryption Info Part
                 enc_payload = MIMEText("Version: 1", "plain")
                 enc_payload.set_type("application/pgp-encrypted")
-                base.attach(enc_payload)
+                encrypted.attach(enc_payload)
 
                 enc_payload = MIMEBase("application", "octet-stream")
                 enc_payload.set_payload(encrypted_content)
-                base.attach(enc_payload)
+                encrypted.attach(enc_payload)
+
+                message = self._split_message(encrypted)
 
             # Apply any provided custom headers
-            for k, v in self.headers.items():
-                base[k] = Header(v, self._get_charset(v))
-
-            base['Subject'] = Header(title, self._get_charset(title))
-            base['From'] = formataddr(self.from_addr, charset='utf-8')
-            base['To'] = formataddr((to_name, to_addr), charset='utf-8')
-            base['Message-ID'] = make_msgid(domain=self.smtp_host)
-            base['Date'] = \
-                datetime.now(timezone.utc)\
-                .strftime("%a, %d %b %Y %H:%M:%S +0000")
-            base['X-Application'] = self.app_id
+            headers = [
+                (k, Header(v, self._get_charset(v)))
+                for k, v in self.headers.items()]
+
+            headers.extend((
+                ('Subject', Header(title, self._get_charset(title))),
+                ('From', formataddr(self.from_addr, charset='utf-8')),
+                ('To', formataddr((to_name, to_addr), charset='utf-8')),
+                ('Message-ID', make_msgid(domain=self.smtp_host)),
+                ('Date', datetime.now(timezone.utc)
+                    .strftime("%a, %d %b %Y %H:%M:%S +0000")),
+                ('X-Application', self.app_id),
+            ))
 
             if cc:
-                base['Cc'] = ','.join(cc)
+                headers.append(('Cc', ','.join(cc)))
 
             if reply_to:
-                base['Reply-To'] = ','.join(reply_to)
+                headers.append(('Reply-To', ','.join(reply_to)))
 
-            message = EmailMessage(
+            messages.append(EmailMessage(
                 recipient=to_addr,
                 to_addrs=[to_addr] + list(cc) + list(bcc),
-                body=base.as_string())
-            messages.append(message)
+                body=self._join_message(message, headers)))
 
         return self.submit(messages)
 
-    def submit(self, messages: t.List[EmailMessage]):
+    @staticmethod
+    def _split_message(message):
+        """
+        Renders the MIME message specified and returns it's headers and body
+        as a tuple so that additional headers can be added to it later
+        """
+        return tuple(message.as_string().split('\n\n', 1))
 
-        # error tracking (used for function return)
-        has_error = False
+    @staticmethod
+    def _join_message(content, headers):
+        """
+        Returns the rendered message content (as returned by
+        _split_message()) with the additional headers specified
+        """
 
-        # bind the socket variable to the current namespace
-        socket = None
+        extra = Message()
+        for k, v in headers:
+            extra[k] = v
 
-        # Always call throttle before any remote server i/o is made
-        self.throttle()
+        return content[0] + '\n' + extra.as_string() + content[1]
 
-        try:
-            self.logger.debug('Connecting to remote SMTP server...')
-            socket_func = smtplib.SMTP
-            if self.secure_mode == SecureMailMode.SSL:
-                self.logger.debug('Securing connection with SSL...')
-                socket_func = smtplib.SMTP_SSL
-
-            socket = socket_func(
-                self.smtp_host,
-                self.port,
-                None,
-                timeout=self.socket_connect_timeout,
-            )
+    def _sendmail(self, session, message):
+        """
+        Submits our message over the session provided; if our server supports
+        pipelining (RFC 2920) then our envelope is sent in a single round
+        trip instead of one per command.
+        """
+
+        features = getattr(session, 'esmtp_features', None)
+        if not isinstance(features, dict) or 'pipelining' not in features:
+            session.sendmail(self.from_addr[1], message.to_addrs, message.body)
+            return
+
+        # Prepare our content just as smtplib.sendmail() would
+        body = SMTP_EOL_RE.sub('\r\n', message.body).encode('ascii')
+        options = ' size=%d' % len(body) if 'size' in features else ''
+
+        body = SMTP_PERIOD_RE.sub(b'..', body)
+        if not body.endswith(b'\r\n'):
+            body += b'\r\n'
+
+        session.send(''.join(
+            ['mail FROM:%s%s\r\n' % (
+                smtplib.quoteaddr(self.from_addr[1]), options)]
+            + ['rcpt TO:%s\r\n' % smtplib.quoteaddr(addr)
+               for addr in message.to_addrs]
+            + ['data\r\n']))
+
+        # Acquire our responses (in the order our commands were sent)
+        sender = session.getreply()
+        refused = {}
+        for addr in message.to_addrs:
+            code, resp = session.getreply()
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+
+        # We only deliver our content if there is someone to deliver it to
+        deliver = sender[0] == 250 and len(refused) < len(message.to_addrs)
+
+        code, resp = session.getreply()
+        if code == 354:
+            # Our server is expecting content; if we have no one to deliver
+            # it to then we end it immediately (RFC 2920) so that it is
+            # rejected and our session remains usable
+            session.send((body if deliver else b'') + b'.\r\n')
+            code, resp = session.getreply()
+            if deliver and code == 250:
+                # Delivered
+                return
+
+        # Our transaction failed; reset it.  If our server drops us while
+        # doing so, SMTPServerDisconnected is raised and our session is not
+        # used again
+        session.rset()
+
+        if sender[0] != 250:
+            raise smtplib.SMTPSenderRefused(
+                sender[0], sender[1], self.from_addr[1])
+
+        if len(refused) == len(message.to_addrs):
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        raise smtplib.SMTPDataError(code, resp)
+
+    def connect(self):
+        """
+        Establishes a new (authenticated) session with our SMTP server
+        """
+
+        self.logger.debug('Connecting to remote SMTP server...')
+        socket_func = smtplib.SMTP
+        if self.secure_mode == SecureMailMode.SSL:
+            self.logger.debug('Securing connection with SSL...')
+            socket_func = smtplib.SMTP_SSL
+
+        socket = socket_func(
+            self.smtp_host,
+            self.port,
+            None,
+            timeout=self.socket_connect_timeout,
+        )
 
+        try:
             if self.secure_mode == SecureMailMode.STARTTLS:
                 # Handle Secure Connections
                 self.logger.debug('Securing connection with STARTTLS...')
@@ -985,13 +1273,55 @@ class NotifyEmail(NotifyBase):
                 self.logger.debug('Applying user credentials...')
                 socket.login(self.user, self.password)
 
+        except (SocketError, smtplib.SMTPException, RuntimeError):
+            # Gracefully terminate the connection with the server
+            SMTP_POOL.close(socket)
+            raise
+
+        return socket
+
+    def submit(self, messages: t.List[EmailMessage]):
+
+        # error tracking (used for function return)
+        has_error = False
+
+        # bind the socket variable to the current namespace
+        socket = None
+
+        # Sessions are only re-used if they remain healthy
+        reusable = True
+
+        # The key our session is pooled against
+        key = SMTP_POOL.key(
+            self.smtp_host, self.port, self.secure_mode,
+            self.user, self.password, self.verify_certificate)
+
+        # Always call throttle before any remote server i/o is made
+        self.throttle()
+
+        try:
+            socket = SMTP_POOL.acquire(key) if self.use_pool else None
+            if socket is None:
+                socket = self.connect()
+
+            else:
+                self.logger.debug('Re-using SMTP session...')
+
             # Send the emails
             for message in messages:
                 try:
-                    socket.sendmail(
-                        self.from_addr[1],
-                        message.to_addrs,
-                        message.body)
+                    try:
+                        self._sendmail(socket, message)
+
+                    except smtplib.SMTPServerDisconnected as e:
+                        # The server dropped our session; establish a new
+                        # one and try again
+                        self.logger.debug(
+                            'SMTP session lost (%s); reconnecting...', e)
+                        socket.close()
+                        socket = None
+                        socket = self.connect()
+                        self._sendmail(socket, message)
 
                     self.logger.info('Sent Email to %s', message.recipient)
 
@@ -1003,6 +1333,16 @@ class NotifyEmail(NotifyBase):
                     # Mark as failure
                     has_error = True
 
+                    if not isinstance(e, smtplib.SMTPException) \
+                            or isinstance(e, smtplib.SMTPServerDisconnected):
+                        # Our session can not be trusted any further; the
+                        # server otherwise just rejected this message
+                        reusable = False
+
+                    if socket is None:
+                        # We failed to re-establish our session
+                        break
+
         except (SocketError, smtplib.SMTPException, RuntimeError) as e:
             self.logger.warning(
                 'Connection error while submitting email to "%s"',
@@ -1011,11 +1351,17 @@ class NotifyEmail(NotifyBase):
 
             # Mark as failure
             has_error = True
+            reusable = False
 
         finally:
-            # Gracefully terminate the connection with the server
             if socket is not None:
-                socket.quit()
+                if reusable and self.use_pool:
+                    # Retain our session for the next notification
+                    SMTP_POOL.release(key, socket)
+
+                else:
+                    # Gracefully terminate the connection with the server
+                    SMTP_POOL.close(socket)
 
         # Reduce our dictionary (eliminate expired keys if any)
         self.pgp_public_keys = {
@@ -1257,6 +1603,10 @@ class NotifyEmail(NotifyBase):
             params['pgp_key'] = NotifyEmail.quote(
                 self.pgp_key[0].url(privacy=privacy), safe=':')
 
+        if not self.use_pool:
+            # Our sessions are not shared
+            params['pool'] = 'no'
+
         # Append our headers into our parameters
         params.update({'+{}'.format(k): v for k, v in self.headers.items()})
 
@@ -1468,6 +1818,12 @@ class NotifyEmail(NotifyBase):
         if 'reply' in results['qsd'] and len(results['qsd']['reply']):
             results['reply_to'] = results['qsd']['reply']
 
+        # Handle our SMTP session pooling
+        if 'pool' in results['qsd'] and len(results['qsd']['pool']):
+            results['use_pool'] = parse_bool(
+                results['qsd']['pool'],
+                NotifyEmail.template_args['pool']['default'])
+
         results['from_addr'] = from_addr
         results['smtp_host'] = smtp_host
 
@@ -38,6 +38,7 @@ from json import dumps
 
 from .base import NotifyBase
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..locale import gettext_lazy as _
 
 
@@ -72,6 +73,9 @@ class NotifyFreeMobile(NotifyBase):
     # SMS Messages are restricted in size
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # Define our tokens; these are the minimum tokens required required to
     # be passed into this function (as arguments). The syntax appends any
     # previously defined in the base package and builds onto them
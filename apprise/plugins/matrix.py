@@ -32,6 +32,7 @@
 #
 import re
 import requests
+import threading
 from markdown import markdown
 from json import dumps
 from json import loads
@@ -321,6 +322,9 @@ class NotifyMatrix(NotifyBase):
         # This gets incremented for each request made against the v3 API
         self.transaction_id = 0
 
+        # Guards our transaction ID when rooms are messaged in parallel
+        self._transaction_lock = threading.Lock()
+
         # Place an image inline with the message body
         self.include_image = self.template_args['image']['default'] \
             if include_image is None else include_image
@@ -628,12 +632,6 @@ class NotifyMatrix(NotifyBase):
                     'There were no Matrix rooms specified to notify.')
                 return False
 
-        # Create a copy of our rooms to join and message
-        rooms = list(self.rooms)
-
-        # Initiaize our error tracking
-        has_error = False
-
         attachments = None
         if attach and self.attachment_support:
             attachments = self._send_attachments(attach)
@@ -641,11 +639,10 @@ class NotifyMatrix(NotifyBase):
                 # take an early exit
                 return False
 
-        while len(rooms) > 0:
-
-            # Get our room
-            room = rooms.pop(0)
-
+        def _send(room):
+            """
+            Joins and messages a single room
+            """
             # Get our room_id from our response
             room_id = self._room_join(room)
             if not room_id:
@@ -654,8 +651,7 @@ class NotifyMatrix(NotifyBase):
                     'Could not join Matrix room {}.'.format((room)))
 
                 # Mark our failure
-                has_error = True
-                continue
+                return False
 
             # Acquire our image url if we're configured to do so
             image_url = None if not self.include_image else \
@@ -665,13 +661,16 @@ class NotifyMatrix(NotifyBase):
             if self.version == MatrixVersion.V3:
                 path = '/rooms/{}/send/m.room.message/{}'.format(
                     NotifyMatrix.quote(room_id),
-                    self.transaction_id,
+                    self._next_transaction_id(),
                 )
 
             else:
                 path = '/rooms/{}/send/m.room.message'.format(
                     NotifyMatrix.quote(room_id))
 
+            # Tracks the delivery of our attachments
+            attached = True
+
             if self.version == MatrixVersion.V2:
                 #
                 # Attachments don't work beyond V2 at this time
@@ -690,20 +689,17 @@ class NotifyMatrix(NotifyBase):
                         path, payload=image_payload)
                     if not postokay:
                         # Mark our failure
-                        has_error = True
-                        continue
+                        return False
 
                 if attachments:
-                    for attachment in attachments:
-                        attachment['room_id'] = room_id
-                        attachment['type'] = 'm.room.message'
-
-                        postokay, response = self._fetch(
-                            path, payload=attachment)
-                        if not postokay:
-                            # Mark our failure
-                            has_error = True
-                            continue
+                    # Rooms may be messaged in parallel; never alter the
+                    # shared attachment definitions.  Our message is still
+                    # sent if an attachment fails to be
+                    attached = all([
+                        self._fetch(path, payload=dict(
+                            attachment, room_id=room_id,
+                            type='m.room.message'))[0]
+                        for attachment in attachments])
 
             # Define our payload
             payload = {
@@ -739,24 +735,35 @@ class NotifyMatrix(NotifyBase):
             postokay, response = self._fetch(
                 path, payload=payload, method=method)
 
-            # Increment the transaction ID to avoid future messages being
-            # recognized as retransmissions and ignored
-            if self.version == MatrixVersion.V3:
-                self.transaction_id += 1
-                self.store.set(
-                    'transaction_id', self.transaction_id,
-                    expires=self.default_cache_expiry_sec)
-
             if not postokay:
                 # Notify our user
                 self.logger.warning(
                     'Could not send notification Matrix room {}.'.format(room))
 
                 # Mark our failure
-                has_error = True
-                continue
+                return False
+
+            return attached
+
+        # Join and message a copy of our rooms
+        return self._send_targets(_send, list(self.rooms))
 
-        return not has_error
+    def _next_transaction_id(self):
+        """
+        Reserves and returns the next transaction ID.
+
+        The ID is incremented (and cached) right away to avoid future
+        messages being recognized as retransmissions and ignored; rooms may
+        be messaged in parallel so each one must be handed a unique value.
+        """
+        with self._transaction_lock:
+            transaction_id = self.transaction_id
+            self.transaction_id += 1
+            self.store.set(
+                'transaction_id', self.transaction_id,
+                expires=self.default_cache_expiry_sec)
+
+        return transaction_id
 
     def _send_attachments(self, attach):
         """
@@ -778,16 +785,42 @@ class NotifyMatrix(NotifyBase):
                 # unsuppored at this time
                 continue
 
-            postokay, response = \
-                self._fetch('/upload', attachment=attachment)
-            if not (postokay and isinstance(response, dict)):
-                # Failed to perform upload
+            try:
+                # Content we've uploaded before can simply be referenced
+                # again by its content URI
+                cache_key = 'mxc_{}'.format(attachment.sha256())
+                content_uri = self.store.get(cache_key)
+                if not content_uri:
+                    # Our content is streamed directly from disk
+                    with attachment.open() as fp:
+                        postokay, response = self._fetch(
+                            '/upload', payload=fp, attachment=attachment)
+
+                    if not (postokay and isinstance(response, dict)):
+                        # Failed to perform upload
+                        return False
+
+                    # If we get here, we'll have a response that looks like:
+                    # {
+                    #     "content_uri": "mxc://example.com/a-unique-key"
+                    # }
+                    content_uri = response.get('content_uri')
+                    if content_uri:
+                        self.store.set(
+                            cache_key, content_uri,
+                            expires=self.default_cache_expiry_sec)
+
+            except AppriseException:
+                # Our attachment could not be read; this has already been
+                # logged for us
                 return False
 
-            # If we get here, we'll have a response that looks like:
-            # {
-            #     "content_uri": "mxc://example.com/a-unique-key"
-            # }
+            except (OSError, IOError) as e:
+                self.logger.warning(
+                    'An I/O error occurred while reading {}.'.format(
+                        attachment.name if attachment else 'unknown file'))
+                self.logger.debug('I/O Exception: %s', str(e))
+                return False
 
             # FUTURE if self.version == MatrixVersion.V3:
             # FUTURE     # Prepare our payload
@@ -819,7 +852,7 @@ class NotifyMatrix(NotifyBase):
                 },
                 "msgtype": "m.image",
                 "body": "tta.webp",
-                "url": response.get('content_uri'),
+                "url": content_uri,
             })
 
         return payloads
@@ -1252,8 +1285,6 @@ class NotifyMatrix(NotifyBase):
             url += MATRIX_V2_MEDIA_PATH + path
 
             params.update({'filename': attachment.name})
-            with open(attachment.path, 'rb') as fp:
-                payload = fp.read()
 
             # Update our content type
             headers['Content-Type'] = attachment.mimetype
@@ -1291,6 +1322,11 @@ class NotifyMatrix(NotifyBase):
             r = None
 
             try:
+                if attachment:
+                    # Our payload is streamed from our attachment; ensure we
+                    # (re)send it from the start
+                    payload.seek(0)
+
                 r = fn(
                     url,
                     data=dumps(payload) if not attachment else payload,
@@ -36,7 +36,9 @@ import requests
 
 from .base import NotifyBase
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import is_phone_no
+from ..utils import parse_bool
 from ..utils import parse_phone_no
 from ..utils import validate_regex
 from ..locale import gettext_lazy as _
@@ -65,10 +67,17 @@ class NotifyMessageBird(NotifyBase):
     # The maximum length of the body
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
 
+    # The maximum number of recipients accepted by a single MessageBird
+    # message request
+    default_batch_size = 50
+
     # Define object templates
     templates = (
         '{schema}://{apikey}/{source}',
@@ -112,14 +121,22 @@ class NotifyMessageBird(NotifyBase):
         'from': {
             'alias_of': 'source',
         },
+        'batch': {
+            'name': _('Batch Mode'),
+            'type': 'bool',
+            'default': False,
+        },
     })
 
-    def __init__(self, apikey, source, targets=None, **kwargs):
+    def __init__(self, apikey, source, targets=None, batch=False, **kwargs):
         """
         Initialize MessageBird Object
         """
         super().__init__(**kwargs)
 
+        # Prepare Batch Mode Flag
+        self.batch = batch
+
         # API Key (associated with project)
         self.apikey = validate_regex(
             apikey, *self.template_tokens['apikey']['regex'])
@@ -192,15 +209,13 @@ class NotifyMessageBird(NotifyBase):
 
         }
 
-        # Create a copy of the targets list
-        targets = list(self.targets)
+        # Send in batches if identified to do so
+        batch_size = 1 if not self.batch else self.default_batch_size
 
-        while len(targets):
-            # Get our target to notify
-            target = targets.pop(0)
-
-            # Prepare our user
-            payload['recipients'] = '+{}'.format(target)
+        for targets in self._batches(self.targets, batch_size):
+            # Prepare our recipients
+            target = ','.join(['+{}'.format(t) for t in targets])
+            payload['recipients'] = target
 
             # Some Debug Logging
             self.logger.debug(
@@ -262,7 +277,7 @@ class NotifyMessageBird(NotifyBase):
                     self.logger.warning(
                         'Failed to send MessageBird notification to {}: '
                         '{}{}error={}.'.format(
-                            ','.join(target),
+                            target,
                             status_str,
                             ', ' if status_str else '',
                             r.status_code))
@@ -305,8 +320,13 @@ class NotifyMessageBird(NotifyBase):
         Returns the URL built dynamically based on specified arguments.
         """
 
-        # Our URL parameters
-        params = self.url_parameters(privacy=privacy, *args, **kwargs)
+        # Define any URL parameters
+        params = {
+            'batch': 'yes' if self.batch else 'no',
+        }
+
+        # Extend our parameters
+        params.update(self.url_parameters(privacy=privacy, *args, **kwargs))
 
         return '{schema}://{apikey}/{source}/{targets}/?{params}'.format(
             schema=self.secure_protocol,
@@ -320,8 +340,11 @@ class NotifyMessageBird(NotifyBase):
         """
         Returns the number of targets associated with this notification
         """
-        targets = len(self.targets)
-        return targets if targets > 0 else 1
+        #
+        # Factor batch into calculation
+        #
+        batch_size = 1 if not self.batch else self.default_batch_size
+        return max(1, self._batch_count(self.targets, batch_size))
 
     @staticmethod
     def parse_url(url):
@@ -362,4 +385,8 @@ class NotifyMessageBird(NotifyBase):
             results['source'] = \
                 NotifyMessageBird.unquote(results['qsd']['from'])
 
+        # Get Batch Mode Flag
+        results['batch'] = \
+            parse_bool(results['qsd'].get('batch', False))
+
         return results
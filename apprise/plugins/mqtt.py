@@ -35,12 +35,17 @@
 #           /blob/master/src/paho/mqtt/client.py
 import ssl
 import re
+import atexit
+import hashlib
+import weakref
+import threading
 from time import sleep
 from datetime import datetime
 from os.path import isfile
 from .base import NotifyBase
 from ..url import PrivacyMode
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import parse_list
 from ..utils import parse_bool
 from ..locale import gettext_lazy as _
@@ -79,6 +84,163 @@ HUMAN_MQTT_PROTOCOL_MAP = {
 }
 
 
+class MQTTConnection:
+    """
+    A client connection to an MQTT broker which is shared by all of the
+    NotifyMQTT instances publishing to it.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize our connection
+        """
+
+        # Our MQTT Client Object
+        self.client = client
+
+        # Toggled to True once our credentials and TLS settings have been
+        # applied to our client (this can only be done once)
+        self.configured = False
+
+        # Toggled to True once our connection has been established and our
+        # network loop started
+        self.connected = False
+
+        # Serializes the establishing of our connection
+        self.lock = threading.Lock()
+
+    def close(self):
+        """
+        Stops our network loop and disconnects from our broker
+        """
+
+        with self.lock:
+            if not self.connected:
+                return
+
+            self.connected = False
+            try:
+                self.client.loop_stop()
+                self.client.disconnect()
+
+            except Exception:
+                # Our connection was already lost
+                pass
+
+
+class MQTTClientRegistry:
+    """
+    A process-wide registry that hands out the same MQTT connection to
+    everyone publishing to the same broker with the same credentials, TLS
+    and session settings; 50 mqtt:// URLs against the same broker therefore
+    share a single connection (and network loop thread).
+
+    Connections are reference counted; they're closed once the last
+    reference to them is released.
+    """
+
+    def __init__(self):
+        """
+        Initialize our registry
+        """
+
+        # Serializes access to our registry
+        self.__lock = threading.Lock()
+
+        # Our connections (and their reference count) keyed by their settings
+        self.__connections = {}
+
+        # Maps each of our connections back to their key
+        self.__keys = {}
+
+    @staticmethod
+    def key(host, port, user=None, password=None, secure=False,
+            verify=True, ca_certs=None, client_id=None, session=False,
+            protocol=None, transport=None):
+        """
+        Returns the key connections are shared against
+        """
+
+        return (
+            host, port, user,
+            hashlib.sha256(password.encode('utf-8')).hexdigest()
+            if password else None,
+            bool(secure), bool(verify), ca_certs, client_id, bool(session),
+            protocol, transport)
+
+    def acquire(self, key, inflight_messages=None, **kwargs):
+        """
+        Returns the connection associated with the key specified; a new
+        client is created (using the keyword arguments provided) if one
+        doesn't already exist.
+        """
+
+        with self.__lock:
+            entry = self.__connections.get(key)
+            if entry is None:
+                client = mqtt.Client(**kwargs)
+                if inflight_messages is not None:
+                    # Our maximum number of in-flight messages
+                    client.max_inflight_messages_set(inflight_messages)
+
+                connection = MQTTConnection(client)
+                entry = self.__connections[key] = [connection, 0]
+                self.__keys[id(connection)] = key
+
+            # Update our reference count
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, connection):
+        """
+        Releases a reference to a connection previously acquired; once it is
+        no longer referenced it is closed
+        """
+
+        with self.__lock:
+            key = self.__keys.get(id(connection))
+            entry = self.__connections.get(key)
+            if entry is None or entry[0] is not connection:
+                # Not a connection we manage
+                return
+
+            entry[1] -= 1
+            if entry[1] > 0:
+                # Still in use
+                return
+
+            del self.__connections[key]
+            del self.__keys[id(connection)]
+
+        connection.close()
+
+    def clear(self):
+        """
+        Closes all of our connections and forgets about them
+        """
+
+        with self.__lock:
+            connections = [c for c, _ in self.__connections.values()]
+            self.__connections.clear()
+            self.__keys.clear()
+
+        for connection in connections:
+            connection.close()
+
+    def __len__(self):
+        """
+        Returns the number of connections we hold
+        """
+        return len(self.__connections)
+
+
+# Our process-wide MQTT client registry
+MQTT_CLIENTS = MQTTClientRegistry()
+
+# Gracefully disconnect from our brokers when we exit
+atexit.register(MQTT_CLIENTS.clear)
+
+
 class NotifyMQTT(NotifyBase):
     """
     A wrapper for MQTT Notifications
@@ -110,6 +272,9 @@ class NotifyMQTT(NotifyBase):
     # The maximum length a body can be set to
     body_maxlen = 268435455
 
+    # Our maximum length is that of the MQTT packet (in bytes)
+    overflow_unit = OverflowUnit.BYTE
+
     # Use a throttle; but it doesn't need to be so strict since most
     # MQTT server hostings can handle the small bursts of packets and are
     # locally hosted anyway
@@ -281,19 +446,26 @@ class NotifyMQTT(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
-        # Our MQTT Client Object
-        self.client = mqtt.Client(
+        # Our MQTT Connection; it is shared with all other instances
+        # publishing to the same broker using the same settings
+        self.connection = MQTT_CLIENTS.acquire(
+            MQTTClientRegistry.key(
+                self.host, self.port, user=self.user, password=self.password,
+                secure=self.secure, verify=self.verify_certificate,
+                ca_certs=self.ca_certs, client_id=self.client_id,
+                session=self.session, protocol=self.mqtt_protocol,
+                transport=self.mqtt_transport),
+            inflight_messages=self.mqtt_inflight_messages,
             client_id=self.client_id,
             clean_session=not self.session, userdata=None,
             protocol=self.mqtt_protocol, transport=self.mqtt_transport,
         )
 
-        # Our maximum number of in-flight messages
-        self.client.max_inflight_messages_set(self.mqtt_inflight_messages)
+        # Release our connection once we're no longer in use
+        weakref.finalize(self, MQTT_CLIENTS.release, self.connection)
 
-        # Toggled to False once our connection has been established at least
-        # once
-        self.__initial_connect = True
+        # Our MQTT Client Object
+        self.client = self.connection.client
 
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
         """
@@ -309,56 +481,21 @@ class NotifyMQTT(NotifyBase):
         url = '{host}:{port}'.format(host=self.host, port=self.port)
 
         try:
-            if self.__initial_connect:
-                # Our initial connection
-                if self.user:
-                    self.client.username_pw_set(
-                        self.user, password=self.password)
-
-                if self.secure:
-                    if self.ca_certs is None:
-                        self.logger.error(
-                            'MQTT secure communication can not be verified, '
-                            'CA certificates file missing')
+            with self.connection.lock:
+                if not self.connection.connected:
+                    # Our initial connection
+                    if not self._connect(url):
                         return False
 
-                    self.client.tls_set(
-                        ca_certs=self.ca_certs, certfile=None, keyfile=None,
-                        cert_reqs=ssl.CERT_REQUIRED,
-                        tls_version=ssl.PROTOCOL_TLS,
-                        ciphers=None)
-
-                    # Set our TLS Verify Flag
-                    self.client.tls_insecure_set(not self.verify_certificate)
-
-                # Establish our connection
-                if self.client.connect(
-                        self.host, port=self.port,
-                        keepalive=self.mqtt_keepalive) \
-                        != mqtt.MQTT_ERR_SUCCESS:
-                    self.logger.warning(
-                        'An MQTT connection could not be established for {}'.
-                        format(url))
-                    return False
-
-                # Start our client loop
-                self.client.loop_start()
-
-                # Throttle our start otherwise the starting handshaking doesnt
-                # work. I'm not sure if this is a bug or not, but with qos=0,
-                # and without this sleep(), the messages randomly fails to be
-                # delivered.
-                sleep(0.01)
-
-                # Toggle our flag since we never need to enter this area again
-                self.__initial_connect = False
-
-            # Create a copy of the subreddits list
+            # Create a copy of the topics list
             topics = list(self.topics)
 
+            # Our published messages awaiting acknowledgement
+            pending = []
+
             has_error = False
             while len(topics) > 0 and not has_error:
-                # Retrieve our subreddit
+                # Retrieve our topic
                 topic = topics.pop()
 
                 # For logging:
@@ -395,23 +532,34 @@ class NotifyMQTT(NotifyBase):
                     has_error = True
                     break
 
-                elif not result.is_published():
-                    self.logger.debug(
-                        'Blocking until MQTT payload is published...')
-                    reference = datetime.now()
-                    while not has_error and not result.is_published():
-                        # Throttle
-                        sleep(self.mqtt_block_time_sec)
+                # We don't wait for our message to be delivered before
+                # publishing the next one
+                pending.append(result)
 
-                        # Our own throttle so we can abort eventually....
-                        elapsed = (datetime.now() - reference).total_seconds()
-                        if elapsed >= self.socket_read_timeout:
-                            self.logger.warning(
-                                'The MQTT message could not be delivered')
-                            has_error = True
+            # Wait for all of our messages to be delivered together
+            reference = datetime.now()
+            while not has_error:
+                pending = [
+                    result for result in pending
+                    if not result.is_published()]
 
-                # if we reach here; we're at the bottom of our loop
-                # we loop around and do the next topic now
+                if not pending:
+                    break
+
+                self.logger.debug(
+                    'Blocking until %d MQTT payload(s) are published...',
+                    len(pending))
+
+                # Our own throttle so we can abort eventually....
+                elapsed = (datetime.now() - reference).total_seconds()
+                if elapsed >= self.socket_read_timeout:
+                    self.logger.warning(
+                        'The MQTT message could not be delivered')
+                    has_error = True
+                    break
+
+                # Throttle
+                sleep(self.mqtt_block_time_sec)
 
         except ConnectionError as e:
             self.logger.warning(
@@ -438,6 +586,62 @@ class NotifyMQTT(NotifyBase):
 
         return not has_error
 
+    def _connect(self, url):
+        """
+        Establishes our (shared) connection with our broker and starts our
+        network loop.
+
+        This function returns True if we're connected and False if we
+        aren't.
+        """
+
+        if self.secure and self.ca_certs is None:
+            self.logger.error(
+                'MQTT secure communication can not be verified, '
+                'CA certificates file missing')
+            return False
+
+        if not self.connection.configured:
+            if self.user:
+                self.client.username_pw_set(
+                    self.user, password=self.password)
+
+            if self.secure:
+                self.client.tls_set(
+                    ca_certs=self.ca_certs, certfile=None, keyfile=None,
+                    cert_reqs=ssl.CERT_REQUIRED,
+                    tls_version=ssl.PROTOCOL_TLS,
+                    ciphers=None)
+
+                # Set our TLS Verify Flag
+                self.client.tls_insecure_set(not self.verify_certificate)
+
+            self.connection.configured = True
+
+        # Establish our connection
+        if self.client.connect(
+                self.host, port=self.port,
+                keepalive=self.mqtt_keepalive) \
+                != mqtt.MQTT_ERR_SUCCESS:
+            self.logger.warning(
+                'An MQTT connection could not be established for {}'.
+                format(url))
+            return False
+
+        # Start our client loop
+        self.client.loop_start()
+
+        # Throttle our start otherwise the starting handshaking doesnt
+        # work. I'm not sure if this is a bug or not, but with qos=0,
+        # and without this sleep(), the messages randomly fails to be
+        # delivered.
+        sleep(0.01)
+
+        # Toggle our flag since no one sharing our connection ever needs
+        # to establish it again
+        self.connection.connected = True
+        return True
+
     @property
     def url_identifier(self):
         """
@@ -412,10 +412,11 @@ class NotifyOneSignal(NotifyBase):
             payload['small_icon'] = image_url
 
         for category in ONESIGNAL_CATEGORIES:
-            # Create a pointer to our list of targets for specified category
-            targets = self.targets[category]
-            for index in range(0, len(targets), self.batch_size):
-                payload[category] = targets[index:index + self.batch_size]
+            # Batches can only be sent by category (you can't combine
+            # categories into a single batch)
+            for targets in self._batches(
+                    self.targets[category], self.batch_size):
+                payload[category] = targets
 
                 # Track our sent count
                 sent_count += len(payload[category])
@@ -548,18 +549,10 @@ class NotifyOneSignal(NotifyBase):
         #
         # Factor batch into calculation
         #
-        if self.batch_size > 1:
-            # Batches can only be sent by group (you can't combine groups into
-            # a single batch)
-            total_targets = 0
-            for k, m in self.targets.items():
-                targets = len(m)
-                total_targets += int(targets / self.batch_size) + \
-                    (1 if targets % self.batch_size else 0)
-            return total_targets
-
-        # Normal batch count; just count the targets
-        return sum([len(m) for _, m in self.targets.items()])
+        # Batches can only be sent by group (you can't combine groups into
+        # a single batch)
+        return sum([self._batch_count(m, self.batch_size)
+                    for _, m in self.targets.items()])
 
     @staticmethod
     def parse_url(url):
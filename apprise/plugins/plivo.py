@@ -41,6 +41,7 @@ import requests
 from json import dumps
 from .base import NotifyBase
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import parse_bool
 from ..utils import is_phone_no
 from ..utils import parse_phone_no
@@ -74,6 +75,9 @@ class NotifyPlivo(NotifyBase):
     # The maximum length of the body
     body_maxlen = 140
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
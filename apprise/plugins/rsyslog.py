@@ -27,7 +27,10 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import time
+import atexit
 import socket
+import threading
 
 from .base import NotifyBase
 from ..common import NotifyType
@@ -133,6 +136,28 @@ SYSLOG_FACILITY_RMAP = {
     syslog.LOG_LOCAL7: SyslogFacility.LOCAL7,
 }
 
+
+class SyslogMode:
+    """
+    The transports we can deliver our messages over
+    """
+    # Datagrams (RFC 5426)
+    UDP = 'udp'
+
+    # A stream using octet-counting framing (RFC 6587)
+    TCP = 'tcp'
+
+
+SYSLOG_MODES = (
+    SyslogMode.UDP,
+    SyslogMode.TCP,
+)
+
+SYSLOG_SOCKET_TYPE_MAP = {
+    SyslogMode.UDP: socket.SOCK_DGRAM,
+    SyslogMode.TCP: socket.SOCK_STREAM,
+}
+
 # Used as a lookup when handling the Apprise -> Syslog Mapping
 SYSLOG_PUBLISH_MAP = {
     NotifyType.INFO: syslog.LOG_INFO,
@@ -142,6 +167,246 @@ SYSLOG_PUBLISH_MAP = {
 }
 
 
+class RSyslogTransport:
+    """
+    A persistent socket to a remote syslog server.
+
+    The server address is only resolved once (and again after resolve_ttl
+    seconds or an error) and the socket is kept open between notifications.
+    Messages are queued and whoever holds the socket writes everything
+    queued at that time; concurrent notifications to the same server are
+    batched into a single write when using TCP.
+    """
+
+    # The number of seconds a resolved address is trusted for
+    resolve_ttl = 300
+
+    def __init__(self, host, port, mode=SyslogMode.UDP, timeout=None):
+        """
+        Initialize our transport
+        """
+
+        self.host = host
+        self.port = port
+        self.mode = mode
+        self.timeout = timeout
+
+        # Our socket and resolved address (and when it was resolved)
+        self.sock = None
+        self.address = None
+        self.resolved = 0.0
+
+        # Serializes access to our socket
+        self.__lock = threading.Lock()
+
+        # Our messages waiting to be written; each entry is a list of the
+        # encoded message and our result once written
+        self.__queue_lock = threading.Lock()
+        self.__queue = []
+
+    def send(self, payload):
+        """
+        Queues our (encoded) payload and ensures it is written. True is
+        returned if the payload was sent successfully.
+
+        Socket errors are raised.
+        """
+
+        entry = [payload, None]
+        with self.__queue_lock:
+            self.__queue.append(entry)
+
+        with self.__lock:
+            if entry[1] is None:
+                # Our message was not already written by another thread;
+                # take everything queued up until now
+                with self.__queue_lock:
+                    batch, self.__queue = self.__queue, []
+
+                try:
+                    self._write(batch)
+
+                except (OSError, socket.error):
+                    # Our socket is no longer trusted
+                    self.close()
+
+                    for queued in batch:
+                        if queued[1] is None and queued is not entry:
+                            queued[1] = False
+                    raise
+
+        return entry[1]
+
+    def _write(self, batch):
+        """
+        Writes our batch of messages; the result of each is stored with it
+        """
+
+        if self.mode == SyslogMode.TCP:
+            # RFC 6587 (Octet Counting)
+            data = b''.join(
+                b'%d %s' % (len(entry[0]), entry[0]) for entry in batch)
+
+            sent = 0
+            try:
+                sock = self.connect()
+                while sent < len(data):
+                    sent += sock.send(data[sent:])
+
+            except (OSError, socket.error):
+                if sent:
+                    # Part of our batch was already written; writing it all
+                    # again would deliver those messages twice
+                    raise
+
+                # Our connection may have been dropped by the server while
+                # idle; try again once with a new one
+                self.close()
+                self.connect().sendall(data)
+
+            for entry in batch:
+                entry[1] = True
+            return
+
+        sock = self.connect()
+        for entry in batch:
+            entry[1] = sock.sendto(entry[0], self.address) >= len(entry[0])
+
+    def connect(self):
+        """
+        Returns our socket; one is created (and the server address resolved)
+        if we do not already have one.
+        """
+
+        if self.sock is not None \
+                and time.monotonic() - self.resolved <= self.resolve_ttl \
+                and (self.mode != SyslogMode.TCP or self.__connected()):
+            return self.sock
+
+        # Close off anything we were previously using
+        self.close()
+
+        socktype = SYSLOG_SOCKET_TYPE_MAP[self.mode]
+        family, _, proto, _, address = socket.getaddrinfo(
+            self.host, self.port, socket.AF_INET, socktype)[0]
+
+        sock = socket.socket(family, socktype, proto)
+        sock.settimeout(self.timeout)
+
+        if self.mode == SyslogMode.TCP:
+            try:
+                sock.connect(address)
+
+            except (OSError, socket.error):
+                sock.close()
+                raise
+
+        self.sock = sock
+        self.address = address
+        self.resolved = time.monotonic()
+        return sock
+
+    def __connected(self):
+        """
+        Returns False if the server has closed our (idle) TCP connection;
+        checking for this before we write spares us from writing into a
+        connection that has already gone away.
+        """
+
+        timeout = self.sock.gettimeout()
+        try:
+            # Peek (without blocking) at anything waiting to be read; the
+            # server has closed our connection if we reached the end of it
+            self.sock.setblocking(False)
+            return self.sock.recv(1, socket.MSG_PEEK) != b''
+
+        except (BlockingIOError, InterruptedError):
+            # Nothing to read; our connection is still open
+            return True
+
+        except (OSError, socket.error):
+            # Our connection was reset or is otherwise unusable
+            return False
+
+        finally:
+            try:
+                self.sock.settimeout(timeout)
+
+            except (OSError, socket.error):
+                pass
+
+    def close(self):
+        """
+        Closes our socket (if open)
+        """
+
+        if self.sock is not None:
+            try:
+                self.sock.close()
+
+            except (OSError, socket.error):
+                pass
+
+        self.sock = None
+        self.address = None
+
+
+class RSyslogTransportPool:
+    """
+    Retains our transports between notifications; they're keyed on the mode,
+    host, port and timeout they deliver with and are shared across all
+    NotifyRSyslog instances in the process.
+    """
+
+    def __init__(self):
+        """
+        Initialize our pool
+        """
+
+        self.__lock = threading.Lock()
+        self.__transports = {}
+
+    def acquire(self, host, port, mode=SyslogMode.UDP, timeout=None):
+        """
+        Returns the transport associated with the specified server
+        """
+
+        with self.__lock:
+            key = (mode, host, port, timeout)
+            transport = self.__transports.get(key)
+            if transport is None:
+                transport = RSyslogTransport(
+                    host, port, mode=mode, timeout=timeout)
+                self.__transports[key] = transport
+
+            return transport
+
+    def clear(self):
+        """
+        Closes all of our transports
+        """
+
+        with self.__lock:
+            transports = list(self.__transports.values())
+            self.__transports.clear()
+
+        for transport in transports:
+            transport.close()
+
+    def __len__(self):
+        """
+        Returns the number of transports retained
+        """
+        return len(self.__transports)
+
+
+# Our shared pool of syslog transports
+RSYSLOG_POOL = RSyslogTransportPool()
+
+# Gracefully close our sockets when we exit
+atexit.register(RSYSLOG_POOL.clear)
+
+
 class NotifyRSyslog(NotifyBase):
     """
     A wrapper for Remote Syslog Notifications
@@ -205,9 +470,15 @@ class NotifyRSyslog(NotifyBase):
             'default': True,
             'map_to': 'log_pid',
         },
+        'mode': {
+            'name': _('Syslog Mode'),
+            'type': 'choice:string',
+            'values': SYSLOG_MODES,
+            'default': SyslogMode.UDP,
+        },
     })
 
-    def __init__(self, facility=None, log_pid=True, **kwargs):
+    def __init__(self, facility=None, log_pid=True, mode=None, **kwargs):
         """
         Initialize RSyslog Object
         """
@@ -231,6 +502,15 @@ class NotifyRSyslog(NotifyBase):
         # Include PID with each message.
         self.log_pid = log_pid
 
+        # Our transport
+        self.mode = self.template_args['mode']['default'] \
+            if not isinstance(mode, str) else mode.lower()
+        if self.mode not in SYSLOG_MODES:
+            msg = 'An invalid syslog mode ' \
+                  '({}) was specified.'.format(mode)
+            self.logger.warning(msg)
+            raise TypeError(msg)
+
         return
 
     def send(self, body, title='', notify_type=NotifyType.INFO, **kwargs):
@@ -257,20 +537,22 @@ class NotifyRSyslog(NotifyBase):
             payload = '<%d>- %s' % (
                 SYSLOG_PUBLISH_MAP[notify_type] + self.facility * 8, body)
 
-        # send UDP packet to upstream server
+        # send our payload to the upstream server
         self.logger.debug(
-            'RSyslog Host: %s:%d/%s',
-            host, port, SYSLOG_FACILITY_RMAP[self.facility])
+            'RSyslog Host: %s:%d/%s (%s)',
+            host, port, SYSLOG_FACILITY_RMAP[self.facility], self.mode)
         self.logger.debug('RSyslog Payload: %s' % str(payload))
 
-        # our sent bytes
-        sent = 0
+        # Acquire our (shared) connection to the server
+        transport = RSYSLOG_POOL.acquire(
+            host, port, mode=self.mode, timeout=self.socket_connect_timeout)
 
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(self.socket_connect_timeout)
-            sent = sock.sendto(payload.encode('utf-8'), (host, port))
-            sock.close()
+            if not transport.send(payload.encode('utf-8')):
+                self.logger.warning(
+                    'RSyslog failed to send all of the intended '
+                    '%d byte(s)', len(payload))
+                return False
 
         except socket.gaierror as e:
             self.logger.warning(
@@ -290,10 +572,13 @@ class NotifyRSyslog(NotifyBase):
             self.logger.debug('Socket Exception: %s' % str(e))
             return False
 
-        if sent < len(payload):
+        except (OSError, socket.error) as e:
             self.logger.warning(
-                'RSyslog sent %d byte(s) but intended to send %d byte(s)',
-                sent, len(payload))
+                'A socket error occurred sending RSyslog '
+                'notification to %s:%d/%s', host, port,
+                SYSLOG_FACILITY_RMAP[self.facility]
+            )
+            self.logger.debug('Socket Exception: %s' % str(e))
             return False
 
         self.logger.info('Sent RSyslog notification.')
@@ -307,12 +592,19 @@ class NotifyRSyslog(NotifyBase):
         another simliar one. Targets or end points should never be identified
         here.
         """
-        return (
+        identifier = (
             self.protocol, self.host,
             self.port if self.port
             else self.template_tokens['port']['default'],
         )
 
+        if self.mode != self.template_args['mode']['default']:
+            # Our default mode is implied so that our existing URL IDs are
+            # left unchanged
+            identifier += (self.mode, )
+
+        return identifier
+
     def url(self, privacy=False, *args, **kwargs):
         """
         Returns the URL built dynamically based on specified arguments.
@@ -321,6 +613,7 @@ class NotifyRSyslog(NotifyBase):
         # Define any URL parameters
         params = {
             'logpid': 'yes' if self.log_pid else 'no',
+            'mode': self.mode,
         }
 
         # Extend our parameters
@@ -386,4 +679,8 @@ class NotifyRSyslog(NotifyBase):
                 'logpid',
                 NotifyRSyslog.template_args['logpid']['default']))
 
+        # The transport to use
+        if 'mode' in results['qsd'] and len(results['qsd']['mode']):
+            results['mode'] = results['qsd']['mode']
+
         return results
@@ -80,14 +80,10 @@
 #
 
 import re
-import hmac
 import base64
 import requests
-from hashlib import sha256
 from datetime import datetime
 from datetime import timezone
-from collections import OrderedDict
-from xml.etree import ElementTree
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
@@ -96,6 +92,8 @@ from email.header import Header
 from urllib.parse import quote
 
 from .base import NotifyBase
+from .aws import aws_prepare_request
+from .aws import aws_response_to_dict
 from ..url import PrivacyMode
 from ..common import NotifyFormat
 from ..common import NotifyType
@@ -272,11 +270,7 @@ class NotifySES(NotifyBase):
         # AWS Service Details
         self.aws_service_name = 'ses'
         self.aws_canonical_uri = '/'
-
-        # AWS Authentication Details
-        self.aws_auth_version = 'AWS4'
-        self.aws_auth_algorithm = 'AWS4-HMAC-SHA256'
-        self.aws_auth_request = 'aws4_request'
+        self.aws_host = 'email.{}.amazonaws.com'.format(self.aws_region_name)
 
         # Get our From username (if specified)
         self.from_name = from_name
@@ -579,199 +573,25 @@ class NotifySES(NotifyBase):
         The payload is presumed to have been already urlencoded()
 
         """
-
-        # Define our AWS SES header
-        headers = {
-            'User-Agent': self.app_id,
-            'Content-Type': 'application/x-www-form-urlencoded; charset=utf-8',
-
-            # Populated below
-            'Content-Length': 0,
-            'Authorization': None,
-            'X-Amz-Date': None,
-        }
-
-        # Get a reference time (used for header construction)
-        reference = datetime.now(timezone.utc)
-
-        # Provide Content-Length
-        headers['Content-Length'] = str(len(payload))
-
-        # Amazon Date Format
-        amzdate = reference.strftime('%Y%m%dT%H%M%SZ')
-        headers['X-Amz-Date'] = amzdate
-
-        # Credential Scope
-        scope = '{date}/{region}/{service}/{request}'.format(
-            date=reference.strftime('%Y%m%d'),
+        return aws_prepare_request(
+            payload,
+            access_key_id=self.aws_access_key_id,
+            secret_access_key=self.aws_secret_access_key,
             region=self.aws_region_name,
             service=self.aws_service_name,
-            request=self.aws_auth_request,
+            host=self.aws_host,
+            user_agent=self.app_id,
+            canonical_uri=self.aws_canonical_uri,
+            reference=reference,
         )
 
-        # Similar to headers; but a subset.  keys must be lowercase
-        signed_headers = OrderedDict([
-            ('content-type', headers['Content-Type']),
-            ('host', 'email.{region}.amazonaws.com'.format(
-                region=self.aws_region_name)),
-            ('x-amz-date', headers['X-Amz-Date']),
-        ])
-
-        #
-        # Build Canonical Request Object
-        #
-        canonical_request = '\n'.join([
-            # Method
-            u'POST',
-
-            # URL
-            self.aws_canonical_uri,
-
-            # Query String (none set for POST)
-            '',
-
-            # Header Content (must include \n at end!)
-            # All entries except characters in amazon date must be
-            # lowercase
-            '\n'.join(['%s:%s' % (k, v)
-                      for k, v in signed_headers.items()]) + '\n',
-
-            # Header Entries (in same order identified above)
-            ';'.join(signed_headers.keys()),
-
-            # Payload
-            sha256(payload.encode('utf-8')).hexdigest(),
-        ])
-
-        # Prepare Unsigned Signature
-        to_sign = '\n'.join([
-            self.aws_auth_algorithm,
-            amzdate,
-            scope,
-            sha256(canonical_request.encode('utf-8')).hexdigest(),
-        ])
-
-        # Our Authorization header
-        headers['Authorization'] = ', '.join([
-            '{algorithm} Credential={key}/{scope}'.format(
-                algorithm=self.aws_auth_algorithm,
-                key=self.aws_access_key_id,
-                scope=scope,
-            ),
-            'SignedHeaders={signed_headers}'.format(
-                signed_headers=';'.join(signed_headers.keys()),
-            ),
-            'Signature={signature}'.format(
-                signature=self.aws_auth_signature(to_sign, reference)
-            ),
-        ])
-
-        return headers
-
-    def aws_auth_signature(self, to_sign, reference):
-        """
-        Generates a AWS v4 signature based on provided payload
-        which should be in the form of a string.
-        """
-
-        def _sign(key, msg, to_hex=False):
-            """
-            Perform AWS Signing
-            """
-            if to_hex:
-                return hmac.new(key, msg.encode('utf-8'), sha256).hexdigest()
-            return hmac.new(key, msg.encode('utf-8'), sha256).digest()
-
-        _date = _sign((
-            self.aws_auth_version +
-            self.aws_secret_access_key).encode('utf-8'),
-            reference.strftime('%Y%m%d'))
-
-        _region = _sign(_date, self.aws_region_name)
-        _service = _sign(_region, self.aws_service_name)
-        _signed = _sign(_service, self.aws_auth_request)
-        return _sign(_signed, to_sign, to_hex=True)
-
     @staticmethod
     def aws_response_to_dict(aws_response):
         """
         Takes an AWS Response object as input and returns it as a dictionary
         but not befor extracting out what is useful to us first.
-
-        eg:
-          IN:
-
-            <SendRawEmailResponse
-                 xmlns="http://ses.amazonaws.com/doc/2010-12-01/">
-              <SendRawEmailResult>
-                <MessageId>
-                   010f017d87656ee2-a2ea291f-79ea-
-                   44f3-9d25-00d041de3007-000000</MessageId>
-              </SendRawEmailResult>
-              <ResponseMetadata>
-                <RequestId>7abb454e-904b-4e46-a23c-2f4d2fc127a6</RequestId>
-              </ResponseMetadata>
-            </SendRawEmailResponse>
-
-          OUT:
-           {
-             'type': 'SendRawEmailResponse',
-              'message_id': '010f017d87656ee2-a2ea291f-79ea-
-                             44f3-9d25-00d041de3007-000000',
-              'request_id': '7abb454e-904b-4e46-a23c-2f4d2fc127a6',
-           }
         """
-
-        # Define ourselves a set of directives we want to keep if found and
-        # then identify the value we want to map them to in our response
-        # object
-        aws_keep_map = {
-            'RequestId': 'request_id',
-            'MessageId': 'message_id',
-
-            # Error Message Handling
-            'Type': 'error_type',
-            'Code': 'error_code',
-            'Message': 'error_message',
-        }
-
-        # A default response object that we'll manipulate as we pull more data
-        # from our AWS Response object
-        response = {
-            'type': None,
-            'request_id': None,
-            'message_id': None,
-        }
-
-        try:
-            # we build our tree, but not before first eliminating any
-            # reference to namespacing (if present) as it makes parsing
-            # the tree so much easier.
-            root = ElementTree.fromstring(
-                re.sub(' xmlns="[^"]+"', '', aws_response, count=1))
-
-            # Store our response tag object name
-            response['type'] = str(root.tag)
-
-            def _xml_iter(root, response):
-                if len(root) > 0:
-                    for child in root:
-                        # use recursion to parse everything
-                        _xml_iter(child, response)
-
-                elif root.tag in aws_keep_map.keys():
-                    response[aws_keep_map[root.tag]] = (root.text).strip()
-
-            # Recursivly iterate over our AWS Response to extract the
-            # fields we're interested in in efforts to populate our response
-            # object.
-            _xml_iter(root, response)
-
-        except (ElementTree.ParseError, TypeError):
-            # bad data just causes us to generate a bad response
-            pass
-
-        return response
+        return aws_response_to_dict(aws_response)
 
     @property
     def url_identifier(self):
@@ -46,6 +46,7 @@ import json
 
 from .base import NotifyBase
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..locale import gettext_lazy as _
 from ..utils import is_phone_no
 from ..utils import parse_phone_no
@@ -78,6 +79,9 @@ class NotifySFR(NotifyBase):
     # The maximum length of the body
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
@@ -307,9 +307,9 @@ class NotifySignalAPI(NotifyBase):
         # Send in batches if identified to do so
         batch_size = 1 if not self.batch else self.default_batch_size
 
-        for index in range(0, len(self.targets), batch_size):
+        for recipients in self._batches(self.targets, batch_size):
             # Prepare our recipients
-            payload['recipients'] = self.targets[index:index + batch_size]
+            payload['recipients'] = recipients
 
             self.logger.debug('Signal API POST URL: %s (cert_verify=%r)' % (
                 notify_url, self.verify_certificate,
@@ -337,8 +337,8 @@ class NotifySignalAPI(NotifyBase):
                     self.logger.warning(
                         'Failed to send {} Signal API notification{}: '
                         '{}{}error={}.'.format(
-                            len(self.targets[index:index + batch_size]),
-                            ' to {}'.format(self.targets[index])
+                            len(recipients),
+                            ' to {}'.format(recipients[0])
                             if batch_size == 1 else '(s)',
                             status_str,
                             ', ' if status_str else '',
@@ -355,16 +355,15 @@ class NotifySignalAPI(NotifyBase):
                     self.logger.info(
                         'Sent {} Signal API notification{}.'
                         .format(
-                            len(self.targets[index:index + batch_size]),
-                            ' to {}'.format(self.targets[index])
+                            len(recipients),
+                            ' to {}'.format(recipients[0])
                             if batch_size == 1 else '(s)',
                         ))
 
             except requests.RequestException as e:
                 self.logger.warning(
                     'A Connection error occured sending {} Signal API '
-                    'notification(s).'.format(
-                        len(self.targets[index:index + batch_size])))
+                    'notification(s).'.format(len(recipients)))
                 self.logger.debug('Socket Exception: %s' % str(e))
 
                 # Mark our failure
@@ -451,12 +450,7 @@ class NotifySignalAPI(NotifyBase):
         # Factor batch into calculation
         #
         batch_size = 1 if not self.batch else self.default_batch_size
-        targets = len(self.targets)
-        if batch_size > 1:
-            targets = int(targets / batch_size) + \
-                (1 if targets % batch_size else 0)
-
-        return targets
+        return self._batch_count(self.targets, batch_size)
 
     @staticmethod
     def parse_url(url):
@@ -569,12 +569,13 @@ class NotifySlack(NotifyBase):
         else:  # SlackMode.BOT
             url = self.api_url.format('chat.postMessage')
 
-        # Create a copy of the channel list
-        channels = list(self.channels)
-
+        # The channels (or chat ID's) our notification was delivered to
         attach_channel_list = []
-        while len(channels):
-            channel = channels.pop(0)
+
+        def _send_channel(channel, payload):
+            # Each channel gets it's own copy of our payload
+            payload = payload.copy()
+
             if channel is not None:
                 # We'll perform a user lookup if we detect an email
                 email = is_email(channel)
@@ -585,8 +586,7 @@ class NotifySlack(NotifyBase):
                     if not payload['channel']:
                         # Move along; any notifications/logging would have
                         # come from lookup_userid()
-                        has_error = True
-                        continue
+                        return False
 
                 else:  # Channel
                     result = CHANNEL_RE.match(channel)
@@ -598,8 +598,7 @@ class NotifySlack(NotifyBase):
                             "skipping.".format(channel))
 
                         # Mark our failure
-                        has_error = True
-                        continue
+                        return False
 
                     # Store oure content
                     channel, thread_ts = \
@@ -607,12 +606,6 @@ class NotifySlack(NotifyBase):
                     if thread_ts:
                         payload['thread_ts'] = thread_ts
 
-                    elif 'thread_ts' in payload:
-                        # Handle situations where one channel has a thread_id
-                        # specified, and the next does not.  We do not want to
-                        # cary forward the last value specified
-                        del payload['thread_ts']
-
                     if channel[0] == '+':
                         # Treat as encoded id if prefixed with a +
                         payload['channel'] = channel[1:]
@@ -630,8 +623,7 @@ class NotifySlack(NotifyBase):
             response = self._send(url, payload)
             if not response:
                 # Handle any error
-                has_error = True
-                continue
+                return False
 
             # Store the valid channel or chat ID (for DMs) that will
             # be accepted by Slack's attachment method later.
@@ -643,6 +635,12 @@ class NotifySlack(NotifyBase):
                     ' to {}'.format(channel)
                     if channel is not None else ''))
 
+            return True
+
+        # Notify each of our channels
+        if not self._send_targets(_send_channel, self.channels, payload):
+            has_error = True
+
         if attach and self.attachment_support and \
                 self.mode is SlackMode.BOT and attach_channel_list:
             # Send our attachments (can only be done in bot mode)
@@ -685,33 +683,39 @@ class NotifySlack(NotifyBase):
                 # Upload file
                 response = self._send(upload_url, {}, attach=attachment)
 
-                # Send file to channels
+                # Share our file with all of our channels; our content is
+                # only uploaded the once no matter how many channels we
+                # notified
                 # https://api.slack.com/methods/files.completeUploadExternal
-                for channel_id in attach_channel_list:
-                    _payload = {
-                        'files': [{
-                            "id": file_id,
-                            "title": attachment.name,
-                        }],
-                        'channel_id': channel_id
-                    }
-                    _url = self.api_url.format('files.completeUploadExternal')
-                    response = self._send(_url, _payload)
-                    # Expected response
-                    # {
-                    #     "ok": true,
-                    #     "files": [
-                    #         {
-                    #             "id": "F123ABC456",
-                    #             "title": "slack-test"
-                    #         }
-                    #     ]
-                    # }
-                    if not (response and response.get('files')):
-                        self.logger.error('Failed to send file to channel.')
-                        # We failed to send the file to the channel,
-                        # take an early exit
-                        return False
+                _payload = {
+                    'files': [{
+                        "id": file_id,
+                        "title": attachment.name,
+                    }],
+                }
+                if len(attach_channel_list) == 1:
+                    _payload['channel_id'] = attach_channel_list[0]
+
+                else:
+                    _payload['channels'] = ','.join(attach_channel_list)
+
+                _url = self.api_url.format('files.completeUploadExternal')
+                response = self._send(_url, _payload)
+                # Expected response
+                # {
+                #     "ok": true,
+                #     "files": [
+                #         {
+                #             "id": "F123ABC456",
+                #             "title": "slack-test"
+                #         }
+                #     ]
+                # }
+                if not (response and response.get('files')):
+                    self.logger.error('Failed to send file to channel(s).')
+                    # We failed to send the file to the channel(s),
+                    # take an early exit
+                    return False
 
         return not has_error
 
@@ -27,18 +27,17 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import re
-import hmac
+import threading
 import requests
-from hashlib import sha256
-from datetime import datetime
-from datetime import timezone
-from collections import OrderedDict
-from xml.etree import ElementTree
 from itertools import chain
 
 from .base import NotifyBase
+from .aws import aws_prepare_request
+from .aws import aws_response_to_dict
 from ..url import PrivacyMode
 from ..common import NotifyType
+from ..common import OverflowUnit
+from ..common import PersistentStoreMode
 from ..utils import is_phone_no
 from ..utils import parse_list
 from ..utils import validate_regex
@@ -68,6 +67,65 @@ AWS_HTTP_ERROR_MAP = {
 }
 
 
+class TopicArnCache:
+    """
+    A process wide cache of the Amazon Resource Names (ARN) CreateTopic
+    returned for each topic so we only need to ask for them once.
+    """
+
+    def __init__(self):
+        """
+        Initialize our cache
+        """
+        self.__lock = threading.Lock()
+        self.__entries = {}
+
+    @staticmethod
+    def key(region, access_key_id, topic):
+        """
+        Returns the key our Topic ARN is cached against
+        """
+        return (region, access_key_id, topic)
+
+    def get(self, key):
+        """
+        Returns the cached Topic ARN or None if there was no match
+        """
+        with self.__lock:
+            return self.__entries.get(key)
+
+    def set(self, key, arn):
+        """
+        Caches our Topic ARN
+        """
+        with self.__lock:
+            self.__entries[key] = arn
+
+    def pop(self, key):
+        """
+        Removes (and returns) a cached Topic ARN if it exists
+        """
+        with self.__lock:
+            return self.__entries.pop(key, None)
+
+    def clear(self):
+        """
+        Empties our cache
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self):
+        """
+        Returns the number of Topic ARNs cached
+        """
+        return len(self.__entries)
+
+
+# Our Topic ARNs are shared between all of our SNS instances
+TOPIC_ARN_CACHE = TopicArnCache()
+
+
 class NotifySNS(NotifyBase):
     """
     A wrapper for AWS SNS (Amazon Simple Notification)
@@ -89,10 +147,17 @@ class NotifySNS(NotifyBase):
     # can occur in much shorter bursts
     request_rate_per_sec = 2.5
 
+    # Our Topic ARNs are kept in our persistent storage (when available) so
+    # that they survive between runs
+    storage_mode = PersistentStoreMode.AUTO
+
     # The maximum length of the body
     # Source: https://docs.aws.amazon.com/sns/latest/api/API_Publish.html
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
@@ -205,11 +270,7 @@ class NotifySNS(NotifyBase):
         # AWS Service Details
         self.aws_service_name = 'sns'
         self.aws_canonical_uri = '/'
-
-        # AWS Authentication Details
-        self.aws_auth_version = 'AWS4'
-        self.aws_auth_algorithm = 'AWS4-HMAC-SHA256'
-        self.aws_auth_request = 'aws4_request'
+        self.aws_host = 'sns.{}.amazonaws.com'.format(self.aws_region_name)
 
         # Validate targets and drop bad ones:
         for target in parse_list(targets):
@@ -242,69 +303,112 @@ class NotifySNS(NotifyBase):
             self.logger.warning('No AWS targets to notify.')
             return False
 
-        # Initiaize our error tracking
-        error_count = 0
+        # Every phone number and topic is published to independently of one
+        # another
+        targets = [(self._publish_phone, no) for no in self.phone] \
+            + [(self._publish_topic, topic) for topic in self.topics]
 
-        # Create a copy of our phone #'s to notify against
-        phone = list(self.phone)
-        topics = list(self.topics)
+        return self._send_targets(
+            lambda target: target[0](body, target[1]), targets)
 
-        while len(phone) > 0:
+    def _publish_phone(self, body, no):
+        """
+        Publishes our message to the specified phone number
+        """
 
-            # Get Phone No
-            no = phone.pop(0)
+        # Prepare SNS Message Payload
+        payload = {
+            'Action': u'Publish',
+            'Message': body,
+            'Version': u'2010-03-31',
+            'PhoneNumber': no,
+        }
 
-            # Prepare SNS Message Payload
-            payload = {
-                'Action': u'Publish',
-                'Message': body,
-                'Version': u'2010-03-31',
-                'PhoneNumber': no,
-            }
+        (result, _) = self._post(payload=payload, to=no)
+        return result
 
-            (result, _) = self._post(payload=payload, to=no)
-            if not result:
-                error_count += 1
+    def _publish_topic(self, body, topic):
+        """
+        Publishes our message to the specified topic
+        """
 
-        # Send all our defined topic id's
-        while len(topics):
+        # Get the Amazon Resource Name
+        topic_arn = self._topic_arn(topic)
+        if not topic_arn:
+            # Could not acquire our topic; we're done
+            return False
 
-            # Get Topic
-            topic = topics.pop(0)
+        # Build our payload now that we know our topic_arn
+        payload = {
+            'Action': u'Publish',
+            'Version': u'2010-03-31',
+            'TopicArn': topic_arn,
+            'Message': body,
+        }
 
-            # First ensure our topic exists, if it doesn't, it gets created
-            payload = {
-                'Action': u'CreateTopic',
-                'Version': u'2010-03-31',
-                'Name': topic,
-            }
+        # Send our payload to AWS
+        (result, response) = self._post(payload=payload, to=topic)
+        if result or response.get('error_code') != 'NotFound':
+            return result
 
-            (result, response) = self._post(payload=payload, to=topic)
-            if not result:
-                error_count += 1
-                continue
+        # Our cached Topic ARN is no longer valid (the topic was likely
+        # removed); drop it and try again with a freshly created one
+        self.logger.debug(
+            'AWS Topic ARN for "%s" no longer exists; recreating.' % topic)
 
-            # Get the Amazon Resource Name
-            topic_arn = response.get('topic_arn')
-            if not topic_arn:
-                # Could not acquire our topic; we're done
-                error_count += 1
-                continue
+        topic_arn = self._topic_arn(topic, refresh=True)
+        if not topic_arn:
+            return False
+
+        payload['TopicArn'] = topic_arn
+        (result, _) = self._post(payload=payload, to=topic)
+        return result
 
-            # Build our payload now that we know our topic_arn
-            payload = {
-                'Action': u'Publish',
-                'Version': u'2010-03-31',
-                'TopicArn': topic_arn,
-                'Message': body,
-            }
+    def _topic_arn(self, topic, refresh=False):
+        """
+        Returns the Amazon Resource Name (ARN) associated with a topic. The
+        topic is only created (which is how AWS lets us look up it's ARN)
+        if we do not already have it cached.
+
+        None is returned if the ARN could not be acquired.
+        """
+
+        key = TopicArnCache.key(
+            self.aws_region_name, self.aws_access_key_id, topic)
+        store_key = 'topic_arn:{}'.format(topic)
+
+        if refresh:
+            # Invalidate our cached entries
+            TOPIC_ARN_CACHE.pop(key)
+            self.store.clear(store_key)
+
+        else:
+            topic_arn = TOPIC_ARN_CACHE.get(key)
+            if topic_arn:
+                return topic_arn
+
+            topic_arn = self.store.get(store_key)
+            if topic_arn:
+                TOPIC_ARN_CACHE.set(key, topic_arn)
+                return topic_arn
+
+        # First ensure our topic exists, if it doesn't, it gets created
+        payload = {
+            'Action': u'CreateTopic',
+            'Version': u'2010-03-31',
+            'Name': topic,
+        }
 
-            # Send our payload to AWS
-            (result, _) = self._post(payload=payload, to=topic)
-            if not result:
-                error_count += 1
+        (result, response) = self._post(payload=payload, to=topic)
+        if not result:
+            return None
 
-        return error_count == 0
+        topic_arn = response.get('topic_arn')
+        if topic_arn:
+            TOPIC_ARN_CACHE.set(key, topic_arn)
+            self.store.set(store_key, topic_arn)
+
+        return topic_arn
 
     def _post(self, payload, to):
         """
@@ -382,196 +486,25 @@ class NotifySNS(NotifyBase):
         The payload is presumed to have been already urlencoded()
 
         """
-
-        # Define our AWS header
-        headers = {
-            'User-Agent': self.app_id,
-            'Content-Type': 'application/x-www-form-urlencoded; charset=utf-8',
-
-            # Populated below
-            'Content-Length': 0,
-            'Authorization': None,
-            'X-Amz-Date': None,
-        }
-
-        # Get a reference time (used for header construction)
-        reference = datetime.now(timezone.utc)
-
-        # Provide Content-Length
-        headers['Content-Length'] = str(len(payload))
-
-        # Amazon Date Format
-        amzdate = reference.strftime('%Y%m%dT%H%M%SZ')
-        headers['X-Amz-Date'] = amzdate
-
-        # Credential Scope
-        scope = '{date}/{region}/{service}/{request}'.format(
-            date=reference.strftime('%Y%m%d'),
+        return aws_prepare_request(
+            payload,
+            access_key_id=self.aws_access_key_id,
+            secret_access_key=self.aws_secret_access_key,
             region=self.aws_region_name,
             service=self.aws_service_name,
-            request=self.aws_auth_request,
+            host=self.aws_host,
+            user_agent=self.app_id,
+            canonical_uri=self.aws_canonical_uri,
+            reference=reference,
         )
 
-        # Similar to headers; but a subset.  keys must be lowercase
-        signed_headers = OrderedDict([
-            ('content-type', headers['Content-Type']),
-            ('host', '{service}.{region}.amazonaws.com'.format(
-                service=self.aws_service_name,
-                region=self.aws_region_name)),
-            ('x-amz-date', headers['X-Amz-Date']),
-        ])
-
-        #
-        # Build Canonical Request Object
-        #
-        canonical_request = '\n'.join([
-            # Method
-            u'POST',
-
-            # URL
-            self.aws_canonical_uri,
-
-            # Query String (none set for POST)
-            '',
-
-            # Header Content (must include \n at end!)
-            # All entries except characters in amazon date must be
-            # lowercase
-            '\n'.join(['%s:%s' % (k, v)
-                      for k, v in signed_headers.items()]) + '\n',
-
-            # Header Entries (in same order identified above)
-            ';'.join(signed_headers.keys()),
-
-            # Payload
-            sha256(payload.encode('utf-8')).hexdigest(),
-        ])
-
-        # Prepare Unsigned Signature
-        to_sign = '\n'.join([
-            self.aws_auth_algorithm,
-            amzdate,
-            scope,
-            sha256(canonical_request.encode('utf-8')).hexdigest(),
-        ])
-
-        # Our Authorization header
-        headers['Authorization'] = ', '.join([
-            '{algorithm} Credential={key}/{scope}'.format(
-                algorithm=self.aws_auth_algorithm,
-                key=self.aws_access_key_id,
-                scope=scope,
-            ),
-            'SignedHeaders={signed_headers}'.format(
-                signed_headers=';'.join(signed_headers.keys()),
-            ),
-            'Signature={signature}'.format(
-                signature=self.aws_auth_signature(to_sign, reference)
-            ),
-        ])
-
-        return headers
-
-    def aws_auth_signature(self, to_sign, reference):
-        """
-        Generates a AWS v4 signature based on provided payload
-        which should be in the form of a string.
-        """
-
-        def _sign(key, msg, to_hex=False):
-            """
-            Perform AWS Signing
-            """
-            if to_hex:
-                return hmac.new(key, msg.encode('utf-8'), sha256).hexdigest()
-            return hmac.new(key, msg.encode('utf-8'), sha256).digest()
-
-        _date = _sign((
-            self.aws_auth_version +
-            self.aws_secret_access_key).encode('utf-8'),
-            reference.strftime('%Y%m%d'))
-
-        _region = _sign(_date, self.aws_region_name)
-        _service = _sign(_region, self.aws_service_name)
-        _signed = _sign(_service, self.aws_auth_request)
-        return _sign(_signed, to_sign, to_hex=True)
-
     @staticmethod
     def aws_response_to_dict(aws_response):
         """
         Takes an AWS Response object as input and returns it as a dictionary
         but not befor extracting out what is useful to us first.
-
-        eg:
-          IN:
-            <CreateTopicResponse
-                  xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
-              <CreateTopicResult>
-                <TopicArn>arn:aws:sns:us-east-1:000000000000:abcd</TopicArn>
-                   </CreateTopicResult>
-               <ResponseMetadata>
-               <RequestId>604bef0f-369c-50c5-a7a4-bbd474c83d6a</RequestId>
-               </ResponseMetadata>
-           </CreateTopicResponse>
-
-          OUT:
-           {
-              type: 'CreateTopicResponse',
-              request_id: '604bef0f-369c-50c5-a7a4-bbd474c83d6a',
-              topic_arn: 'arn:aws:sns:us-east-1:000000000000:abcd',
-           }
-        """
-
-        # Define ourselves a set of directives we want to keep if found and
-        # then identify the value we want to map them to in our response
-        # object
-        aws_keep_map = {
-            'RequestId': 'request_id',
-            'TopicArn': 'topic_arn',
-            'MessageId': 'message_id',
-
-            # Error Message Handling
-            'Type': 'error_type',
-            'Code': 'error_code',
-            'Message': 'error_message',
-        }
-
-        # A default response object that we'll manipulate as we pull more data
-        # from our AWS Response object
-        response = {
-            'type': None,
-            'request_id': None,
-        }
-
-        try:
-            # we build our tree, but not before first eliminating any
-            # reference to namespacing (if present) as it makes parsing
-            # the tree so much easier.
-            root = ElementTree.fromstring(
-                re.sub(' xmlns="[^"]+"', '', aws_response, count=1))
-
-            # Store our response tag object name
-            response['type'] = str(root.tag)
-
-            def _xml_iter(root, response):
-                if len(root) > 0:
-                    for child in root:
-                        # use recursion to parse everything
-                        _xml_iter(child, response)
-
-                elif root.tag in aws_keep_map.keys():
-                    response[aws_keep_map[root.tag]] = (root.text).strip()
-
-            # Recursivly iterate over our AWS Response to extract the
-            # fields we're interested in in efforts to populate our response
-            # object.
-            _xml_iter(root, response)
-
-        except (ElementTree.ParseError, TypeError):
-            # bad data just causes us to generate a bad response
-            pass
-
-        return response
+        """
+        return aws_response_to_dict(aws_response)
 
     @property
     def url_identifier(self):
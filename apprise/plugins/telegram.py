@@ -55,6 +55,8 @@
 import requests
 import re
 import os
+import hashlib
+import threading
 
 from json import loads
 from json import dumps
@@ -64,6 +66,7 @@ from ..common import NotifyType
 from ..common import NotifyImageSize
 from ..common import NotifyFormat
 from ..common import PersistentStoreMode
+from ..exception import AppriseException
 from ..utils import parse_bool
 from ..utils import parse_list
 from ..utils import validate_regex
@@ -82,6 +85,11 @@ IS_CHAT_ID_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Used to detect when Telegram rejects a file_id we referenced (such as
+# "Bad Request: wrong file identifier/HTTP URL specified")
+TELEGRAM_FILE_ID_ERROR_RE = re.compile(
+    r'file[ _]?id(entifier)?', re.IGNORECASE)
+
 
 class TelegramMarkdownVersion:
     """
@@ -169,6 +177,9 @@ class NotifyTelegram(NotifyBase):
     # reference
     storage_mode = PersistentStoreMode.AUTO
 
+    # Keep our uploaded media references for 20 days
+    default_cache_expiry_sec = 60 * 60 * 24 * 20
+
     # Define object templates
     templates = (
         '{schema}://{bot_token}',
@@ -394,6 +405,10 @@ class NotifyTelegram(NotifyBase):
         """
         super().__init__(**kwargs)
 
+        # Prevents the same media from being uploaded by several targets
+        # at once
+        self._media_lock = threading.Lock()
+
         self.bot_token = validate_regex(
             bot_token, *self.template_tokens['bot_token']['regex'],
             fmt='{key}')
@@ -541,11 +556,6 @@ class NotifyTelegram(NotifyBase):
             function_name,
         )
 
-        # Always call throttle before any remote server i/o is made;
-        # Telegram throttles to occur before sending the image so that
-        # content can arrive together.
-        self.throttle()
-
         # Extract our target
         chat_id, topic = target
 
@@ -554,48 +564,68 @@ class NotifyTelegram(NotifyBase):
             payload['message_thread_id'] = topic
 
         try:
-            with open(path, 'rb') as f:
-                # Configure file payload (for upload)
-                files = {key: (file_name, f)}
-
-                self.logger.debug(
-                    'Telegram attachment POST URL: %s (cert_verify=%r)' % (
-                        url, self.verify_certificate))
-
-                r = requests.post(
-                    url,
-                    headers=headers,
-                    files=files,
-                    data=payload,
-                    verify=self.verify_certificate,
-                    timeout=self.request_timeout,
-                )
-
-                if r.status_code != requests.codes.ok:
-                    # We had a problem
-                    status_str = NotifyTelegram\
-                        .http_response_code_lookup(r.status_code)
-
-                    self.logger.warning(
-                        'Failed to send Telegram attachment: '
-                        '{}{}error={}.'.format(
-                            status_str,
-                            ', ' if status_str else '',
-                            r.status_code))
-
-                    self.logger.debug(
-                        'Response Details:\r\n{}'.format(r.content))
+            # Content we've already uploaded is referenced by the file_id
+            # Telegram handed back to us; our cache key is built from the
+            # function we call along with the hash and name of our content
+            if isinstance(attach, AttachBase):
+                digest = attach.sha256()
 
+            else:
+                # We were handed a path (such as our notification image)
+                sha256 = hashlib.sha256()
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(65536), b''):
+                        sha256.update(chunk)
+                digest = sha256.hexdigest()
+
+            cache_key = 'media_{}_{}_{}'.format(
+                function_name.lower(), digest, file_name)
+
+            file_id = self.store.get(cache_key)
+            if file_id:
+                payload[key] = file_id
+                response = self._send_media(url, headers, payload)
+                if response is not None:
+                    # Our failure (if any) had nothing to do with our
+                    # reference
+                    return bool(response)
+
+                # Telegram no longer recognizes our reference; upload our
+                # content again
+                self.store.clear(cache_key)
+                del payload[key]
+
+            with self._media_lock:
+                # Another target may have just uploaded the same content
+                file_id = self.store.get(cache_key)
+                if file_id:
+                    payload[key] = file_id
+                    return bool(self._send_media(url, headers, payload))
+
+                with open(path, 'rb') as f:
+                    # Configure file payload (for upload)
+                    files = {key: (file_name, f)}
+
+                    response = self._send_media(
+                        url, headers, payload, files=files)
+
+                if not response:
                     return False
 
+                # Track the file_id of the content we uploaded
+                file_id = self._media_file_id(response, key)
+                if file_id:
+                    self.store.set(
+                        cache_key, file_id,
+                        expires=self.default_cache_expiry_sec)
+
                 # Content was sent successfully if we got here
                 return True
 
-        except requests.RequestException as e:
-            self.logger.warning(
-                'A connection error occurred posting Telegram '
-                'attachment.')
-            self.logger.debug('Socket Exception: %s' % str(e))
+        except AppriseException:
+            # Our attachment could not be read; this has already been
+            # logged for us
+            pass
 
         except (IOError, OSError):
             # IOError is present for backwards compatibility with Python
@@ -608,6 +638,97 @@ class NotifyTelegram(NotifyBase):
 
         return False
 
+    def _send_media(self, url, headers, payload, files=None):
+        """
+        Posts our media payload and returns the decoded response on success
+        (or True if it could not be decoded) and False otherwise.  None is
+        returned if Telegram rejected the file_id referenced by our payload.
+        """
+
+        # Always call throttle before any remote server i/o is made;
+        # Telegram throttles to occur before sending the image so that
+        # content can arrive together.
+        self.throttle()
+
+        self.logger.debug(
+            'Telegram attachment POST URL: %s (cert_verify=%r)' % (
+                url, self.verify_certificate))
+
+        try:
+            r = requests.post(
+                url,
+                headers=headers,
+                files=files,
+                data=payload,
+                verify=self.verify_certificate,
+                timeout=self.request_timeout,
+            )
+
+            if r.status_code != requests.codes.ok:
+                # We had a problem
+                status_str = NotifyTelegram\
+                    .http_response_code_lookup(r.status_code)
+
+                self.logger.warning(
+                    'Failed to send Telegram attachment: '
+                    '{}{}error={}.'.format(
+                        status_str,
+                        ', ' if status_str else '',
+                        r.status_code))
+
+                self.logger.debug(
+                    'Response Details:\r\n{}'.format(r.content))
+
+                if r.status_code == requests.codes.bad_request:
+                    try:
+                        if TELEGRAM_FILE_ID_ERROR_RE.search(
+                                loads(r.content)['description']):
+                            # Our file_id is no longer recognized
+                            return None
+
+                    except (AttributeError, KeyError, TypeError, ValueError):
+                        # We could not identify the cause of our failure
+                        pass
+
+                return False
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                'A connection error occurred posting Telegram '
+                'attachment.')
+            self.logger.debug('Socket Exception: %s' % str(e))
+            return False
+
+        try:
+            # Our response is never None (or anything else that evaluates
+            # to False) on success
+            return loads(r.content) or True
+
+        except (AttributeError, TypeError, ValueError):
+            # ValueError = r.content is Unparsable
+            # TypeError = r.content is None
+            # AttributeError = r is None
+            return True
+
+    @staticmethod
+    def _media_file_id(response, key):
+        """
+        Returns the file_id Telegram assigned to the media we sent (if we can
+        find one in the response provided).
+        """
+        try:
+            media = response['result'][key]
+            if isinstance(media, list):
+                # Photos are returned in several sizes; the last is our
+                # original
+                media = media[-1]
+
+            return media.get('file_id') or None
+
+        except (AttributeError, IndexError, KeyError, TypeError):
+            # We didn't get the response we expected
+            return None
+
     def detect_bot_owner(self):
         """
         Takes a bot and attempts to detect it's chat id from that
@@ -752,9 +873,6 @@ class NotifyTelegram(NotifyBase):
             'Content-Type': 'application/json',
         }
 
-        # error tracking (used for function return)
-        has_error = False
-
         url = '%s%s/%s' % (
             self.notify_url,
             self.bot_token,
@@ -804,10 +922,7 @@ class NotifyTelegram(NotifyBase):
         attach_content = \
             TelegramContentPlacement.AFTER if not body else self.content
 
-        # Create a copy of the chat_ids list
-        targets = list(self.targets)
-        while len(targets):
-            target = targets.pop(0)
+        def _send(target):
             chat_id, topic = target
 
             # Printable chat_id details
@@ -834,12 +949,11 @@ class NotifyTelegram(NotifyBase):
                         target, notify_type=notify_type,
                         attach=attach):
 
-                    has_error = True
-                    continue
+                    return False
 
                 if not body:
                     # Nothing more to do; move along to the next attachment
-                    continue
+                    return True
 
             # Always call throttle before any remote server i/o is made;
             # Telegram throttles to occur before sending the image so that
@@ -887,8 +1001,7 @@ class NotifyTelegram(NotifyBase):
                         'Response Details:\r\n{}'.format(r.content))
 
                     # Flag our error
-                    has_error = True
-                    continue
+                    return False
 
             except requests.RequestException as e:
                 self.logger.warning(
@@ -898,8 +1011,7 @@ class NotifyTelegram(NotifyBase):
                 self.logger.debug('Socket Exception: %s' % str(e))
 
                 # Flag our error
-                has_error = True
-                continue
+                return False
 
             self.logger.info('Sent Telegram notification.')
 
@@ -913,10 +1025,12 @@ class NotifyTelegram(NotifyBase):
                         notify_type=notify_type,
                         attach=attach):
 
-                    has_error = True
-                    continue
+                    return False
 
-        return not has_error
+            return True
+
+        # Notify each of our chat_ids
+        return self._send_targets(_send, self.targets)
 
     def _send_attachments(self, target, notify_type, attach):
         """
@@ -50,6 +50,7 @@ from json import loads
 from .base import NotifyBase
 from ..url import PrivacyMode
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import is_phone_no
 from ..utils import parse_phone_no
 from ..utils import validate_regex
@@ -104,6 +105,9 @@ class NotifyTwilio(NotifyBase):
     # The maximum length of the body
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # A title can not be used for SMS Messages.  Setting this to zero will
     # cause any title (if defined) to get placed into the message body.
     title_maxlen = 0
@@ -297,9 +301,6 @@ class NotifyTwilio(NotifyBase):
                     'There are no valid Twilio targets to notify.')
                 return False
 
-        # error tracking (used for function return)
-        has_error = False
-
         # Prepare our headers
         headers = {
             'User-Agent': self.app_id,
@@ -309,7 +310,7 @@ class NotifyTwilio(NotifyBase):
         # Prepare our payload
         payload = {
             'Body': body,
-            # The From and To gets populated in the loop below
+            # The From and To gets populated for each target below
             'From': None,
             'To': None,
         }
@@ -327,11 +328,12 @@ class NotifyTwilio(NotifyBase):
             # No sources specified, use our own phone no
             targets.append((self.default_mode, self.source))
 
-        while len(targets):
+        def _send(target, payload):
             # Get our target to notify
-            (mode, target) = targets.pop(0)
+            (mode, target) = target
 
             # Prepare our user
+            payload = payload.copy()
             if mode is TwilioMessageMode.TEXT:
                 payload['From'] = self.source
                 payload['To'] = target
@@ -393,8 +395,7 @@ class NotifyTwilio(NotifyBase):
                         'Response Details:\r\n{}'.format(r.content))
 
                     # Mark our failure
-                    has_error = True
-                    continue
+                    return False
 
                 else:
                     self.logger.info(
@@ -408,10 +409,12 @@ class NotifyTwilio(NotifyBase):
                 self.logger.debug('Socket Exception: %s' % str(e))
 
                 # Mark our failure
-                has_error = True
-                continue
+                return False
+
+            return True
 
-        return not has_error
+        # Notify each of our targets
+        return self._send_targets(_send, targets, payload)
 
     @property
     def url_identifier(self):
@@ -39,6 +39,7 @@ from json import loads
 
 from .base import NotifyBase
 from ..common import NotifyType
+from ..common import OverflowUnit
 from ..utils import is_phone_no
 from ..utils import is_email
 from ..utils import parse_phone_no
@@ -68,6 +69,9 @@ class NotifyVoipms(NotifyBase):
     # The maximum length of the body
     body_maxlen = 160
 
+    # Our content is measured (and split) by the SMS segment
+    overflow_unit = OverflowUnit.SMS
+
     # The supported country code by VoIP.ms
     voip_ms_country_code = '1'
 
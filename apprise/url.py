@@ -31,7 +31,8 @@ import re
 from .logger import logger
 import time
 import hashlib
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from xml.sax.saxutils import escape as sax_escape
 
 from urllib.parse import unquote as _unquote
@@ -278,6 +279,10 @@ class URLBase:
         # is automatically set and controlled through the throttle() call.
         self._last_io_datetime = None
 
+        # Serializes our throttle() calls; plugins may be delivering to
+        # several of their targets at once
+        self._throttle_lock = threading.Lock()
+
     def throttle(self, last_io=None, wait=None):
         """
         A common throttle control
@@ -287,41 +292,48 @@ class URLBase:
         time.
         """
 
-        if last_io is not None:
-            # Assume specified last_io
-            self._last_io_datetime = last_io
+        with self._throttle_lock:
+            if last_io is not None:
+                # Assume specified last_io
+                self._last_io_datetime = last_io
+
+            # Get ourselves a reference time of 'now'
+            reference = datetime.now()
+
+            if self._last_io_datetime is None:
+                # Set time to 'now' and no need to throttle
+                self._last_io_datetime = reference
+                return
 
-        # Get ourselves a reference time of 'now'
-        reference = datetime.now()
+            if self.request_rate_per_sec <= 0.0 and not wait:
+                # We're done if there is no throttle limit set
+                return
 
-        if self._last_io_datetime is None:
-            # Set time to 'now' and no need to throttle
-            self._last_io_datetime = reference
-            return
+            # If we reach here, we need to do additional logic.
+            # If the difference between the reference time and 'now' is less
+            # than the defined request_rate_per_sec then we need to throttle
+            # for the remaining balance of this time.
 
-        if self.request_rate_per_sec <= 0.0 and not wait:
-            # We're done if there is no throttle limit set
-            return
+            elapsed = (reference - self._last_io_datetime).total_seconds()
 
-        # If we reach here, we need to do additional logic.
-        # If the difference between the reference time and 'now' is less than
-        # the defined request_rate_per_sec then we need to throttle for the
-        # remaining balance of this time.
+            if wait is not None:
+                self.logger.debug('Throttling forced for {}s...'.format(wait))
+                delay = wait
 
-        elapsed = (reference - self._last_io_datetime).total_seconds()
+            elif elapsed < self.request_rate_per_sec:
+                delay = self.request_rate_per_sec - elapsed
+                self.logger.debug('Throttling for {}s...'.format(delay))
 
-        if wait is not None:
-            self.logger.debug('Throttling forced for {}s...'.format(wait))
-            time.sleep(wait)
+            else:
+                delay = 0
 
-        elif elapsed < self.request_rate_per_sec:
-            self.logger.debug('Throttling for {}s...'.format(
-                self.request_rate_per_sec - elapsed))
-            time.sleep(self.request_rate_per_sec - elapsed)
+            # Reserve our slot before we leave; anyone else throttling
+            # against us is spaced out from the time we'll wake up at
+            self._last_io_datetime = reference + timedelta(seconds=delay)
 
-        # Update our timestamp before we leave
-        self._last_io_datetime = datetime.now()
-        return
+        if delay > 0:
+            # Our lock is not held while we sleep
+            time.sleep(delay)
 
     def url(self, privacy=False, *args, **kwargs):
         """
@@ -36,6 +36,13 @@ import mimetypes
 from apprise import NotificationManager
 from apprise import ConfigurationManager
 from apprise import AttachmentManager
+from apprise.attachment.http import HTTP_CACHE
+from apprise.persistent_store import STORE_REGISTRY
+from apprise.plugins.aws import SIGNING_KEY_CACHE
+from apprise.plugins.email import SMTP_POOL
+from apprise.plugins.mqtt import MQTT_CLIENTS
+from apprise.plugins.rsyslog import RSYSLOG_POOL
+from apprise.plugins.sns import TOPIC_ARN_CACHE
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'helpers'))
 
@@ -81,3 +88,18 @@ def collect_all_garbage(session_mocker):
     """
     # Force garbage collection
     gc.collect()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_shared_state():
+    """
+    A pytest function fixture which empties every process wide pool and
+    cache before each test; nothing retrieved, opened or derived by one
+    test (attachment content, persistent stores, SMTP/syslog/MQTT
+    connections, SNS Topic ARNs and AWS signing keys) is ever re-used by
+    another. It is automatically enabled.
+    """
+    for shared in (
+            HTTP_CACHE, STORE_REGISTRY, SMTP_POOL, TOPIC_ARN_CACHE,
+            SIGNING_KEY_CACHE, RSYSLOG_POOL, MQTT_CLIENTS):
+        shared.clear()
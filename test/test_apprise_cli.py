@@ -844,9 +844,11 @@ def test_apprise_cli_persistent_storage(tmpdir):
     assert result.exit_code == 0
 
     dir_content = os.listdir(str(tmpdir))
-    assert len(dir_content) == 2
+    assert len(dir_content) == 3
     assert 'apprise.cfg' in dir_content
     assert 'ea482db7' in dir_content
+    # The index of our storage path
+    assert '.psindex' in dir_content
 
     # Have a look at our storage listings
     result = runner.invoke(cli.main, [
@@ -1144,9 +1146,9 @@ def test_apprise_cli_persistent_storage(tmpdir):
         # We parsed our data accordingly
         assert result.exit_code == 0
 
-        # Now content exists
+        # Now content exists (along with the index of our storage path)
         dir_content = os.listdir(str(new_persistent_base))
-        assert len(dir_content) == 1
+        assert len(dir_content) == 2
 
     # Reload our module with our environment variable gone
     reload(cli)
@@ -27,6 +27,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import sys
+from inspect import cleandoc
 import pytest
 from unittest import mock
 from apprise import NotifyFormat
@@ -36,6 +37,7 @@ from apprise import Apprise
 from apprise import AppriseConfig
 from apprise import AppriseAsset
 from apprise.config import ConfigBase
+from apprise.config.base import ConfigEntry
 from apprise.plugins import NotifyBase
 from apprise import NotificationManager
 from apprise import ConfigurationManager
@@ -704,6 +706,115 @@ def test_apprise_config_with_apprise_obj(tmpdir):
         assert isinstance(a.pop(len(a) - 1), NotifyBase)
 
 
+def test_apprise_config_lazy_instantiation(tmpdir):
+    """
+    API: ConfigBase - services are only instantiated when matched
+
+    """
+
+    # Track what was instantiated
+    loaded = []
+
+    class LazyNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            if self.host == 'fail':
+                raise TypeError('Failed to load')
+
+            loaded.append(self.host)
+
+        def notify(self, **kwargs):
+            # Pretend everything is okay
+            return True
+
+        def url(self, **kwargs):
+            # support url()
+            return 'lazy://{}'.format(self.host)
+
+    # Store our notification in our schema map
+    N_MGR._schema_map['lazy'] = LazyNotification
+
+    t = tmpdir.mkdir("apprise-lazy").join("apprise")
+    t.write(
+        '\n'.join('tag{}=lazy://host{}'.format(no, no) for no in range(10))
+        + '\ngroup=tag3, tag7\nfail=lazy://fail\n')
+
+    a = Apprise()
+    assert a.add(AppriseConfig(paths=str(t))) is True
+
+    # Only the services we match are created
+    assert a.notify('body', tag='tag1') is True
+    assert loaded == ['host1']
+
+    assert a.notify('body', tag='group') is True
+    assert loaded == ['host1', 'host3', 'host7']
+
+    # Services are cached once instantiated
+    assert a.notify('body', tag=['tag1', 'tag3']) is True
+    assert loaded == ['host1', 'host3', 'host7']
+
+    # Services that can't be loaded are skipped; if nothing we matched could
+    # be loaded then we've failed
+    assert a.notify('body', tag='fail') is False
+    assert a.notify('body', tag=['fail', 'tag9']) is True
+
+    # Tags that simply don't match anything still notify no one
+    assert a.notify('body', tag='unknown') is None
+    assert loaded == ['host1', 'host3', 'host7', 'host9']
+
+    # Our configuration holds entries in place of what isn't loaded yet
+    cfg = a.servers[0].configs[0]
+    entries = cfg.servers(lazy=True)
+    assert len(entries) == 11
+    entry = next(e for e in entries if isinstance(e, ConfigEntry))
+    assert entry.tags == {'tag0'}
+
+    # Only the URL we were defined by is retained until we're instantiated
+    assert entry._results is None
+    assert entry._url == 'lazy://host0'
+    assert entry.instance() is entry.instance()
+    assert entry.instance().tags == entry.tags
+    assert entry._url is None
+
+    # Our length (and anything else that expects services) causes all of
+    # them to be loaded; the failed entry is dropped
+    assert len(a) == 10
+    assert sorted(loaded) == sorted(['host{}'.format(no) for no in range(10)])
+    assert not any(isinstance(s, ConfigEntry) for s in cfg.servers(lazy=True))
+    assert all(isinstance(s, LazyNotification) for s in a)
+
+    # A configuration where nothing could be loaded
+    t.write('fail=lazy://fail')
+    a = Apprise()
+    assert a.add(AppriseConfig(paths=str(t))) is True
+    assert a.notify('body') is False
+
+    # YAML configuration is handled the same way
+    del loaded[:]
+    result, _ = ConfigBase.config_parse_yaml(cleandoc("""
+    tag: global
+    urls:
+      - lazy://host0:
+         - tag: a
+         - tag: b
+      - lazy://host1
+    """), lazy=True)
+
+    assert len(result) == 3
+    assert all(isinstance(e, ConfigEntry) for e in result)
+    assert [e.tags for e in result] == [
+        {'global', 'a'}, {'global', 'b'}, {'global'}]
+    assert not loaded
+
+    # Our YAML results are retained, but not our asset
+    assert result[1]._results['host'] == 'host0'
+    assert 'asset' not in result[1]._results
+
+    assert result[1].instance().tags == {'global', 'b'}
+    assert loaded == ['host0']
+    assert result[1]._results is None
+
+
 def test_recursive_config_inclusion(tmpdir):
     """
     API: Apprise() Recursive Config Inclusion
@@ -26,6 +26,9 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import importlib
+import os
+from unittest import mock
 from apprise import emojis
 import sys
 
@@ -54,3 +57,46 @@ def test_emojis():
     assert emojis.apply_emojis(object) == ''
     assert emojis.apply_emojis(True) == ''
     assert emojis.apply_emojis(4.0) == ''
+
+    # Case insensitive
+    assert emojis.apply_emojis(':SMILE: :Smile:') == '😄 😄'
+
+    # Shortcodes defined with alternatives
+    assert emojis.apply_emojis(':laughing: :satisfied:') == '😆 😆'
+    assert emojis.apply_emojis(':+1: :thumbsup:') == '👍 👍'
+    assert emojis.apply_emojis(':hand: :raised_hand:') == '✋ ✋'
+    assert emojis.apply_emojis(':email: :e-mail:') == '📧 📧'
+
+    # Delimiters are only consumed by a match
+    assert emojis.apply_emojis(':smile:smile:') == '😄smile:'
+    assert emojis.apply_emojis('::smile::') == ':😄:'
+    assert emojis.apply_emojis('12:00:00 :nope: :') == '12:00:00 :nope: :'
+
+
+def test_emojis_warmup():
+    "emojis: warmup() testing """
+
+    with mock.patch('apprise.emojis.EMOJI_LOOKUP', None):
+        emojis.warmup()
+        lookup = emojis.EMOJI_LOOKUP
+        assert lookup['smile'] == '😄'
+        assert lookup['+1'] == '👍'
+        assert lookup['raised_hand'] == lookup['hand']
+
+        # Only prepared once
+        emojis.warmup()
+        assert emojis.EMOJI_LOOKUP is lookup
+
+    # Every shortcode our map defines is found
+    assert emojis._expand(r'(fist_(raised|oncoming)|(face)?punch)') == [
+        'fist_raised', 'fist_oncoming', 'punch', 'facepunch']
+    assert emojis._expand(r't?shirt') == ['shirt', 'tshirt']
+    assert emojis._expand(r'\+1') == ['+1']
+
+    # Our lookup table can be prepared at import time
+    with mock.patch.dict(os.environ, {'APPRISE_EMOJI_WARMUP': 'yes'}), \
+            mock.patch('apprise.emojis.EMOJI_LOOKUP', None):
+        importlib.reload(emojis)
+        assert emojis.EMOJI_LOOKUP is not None
+
+    importlib.reload(emojis)
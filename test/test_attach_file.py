@@ -28,6 +28,8 @@
 
 import re
 import time
+import base64
+import hashlib
 import urllib
 import pytest
 from unittest import mock
@@ -246,3 +248,93 @@ def test_attach_file_base64():
         mock_file.side_effect = OSError
         with pytest.raises(exception.AppriseDiskIOError):
             response.base64()
+
+
+def test_attach_file_chunks(tmpdir):
+    """
+    API: AttachFile() streaming our content
+
+    """
+    content = bytes(range(256)) * 41
+    path = tmpdir.join('content.bin')
+    path.write_binary(content)
+
+    response = AppriseAttachment.instantiate(str(path))
+    assert isinstance(response, AttachFile)
+
+    # Our content is memory mapped
+    chunks = list(bytes(c) for c in response.chunks(size=1000))
+    assert len(chunks) == 11
+    assert all(len(c) == 1000 for c in chunks[:-1])
+    assert b''.join(chunks) == content
+
+    # Our default chunk size is used if we don't otherwise specify one
+    chunks = [bytes(c) for c in response.chunks(size=0)]
+    assert b''.join(chunks) == content
+    assert len(chunks) == 1
+
+    # Holding a reference to a block past the end of our generator is
+    # gracefully handled
+    blocks = list(response.chunks(size=1000))
+    assert bytes(blocks[0]) == content[:1000]
+
+    # Our content is read normally if we can't map it
+    with mock.patch('mmap.mmap', side_effect=OSError()):
+        chunks = list(response.chunks(size=1000))
+        assert all(isinstance(c, bytes) for c in chunks)
+        assert b''.join(chunks) == content
+
+    # Empty files can't be mapped either
+    path = tmpdir.join('empty.bin')
+    path.write_binary(b'')
+    response = AppriseAttachment.instantiate(str(path))
+    assert list(response.chunks()) == []
+    assert response.base64() == ''
+
+    # Our base64 content is encoded in blocks along a 3 byte boundary
+    path = tmpdir.join('content.bin')
+    response = AppriseAttachment.instantiate(str(path))
+    chunks = list(response.base64_chunks(size=1000))
+    assert all(len(c) == 1332 for c in chunks[:-1])
+    assert ''.join(chunks) == base64.b64encode(content).decode('ascii')
+    assert b''.join(response.base64_chunks(encoding=None, size=1)) == \
+        base64.b64encode(content)
+
+    # Error cases:
+    with mock.patch('os.path.isfile', return_value=False):
+        with pytest.raises(exception.AppriseFileNotFound):
+            next(response.chunks())
+
+    with mock.patch("builtins.open", side_effect=OSError):
+        with pytest.raises(exception.AppriseDiskIOError):
+            next(response.chunks())
+
+
+def test_attach_file_sha256(tmpdir):
+    """
+    API: AttachFile() content hashing
+
+    """
+    content = b'apprise' * 1024
+    path = tmpdir.join('content.bin')
+    path.write_binary(content)
+
+    response = AppriseAttachment.instantiate(str(path))
+    assert isinstance(response, AttachFile)
+    assert response.sha256() == hashlib.sha256(content).hexdigest()
+
+    # Our digest is only calculated once
+    with mock.patch.object(response, 'chunks') as mock_chunks:
+        assert response.sha256() == hashlib.sha256(content).hexdigest()
+        assert mock_chunks.call_count == 0
+
+    # It is re-calculated if our content is re-retrieved
+    response.invalidate()
+    path.write_binary(b'new content')
+    assert response.sha256() == hashlib.sha256(b'new content').hexdigest()
+
+    # Missing content can't be hashed
+    with mock.patch('os.path.isfile', return_value=False):
+        response.invalidate()
+        with pytest.raises(exception.AppriseFileNotFound):
+            response.sha256()
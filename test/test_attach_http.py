@@ -27,6 +27,8 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import re
+import os
+import time
 from unittest import mock
 
 import pytest
@@ -36,8 +38,9 @@ import mimetypes
 from os.path import join
 from os.path import dirname
 from os.path import getsize
+from os.path import exists
 from apprise.attachment.http import AttachHTTP
-from apprise import Apprise, AppriseAttachment
+from apprise import Apprise, AppriseAsset, AppriseAttachment
 from apprise import NotificationManager
 from apprise.plugins import NotifyBase
 from apprise.common import ContentLocation
@@ -481,8 +484,9 @@ def test_attach_http(mock_get, mock_post):
 
     # We posted 30 times
     assert mock_post.call_count == 30
-    # We only fetched once and re-used the same fetch for all posts
-    assert mock_get.call_count == 1
+    # Our content was retrieved by our previous notify() call and was
+    # re-used for all posts
+    assert mock_get.call_count == 0
 
     #
     # We will test our base64 handling now
@@ -513,3 +517,253 @@ def test_attach_http(mock_get, mock_post):
         mock_file.side_effect = OSError
         with pytest.raises(exception.AppriseDiskIOError):
             obj.base64()
+
+
+@mock.patch('requests.get')
+def test_attach_http_shared_cache(mock_get):
+    """
+    API: AttachHTTP() shared content cache
+
+    """
+    from apprise.attachment.http import HTTP_CACHE
+
+    class DummyResponse:
+        """
+        A dummy response used to manage our object
+        """
+        status_code = requests.codes.ok
+
+        def __init__(self, content=b'content', headers=None):
+            self.content = content
+            self.headers = {'Content-Length': str(len(content))}
+            if headers:
+                self.headers.update(headers)
+
+        def close(self):
+            return
+
+        def iter_content(self, chunk_size=1024):
+            yield self.content
+
+        def raise_for_status(self):
+            return
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args, **kwargs):
+            return
+
+    mock_get.return_value = DummyResponse(headers={
+        'ETag': '"abc"',
+        'Last-Modified': 'Tue, 01 Oct 2024 00:00:00 GMT',
+        'Content-Disposition': 'attachment; filename="test.txt"',
+        'Content-Type': 'text/plain',
+    })
+
+    # Our content is only ever retrieved once across separate objects
+    first = AttachHTTP(**AttachHTTP.parse_url('http://localhost/test'))
+    second = AttachHTTP(**AttachHTTP.parse_url('http://localhost/test'))
+    assert first.path and second.path
+    assert first.path == second.path
+    assert mock_get.call_count == 1
+    assert second.name == 'test.txt'
+    assert second.mimetype == 'text/plain'
+    assert HTTP_CACHE.hits == 1
+    assert HTTP_CACHE.misses == 1
+    assert len(HTTP_CACHE) == 1
+
+    # Invalidating one object does not affect the content of another
+    first.invalidate()
+    assert second.exists(retrieve_if_missing=False)
+    with open(second.path, 'rb') as f:
+        assert f.read() == b'content'
+
+    # Different requests are never shared
+    third = AttachHTTP(**AttachHTTP.parse_url('http://user@localhost/test'))
+    assert third.path
+    assert mock_get.call_count == 2
+    # ... but identical content is only stored once
+    assert third.path == second.path
+    assert len(HTTP_CACHE) == 2
+    assert HTTP_CACHE.size == len(b'content')
+
+    # Disabling our cache bypasses it entirely
+    mock_get.reset_mock()
+    nocache = AttachHTTP(
+        **AttachHTTP.parse_url('http://localhost/test?cache=no'))
+    path = nocache.path
+    assert path and path != second.path
+    assert mock_get.call_count == 1
+    nocache.invalidate()
+    assert not exists(path)
+
+    # Expired content is revalidated with the server
+    mock_get.reset_mock()
+    with mock.patch('time.time', return_value=time.time() + 1000):
+        response = DummyResponse(content=b'')
+        response.status_code = requests.codes.not_modified
+        mock_get.return_value = response
+
+        obj = AttachHTTP(**AttachHTTP.parse_url('http://localhost/test'))
+        assert obj.path == second.path
+        assert mock_get.call_count == 1
+        headers = mock_get.call_args[1]['headers']
+        assert headers['If-None-Match'] == '"abc"'
+        assert headers['If-Modified-Since'] == \
+            'Tue, 01 Oct 2024 00:00:00 GMT'
+        assert obj.name == 'test.txt'
+
+        # Our content is fresh again
+        assert AttachHTTP(
+            **AttachHTTP.parse_url('http://localhost/test')).path
+        assert mock_get.call_count == 1
+
+    # The server can prevent us from caching content
+    HTTP_CACHE.clear()
+    mock_get.reset_mock()
+    mock_get.return_value = DummyResponse(
+        headers={'Cache-Control': 'no-store'})
+    obj = AttachHTTP(**AttachHTTP.parse_url('http://localhost/nostore'))
+    assert obj.path
+    assert len(HTTP_CACHE) == 0
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/nostore')).path
+    assert mock_get.call_count == 2
+
+    # ... or force us to always revalidate it
+    mock_get.reset_mock()
+    mock_get.return_value = DummyResponse(
+        headers={'Cache-Control': 'no-cache', 'ETag': '"xyz"'})
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/nocache')).path
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/nocache')).path
+    assert mock_get.call_count == 2
+    assert mock_get.call_args[1]['headers']['If-None-Match'] == '"xyz"'
+
+    # ... or limit how long it can be used for
+    HTTP_CACHE.clear()
+    mock_get.reset_mock()
+    mock_get.return_value = DummyResponse(
+        headers={'Cache-Control': 'public, max-age=60'})
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/age')).path
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/age')).path
+    assert mock_get.call_count == 1
+    with mock.patch('time.time', return_value=time.time() + 61):
+        assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/age')).path
+    assert mock_get.call_count == 2
+
+    # Content we can no longer keep after revalidating it is simply
+    # retrieved again
+    HTTP_CACHE.clear()
+    mock_get.reset_mock()
+    mock_get.return_value = DummyResponse(
+        headers={'Cache-Control': 'no-cache', 'ETag': '"abc"'})
+    obj = AttachHTTP(**AttachHTTP.parse_url('http://localhost/gone'))
+    assert obj.path
+    response = DummyResponse(
+        content=b'', headers={'Cache-Control': 'no-store'})
+    response.status_code = requests.codes.not_modified
+    response.close = mock.Mock()
+    responses = [
+        response,
+        DummyResponse(
+            content=b'new', headers={'Cache-Control': 'no-store'}),
+    ]
+
+    def _get(*args, **kwargs):
+        if len(responses) == 1:
+            # Our previous response was released before we asked again
+            assert response.close.call_count == 1
+        return responses.pop(0)
+
+    mock_get.return_value = None
+    mock_get.side_effect = _get
+    obj = AttachHTTP(**AttachHTTP.parse_url('http://localhost/gone'))
+    assert obj.path
+    assert not responses
+    with open(obj.path, 'rb') as f:
+        assert f.read() == b'new'
+    assert mock_get.call_count == 3
+    assert mock_get.call_args_list[1][1]['headers']['If-None-Match'] \
+        == '"abc"'
+    assert 'If-None-Match' not in mock_get.call_args_list[2][1]['headers']
+    assert len(HTTP_CACHE) == 0
+
+    # The same applies if our content could not be refreshed
+    mock_get.reset_mock()
+    mock_get.side_effect = None
+    mock_get.return_value = DummyResponse(
+        headers={'Cache-Control': 'no-cache', 'ETag': '"abc"'})
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/gone')).path
+    response = DummyResponse(content=b'')
+    response.status_code = requests.codes.not_modified
+    mock_get.return_value = None
+    mock_get.side_effect = (response, DummyResponse(content=b'new'))
+    with mock.patch.object(HTTP_CACHE, 'refresh', return_value=False):
+        obj = AttachHTTP(**AttachHTTP.parse_url('http://localhost/gone'))
+        assert obj.path
+    assert mock_get.call_count == 3
+    with open(obj.path, 'rb') as f:
+        assert f.read() == b'new'
+    assert len(HTTP_CACHE) == 1
+    mock_get.side_effect = None
+
+    # Our least recently used content is evicted once we exceed our limit
+    HTTP_CACHE.clear()
+    mock_get.reset_mock()
+    asset = AppriseAsset(attach_cache_size=10)
+    assert AppriseAsset().attach_cache_size == 104857600
+    mock_get.return_value = DummyResponse(content=b'a' * 6)
+    first = AttachHTTP(
+        asset=asset, **AttachHTTP.parse_url('http://localhost/a'))
+    path_a = first.path
+    assert path_a
+    mock_get.return_value = DummyResponse(content=b'b' * 6)
+    second = AttachHTTP(
+        asset=asset, **AttachHTTP.parse_url('http://localhost/b'))
+    path_b = second.path
+    assert path_b
+    assert len(HTTP_CACHE) == 1
+    assert HTTP_CACHE.size == 6
+    assert exists(path_b)
+
+    # Evicted content is left in place for as long as it's being read
+    assert exists(path_a)
+    with open(first.path, 'rb') as f:
+        assert f.read() == b'a' * 6
+    first.invalidate()
+    assert not exists(path_a)
+
+    # Content larger than our cache is never stored in it
+    mock_get.return_value = DummyResponse(content=b'c' * 11)
+    obj = AttachHTTP(
+        asset=asset, **AttachHTTP.parse_url('http://localhost/c'))
+    assert obj.path
+    assert len(HTTP_CACHE) == 1
+    path = obj.path
+    obj.invalidate()
+    assert not exists(path)
+
+    # Our cache can be disabled entirely
+    mock_get.reset_mock()
+    asset = AppriseAsset(attach_cache_size=0)
+    for _ in range(2):
+        obj = AttachHTTP(
+            asset=asset, **AttachHTTP.parse_url('http://localhost/d'))
+        assert obj.path
+    assert mock_get.call_count == 2
+    assert len(HTTP_CACHE) == 1
+
+    # Content removed from underneath us is simply retrieved again
+    mock_get.reset_mock()
+    os.unlink(path_b)
+    assert AttachHTTP(**AttachHTTP.parse_url('http://localhost/b')).path
+    assert mock_get.call_count == 1
+
+    # Clearing our cache removes all content
+    path = HTTP_CACHE.path
+    HTTP_CACHE.clear()
+    assert not exists(path)
+    assert len(HTTP_CACHE) == 0
+    assert HTTP_CACHE.hits == 0
+    assert HTTP_CACHE.remove('invalid') is False
+    assert HTTP_CACHE.refresh('invalid') is False
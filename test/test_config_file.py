@@ -26,9 +26,11 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import pytest
 from unittest import mock
 
 from apprise.config.file import ConfigFile
+from apprise.config.base import ConfigReadException
 from apprise.plugins import NotifyBase
 from apprise import AppriseAsset
 
@@ -126,3 +128,78 @@ def test_config_file_exceptions(tmpdir):
 
     # Restore default value
     cf.max_buffer_size = max_buffer_size
+
+
+def test_config_file_stream(tmpdir):
+    """
+    API: ConfigFile() streaming
+
+    """
+
+    # Write a configuration file larger than our default buffer size
+    t = tmpdir.mkdir("testing").join("apprise.txt")
+    t.write('\r\n'.join(
+        ['# a comment', 'group=tag0'] +
+        ['tag{}=json://localhost/{}'.format(no % 5, no)
+         for no in range(5000)]) + '\r\n')
+
+    # By default the file is rejected for being too large
+    cf = ConfigFile(path=str(t))
+    assert cf.max_buffer_size < t.size()
+    assert cf.stream() is None
+    assert len(cf) == 0
+
+    # Invalid buffer sizes
+    for max_buffer_size in (-1, 'garbage', object()):
+        with pytest.raises(TypeError):
+            ConfigFile(path=str(t), max_buffer_size=max_buffer_size)
+
+    # Disable our limit entirely
+    cf = ConfigFile(path=str(t), max_buffer_size=0)
+    assert cf.max_buffer_size == 0
+    assert len(cf) == 5000
+    assert len([s for s in cf if 'group' in s.tags]) == 1000
+
+    # Increase our limit
+    cf = ConfigFile(path=str(t), max_buffer_size=t.size())
+    assert len(cf) == 5000
+
+    # Our stream is a line iterator
+    lines = cf.stream()
+    assert not isinstance(lines, str)
+    assert next(lines) == '# a comment\n'
+    assert next(lines) == 'group=tag0\n'
+    lines.close()
+
+    # Our content is also available in it's entirety (just as it would be
+    # had we read our file all at once)
+    with open(str(t), 'rt') as f:
+        assert cf.read() == f.read()
+
+    # An encoding we don't support
+    cf = ConfigFile(path=str(t), encoding='invalid', max_buffer_size=0)
+    assert cf.stream() is None
+    assert len(cf) == 0
+
+    # An error part way through our stream
+    t.write_binary(b'json://localhost\n\xff\xfe\n')
+    cf = ConfigFile(path=str(t), encoding='utf-8')
+    with pytest.raises(ConfigReadException):
+        list(cf.stream())
+    assert len(cf) == 0
+
+    t.write('json://localhost')
+    cf = ConfigFile(path=str(t))
+    fp = mock.MagicMock()
+    fp.__iter__.side_effect = OSError
+    with mock.patch('builtins.open', return_value=fp):
+        with pytest.raises(ConfigReadException):
+            list(cf.stream())
+
+    # Can't open our file
+    with mock.patch('builtins.open', side_effect=OSError):
+        assert cf.stream() is None
+
+    # File not accessible
+    cf = ConfigFile(path=str(tmpdir.join('missing')))
+    assert cf.stream() is None
@@ -33,6 +33,7 @@ from unittest import mock
 import requests
 from apprise.common import ConfigFormat
 from apprise.config.http import ConfigHTTP
+from apprise.config.base import ConfigReadException
 from apprise.plugins import NotifyBase
 from apprise import NotificationManager
 
@@ -96,9 +97,16 @@ def test_config_http(mock_post):
 
         text = default_content
 
+        encoding = 'utf-8'
+
         # Pointer to file
         ptr = None
 
+        def iter_content(self, chunk_size=1, **kwargs):
+            content = self.text.encode(self.encoding)
+            for i in range(0, len(content), chunk_size):
+                yield content[i:i + chunk_size]
+
         def close(self):
             return
 
@@ -347,3 +355,106 @@ def test_config_http(mock_post):
 
     # Restore buffer size count
     ch.max_buffer_size = max_buffer_size
+
+
+@mock.patch('requests.post')
+def test_config_http_stream(mock_post):
+    """
+    API: ConfigHTTP() streaming
+
+    """
+
+    # Our content is larger then our default buffer size and contains a
+    # multi-byte character that will be split across our chunks
+    content = '\r\n'.join(
+        ['# ë comment', 'group=tag0'] +
+        ['tag{}=json://localhost/{}'.format(no % 5, no)
+         for no in range(5000)]) + '\r\n'
+
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    response.encoding = 'utf-8'
+    response.headers = {'Content-Type': 'text/plain'}
+
+    def iter_content(chunk_size=1, **kwargs):
+        data = content.encode('utf-8')
+        for i in range(0, len(data), 3):
+            yield data[i:i + 3]
+
+    response.iter_content.side_effect = iter_content
+    mock_post.return_value = response
+
+    # By default our content is too large
+    ch = ConfigHTTP(host='localhost')
+    assert ch.max_buffer_size < len(content)
+    assert len(ch) == 0
+    assert response.close.call_count == 1
+
+    # Increase our buffer size
+    response.reset_mock()
+    ch = ConfigHTTP(host='localhost', max_buffer_size=len(content))
+    assert len(ch) == 5000
+    assert len([s for s in ch if 'group' in s.tags]) == 1000
+    assert response.close.call_count == 1
+
+    # Our stream is a line iterator
+    lines = ch.stream()
+    assert not isinstance(lines, str)
+    assert next(lines) == '# ë comment\r\n'
+    assert next(lines) == 'group=tag0\r\n'
+    lines.close()
+
+    # Our content is also available in it's entirety (as it was sent)
+    assert ch.read() == content
+
+    # Content without a trailing line ending
+    content = content[:-2]
+    assert ch.read() == content
+    assert list(ch.stream())[-1] == 'tag4=json://localhost/4999'
+
+    # Content-Length is checked before we download anything
+    response.reset_mock()
+    response.headers['Content-Length'] = str(ch.max_buffer_size + 1)
+    assert ch.stream() is None
+    assert response.iter_content.call_count == 0
+    assert response.close.call_count == 1
+    del response.headers['Content-Length']
+
+    # Unsupported encodings fall back to utf-8
+    response.encoding = 'invalid'
+    assert next(ch.stream()) == '# ë comment\r\n'
+
+    # Without an encoding, we have requests detect it from our content
+    response.reset_mock()
+    response.encoding = None
+    response.text = content
+    assert ch.read() == content
+    assert response.iter_content.call_count == 0
+    assert response.close.call_count == 1
+
+    # Our buffer size is still enforced
+    response.text = 'a' * (ch.max_buffer_size + 1)
+    assert ch.read() is None
+    response.encoding = 'utf-8'
+
+    # YAML content is streamed too
+    response.headers['Content-Type'] = 'text/yaml'
+    content = 'urls:\n  - json://localhost:\n    - tag: a\n'
+    ch = ConfigHTTP(host='localhost')
+    assert len(ch) == 1
+    assert ch.default_config_format == ConfigFormat.YAML
+    assert 'a' in ch[0].tags
+
+    # An error part way through our download
+    response.iter_content.side_effect = requests.ConnectionError()
+    ch = ConfigHTTP(host='localhost')
+    with pytest.raises(ConfigReadException):
+        list(ch.stream())
+    assert ch.read() is None
+    assert len(ch) == 0
+
+    # Errors prior to our download
+    response.reset_mock()
+    response.raise_for_status.side_effect = requests.HTTPError()
+    assert ch.stream() is None
+    assert response.close.call_count == 1
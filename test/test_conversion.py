@@ -26,8 +26,14 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from apprise import NotifyFormat
-from apprise.conversion import convert_between
+import threading
+from unittest import mock
+import requests
+from markdown import markdown
+from apprise import Apprise, NotifyFormat
+from apprise.conversion import (
+    convert_between, markdown_to_html, html_to_text, ConversionCache,
+    CONVERSION_CACHE, HTMLConverter)
 import pytest
 from inspect import cleandoc
 
@@ -272,3 +278,210 @@ def test_conversion_markdown_to_html():
     assert '<td>Content Cell2</td>' in response
     assert '<td>Content Cell3</td>' in response
     assert '<td>Content Cell4</td>' in response
+
+
+def test_conversion_markdown_renderer_reuse():
+    """conversion: Test markdown renderer is re-used safely
+    """
+
+    content = cleandoc("""
+    ## Alert[^1]
+
+    *Host* | *State*
+    ------ | -------
+    web01  | down
+
+    Details:
+    - Disk full
+
+    [^1]: footnotes are not enabled
+    """)
+
+    expected = markdown(content, extensions=[
+        'markdown.extensions.nl2br', 'markdown.extensions.tables'])
+
+    # Output is identical to a freshly prepared renderer; even after
+    # many uses
+    for _ in range(3):
+        assert convert_between(
+            NotifyFormat.MARKDOWN, NotifyFormat.HTML, content) == expected
+
+    # A failed conversion does not leave state behind for the next
+    with pytest.raises(Exception):
+        markdown_to_html(object())
+
+    assert convert_between(
+        NotifyFormat.MARKDOWN, NotifyFormat.HTML, content) == expected
+
+    # Every thread prepares its own renderer
+    results = []
+
+    def convert():
+        results.append(markdown_to_html(content))
+
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == [expected] * 4
+
+
+def test_conversion_cache():
+    """conversion: Test conversion cache
+    """
+
+    # Invalid cache sizes
+    with pytest.raises(AttributeError):
+        ConversionCache(max_size=-1)
+
+    with pytest.raises(AttributeError):
+        ConversionCache(max_size='invalid')
+
+    CONVERSION_CACHE.clear()
+    assert CONVERSION_CACHE.hit_rate == 0.0
+
+    content = "## Heading\n:smile: \\t tab"
+    with mock.patch(
+            'apprise.conversion.markdown_to_html',
+            wraps=markdown_to_html) as mock_convert:
+
+        first = convert_between(
+            NotifyFormat.MARKDOWN, NotifyFormat.HTML, content)
+        assert convert_between(
+            NotifyFormat.MARKDOWN, NotifyFormat.HTML, content) == first
+        assert mock_convert.call_count == 1
+
+        # Escapes and emojis are each part of our key
+        escaped = convert_between(
+            NotifyFormat.MARKDOWN, NotifyFormat.HTML, content, escapes=True)
+        assert '\t' in escaped and '\t' not in first
+        emojis = convert_between(
+            NotifyFormat.MARKDOWN, NotifyFormat.HTML, content, emojis=True)
+        assert '😄' in emojis and '😄' not in first
+        assert mock_convert.call_count == 3
+
+        # Caching can be bypassed
+        assert convert_between(
+            NotifyFormat.MARKDOWN, NotifyFormat.HTML, content,
+            cache=False) == first
+        assert mock_convert.call_count == 4
+
+    stats = CONVERSION_CACHE.stats()
+    assert stats['size'] == 3
+    assert stats['hits'] == 1
+    assert stats['misses'] == 3
+    assert stats['hit_rate'] == 0.25
+    assert len(CONVERSION_CACHE) == 3
+
+    # Content that can not be cached
+    assert ConversionCache.key(
+        None, NotifyFormat.TEXT, NotifyFormat.HTML) is None
+    assert ConversionCache.key(
+        'a' * (ConversionCache.max_content_length + 1),
+        NotifyFormat.TEXT, NotifyFormat.HTML) is None
+
+    # Escaping non-string content fails as it always has
+    with pytest.raises(AttributeError):
+        convert_between(
+            NotifyFormat.TEXT, NotifyFormat.TEXT, None, escapes=True)
+
+    # Our least recently used entries are evicted
+    cache = ConversionCache(max_size=2)
+    keys = [ConversionCache.key(
+        str(no), NotifyFormat.TEXT, NotifyFormat.HTML) for no in range(3)]
+    cache.set(keys[0], '0')
+    cache.set(keys[1], '1')
+    assert cache.get(keys[0]) == '0'
+    cache.set(keys[2], '2')
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == '0'
+    assert cache.get(keys[2]) == '2'
+    assert cache.stats()['evictions'] == 1
+
+    # A cache size of zero disables caching
+    cache = ConversionCache(max_size=0)
+    cache.set(keys[0], '0')
+    assert cache.get(keys[0]) is None
+    assert len(cache) == 0
+
+    # Content is shared across notify() calls
+    CONVERSION_CACHE.clear()
+    a = Apprise()
+    assert a.add('json://localhost/?format=html')
+    with mock.patch('requests.post') as mock_post:
+        mock_post.return_value = requests.Request()
+        mock_post.return_value.status_code = requests.codes.ok
+
+        for _ in range(3):
+            assert a.notify(
+                '**bold**', title='title',
+                body_format=NotifyFormat.MARKDOWN) is True
+
+        assert mock_post.call_count == 3
+        for call in mock_post.call_args_list:
+            assert '<strong>bold</strong>' in call[1]['data']
+
+    # title and body each missed once and were then re-used
+    assert CONVERSION_CACHE.stats()['misses'] == 2
+    assert CONVERSION_CACHE.stats()['hits'] == 4
+
+
+def test_conversion_html_to_text_fast_path():
+    """conversion: Test HTML to plain text single pass conversion
+    """
+
+    def feed(content):
+        parser = HTMLConverter()
+        parser.feed(content)
+        parser.close()
+        return parser.converted
+
+    def convert(content):
+        parser = HTMLConverter()
+        if not parser.convert(content):
+            return None
+
+        parser.close()
+        return parser.converted
+
+    # Content our single pass handles; the results are identical to
+    # what HTMLParser produces
+    for content in (
+            "", "No HTML code here.",
+            "<ul><li>Lots and lots</li><li>of lists.</li></ul>",
+            "<h2>Fancy heading</h2>"
+            "<p>And a paragraph too.<br>Plus line break.</p>",
+            "<style>body { font: 200%; }</style>"
+            "<p>Some obnoxious text here.</p>",
+            "<p>line 1</P><P>line 2</P >",
+            "some information<br/><br />and more information",
+            "<script>if (a < b) { x = '</p>'; }</SCRIPT>text",
+            "<div class='a > b' data-x=\"y\" hidden>line 1 <b>bold</b></div>"
+            "<hr/><input disabled/><blockquote>quoted</blockquote>",
+            "Let&apos;s handle&nbsp;special html encoding &amp; more",
+            "<p>x<hr>y</p><td>a</td>\t\n<th>b</th><pre>c   d</pre>",
+            "<font color=3D\"#FF0000\">red font</font>",
+            "<!DOCTYPE html><p>text</p>"):
+        assert convert(content) == feed(content)
+        assert html_to_text(content) == feed(content)
+
+    # Content we leave for HTMLParser to deal with
+    for content in (
+            "<!-- comment --><p>text</p>",
+            "<!DOCTYPE html",
+            "<?xml version='1.0'?>text",
+            "1 < 2",
+            "<p line 3",
+            "<p>line 1</>",
+            "<a href=/path/>link</a>",
+            "<style>unterminated",
+            "AT&T",
+            None):
+        assert convert(content) is None
+
+    # HTMLParser still reports on content it can not handle
+    with pytest.raises(TypeError):
+        html_to_text(None)
@@ -27,6 +27,9 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import pytest
+import threading
+from unittest import mock
+import time
 from datetime import datetime
 from datetime import timedelta
 
@@ -360,3 +363,129 @@ def test_notify_base_urls():
     assert NotifyBase.parse_url('http:///') is None
     assert NotifyBase.parse_url('http://:test/') is None
     assert NotifyBase.parse_url('http://pass:test/') is None
+
+
+def test_notify_base_send_targets():
+    """
+    API: NotifyBase() _send_targets()
+
+    """
+    nb = NotifyBase()
+
+    lock = threading.Lock()
+    delivered = []
+    active = {'now': 0, 'peak': 0}
+
+    def _send(target, payload, fail=None):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+
+        # Give the other workers a chance to start
+        time.sleep(0.02)
+
+        with lock:
+            active['now'] -= 1
+            delivered.append((target, payload))
+
+        return target != fail
+
+    # Nothing to deliver to
+    assert nb._send_targets(_send, [], 'payload') is True
+    assert not delivered
+
+    # Deliver to all of our targets at once
+    nb.target_concurrency = 4
+    targets = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j']
+    assert nb._send_targets(_send, targets, 'payload') is True
+    assert sorted(t for t, _ in delivered) == targets
+    assert all(p == 'payload' for _, p in delivered)
+
+    # We never exceeded our concurrency window
+    assert 1 < active['peak'] <= 4
+
+    # A single failure is reported, but every target is still attempted
+    del delivered[:]
+    assert nb._send_targets(_send, targets, 'payload', fail='c') is False
+    assert len(delivered) == len(targets)
+
+    # Sequential delivery preserves our target ordering
+    del delivered[:]
+    active['peak'] = 0
+    nb.target_concurrency = 1
+    assert nb._send_targets(_send, targets, 'payload', fail='a') is False
+    assert [t for t, _ in delivered] == targets
+    assert active['peak'] == 1
+
+
+def test_notify_base_throttle_threads():
+    """
+    API: NotifyBase() throttle() from several threads at once
+
+    """
+    nb = NotifyBase()
+    nb.request_rate_per_sec = 0.2
+
+    lock = threading.Lock()
+    wakeups = []
+
+    def _sleep(delay):
+        # We never sleep while holding our throttle lock
+        assert not nb._throttle_lock.locked()
+        with lock:
+            wakeups.append(datetime.now() + timedelta(seconds=delay))
+
+    # Our first call establishes our reference time
+    nb.throttle()
+
+    with mock.patch('apprise.url.time.sleep', side_effect=_sleep):
+        threads = [threading.Thread(target=nb.throttle) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    # Each call reserved it's own slot, spaced apart from the one before it
+    assert len(wakeups) == 4
+    wakeups.sort()
+    for prev, wakeup in zip(wakeups, wakeups[1:]):
+        assert 0.15 < (wakeup - prev).total_seconds() < 0.25
+
+    # Our next request can't be made until the last slot has passed
+    assert nb._last_io_datetime >= wakeups[-1] - timedelta(seconds=0.05)
+
+
+def test_notify_base_batches():
+    """
+    API: NotifyBase() _batches() and _batch_count()
+
+    """
+    nb = NotifyBase()
+
+    # Our default batch size is 1
+    assert nb._batches(['a', 'b', 'c']) == [['a'], ['b'], ['c']]
+    assert nb._batch_count(['a', 'b', 'c']) == 3
+
+    # Nothing to batch
+    assert nb._batches([]) == []
+    assert nb._batch_count([]) == 0
+    assert nb._batch_count(0, 10) == 0
+
+    # Batches of a specified size; the last one picks up the remainder
+    targets = [str(no) for no in range(7)]
+    assert nb._batches(targets, 3) == \
+        [['0', '1', '2'], ['3', '4', '5'], ['6']]
+    assert nb._batch_count(targets, 3) == 3
+    assert nb._batch_count(len(targets), 7) == 1
+
+    # Generators and tuples are supported too
+    assert nb._batches((t for t in targets), 5) == [targets[:5], targets[5:]]
+
+    # Our class batch size is used when one isn't specified
+    nb.default_batch_size = 4
+    assert nb._batches(targets) == [targets[:4], targets[4:]]
+    assert nb._batch_count(targets) == 2
+
+    # Invalid batch sizes fall back to delivering one at a time
+    assert nb._batches(['a', 'b'], -1) == [['a'], ['b']]
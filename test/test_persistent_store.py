@@ -36,10 +36,21 @@ import json
 import gzip
 from unittest import mock
 from datetime import datetime, timedelta, timezone
-from apprise import exception
+from apprise import Apprise, exception
 from apprise.asset import AppriseAsset
+from apprise.common import PersistentStoreCodec, PERSISTENT_STORE_CODECS
 from apprise.persistent_store import (
-    CacheJSONEncoder, CacheObject, PersistentStore, PersistentStoreMode)
+    CacheJSONEncoder, CacheObject, PersistentStore, PersistentStoreMode,
+    PersistentStoreIndex, PersistentStoreRegistry, _flush_pending_stores,
+    CACHE_HEADER_MAGIC, MSGPACK_SUPPORT)
+
+try:
+    # Used to verify the content of our msgpack based cache files
+    import msgpack
+
+except ImportError:
+    # No problem; our msgpack tests are skipped
+    pass
 
 # Disable logging for a cleaner testing output
 import logging
@@ -319,9 +330,11 @@ def test_persistent_storage_flush_mode(tmpdir):
     assert 'key' in pc
     assert pc.get('key') == 'value2'
 
-    # A directory was created identified by the namespace
-    assert len(os.listdir(str(tmpdir))) == 1
+    # A directory was created identified by the namespace (along side of
+    # the index of our storage path)
+    assert len(os.listdir(str(tmpdir))) == 2
     assert namespace in os.listdir(str(tmpdir))
+    assert PersistentStoreIndex.filename in os.listdir(str(tmpdir))
 
     path_content = os.listdir(path)
     assert len(path_content) == 4
@@ -1525,3 +1538,805 @@ def test_persistent_storage_disk_changes(tmpdir):
     shutil.rmtree(pc.path)
     assert not os.path.isdir(pc.path)
     assert pc.set('key-t01', 'value')
+
+
+def test_persistent_storage_journal(tmpdir):
+    """
+    Persistent Storage Journal Testing
+
+    """
+    namespace = 'abc'
+
+    asset = AppriseAsset(storage_path=str(tmpdir), storage_journal=True)
+    assert asset.storage_journal is True
+    assert AppriseAsset().storage_journal is False
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=True)
+    assert pc.journal is True
+
+    # Our changes are appended to our journal; our cache file is never
+    # written
+    assert pc.set('key1', 'value1') is True
+    assert pc.set('key2', b'value2') is True
+    assert pc.set('key3', 'value3', persistent=False) is True
+    del pc['key2']
+    pc['key1'] = 'updated'
+    assert not os.path.exists(pc.cache_file)
+    with open(pc.journal_file, 'r') as f:
+        records = [json.loads(line) for line in f]
+    assert [r['k'] for r in records] == \
+        ['key1', 'key2', 'key3', 'key2', 'key1']
+    assert 'v' in records[0]
+    # Removed and non-persistent entries are journaled without a value
+    assert not any('v' in r for r in records[2:4])
+
+    # Our journal is applied when our content is loaded
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=True)
+    assert pc.get('key1') == 'updated'
+    assert pc.get('key2') is None
+    assert pc.get('key3') is None
+    assert set(pc.keys()) == {'key1'}
+
+    # Our journal is compacted into our cache file once it grows too large
+    with mock.patch.object(PersistentStore, 'journal_compact_threshold', 8):
+        # 5 records are already journaled
+        for no in range(2):
+            assert pc.set(f'key{no}', no) is True
+
+        assert os.path.exists(pc.journal_file)
+        assert pc.set('key2', 2) is True
+        assert os.path.exists(pc.cache_file)
+        assert not os.path.exists(pc.journal_file)
+
+        # We journal again afterwards
+        assert pc.set('key4', 4) is True
+        assert os.path.exists(pc.journal_file)
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=True)
+    assert pc.get('key1') == 1
+    assert pc.get('key2') == 2
+    assert pc.get('key4') == 4
+
+    # A partially written record is ignored and forces us to rewrite our
+    # cache file on our next flush
+    with open(pc.journal_file, 'ab') as f:
+        f.write(b'{"k":"key5","v":')
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.AUTO, journal=True)
+    assert pc.get('key4') == 4
+    assert pc.get('key5') is None
+    assert pc.flush() is True
+    assert not os.path.exists(pc.journal_file)
+
+    # We journal again afterwards
+    assert pc.set('key5', 5) is True
+    assert pc.flush() is True
+    assert os.path.exists(pc.journal_file)
+
+    # Records we can't otherwise use are skipped
+    with open(pc.journal_file, 'a') as f:
+        f.write('[]\n{"k":1}\n{"k":"key1","v":{"bad":"data"}}\n')
+
+    # Journals left behind are folded into our cache file when we aren't
+    # journaling
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.AUTO)
+    assert pc.get('key5') == 5
+    assert pc.get('key1') is None
+    assert pc.flush() is True
+    assert not os.path.exists(pc.journal_file)
+    assert pc.get('key5') == 5
+
+    # Clearing all of our entries removes our journal
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=True)
+    assert pc.set('key6', 6) is True
+    assert os.path.exists(pc.journal_file)
+    pc.clear()
+    assert not os.path.exists(pc.journal_file)
+    assert not os.path.exists(pc.cache_file)
+
+    # Deleting our cache removes our journal as well
+    assert pc.set('key6', 6) is True
+    assert os.path.exists(pc.journal_file)
+    assert pc.delete(cache=True) is True
+    assert not os.path.exists(pc.journal_file)
+
+    # A journal we can not decode is treated as corrupted
+    with open(pc.journal_file, 'wb') as f:
+        f.write(b'\xff\xfe\xfa')
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=True)
+    assert pc.get('key6') is None
+    assert pc.set('key6', 6) is True
+    assert not os.path.exists(pc.journal_file)
+    assert pc.get('key6') == 6
+
+    # A journal we can not access prevents our cache from loading
+    assert pc.set('key7', 7) is True
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=True)
+    with mock.patch('builtins.open', side_effect=OSError()):
+        assert pc.get('key7') is None
+
+    # Handle failures appending to our journal; we fall back to rewriting
+    # our cache file
+    assert pc.get('key7') == 7
+    os.unlink(pc.journal_file)
+    os.mkdir(pc.journal_file)
+    assert pc.set('key8', 8) is True
+    os.rmdir(pc.journal_file)
+    assert pc.get('key8') == 8
+
+    # Bad content can not be journaled
+    assert pc.set('key9', object()) is False
+    pc.clear('key9')
+    assert pc.get('key9') is None
+
+    # Handle failures removing our journal
+    assert pc.set('key10', 10) is True
+    assert os.path.exists(pc.journal_file)
+    with mock.patch('os.unlink', side_effect=OSError()):
+        pc.clear()
+    assert os.path.exists(pc.journal_file)
+
+
+@pytest.mark.parametrize('journal', (False, True))
+def test_persistent_storage_concurrent_access(tmpdir, journal):
+    """
+    Persistent Storage shared between processes
+
+    """
+    namespace = 'abc'
+
+    # Two stores (as though they were in separate processes) sharing the
+    # same namespace
+    pc1 = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=journal)
+    pc2 = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.AUTO, journal=journal)
+
+    # Load both caches
+    assert pc1.get('key') is None
+    assert pc2.get('key') is None
+
+    assert pc1.set('key1', 'value1') is True
+
+    # Our changes are detected by our other store
+    assert pc2.get('key1') == 'value1'
+    assert 'key1' in pc2
+    assert set(pc2.keys()) == {'key1'}
+
+    # Our unflushed changes are preserved when we detect external ones
+    assert pc2.set('key2', 'value2') is True
+    assert pc1.set('key3', 'value3') is True
+    assert pc1.set('key1', 'updated') is True
+    assert pc2.get('key1') == 'updated'
+    assert pc2.get('key2') == 'value2'
+
+    # Our changes are merged with those made elsewhere when we write
+    assert pc1.set('key4', 'value4') is True
+    assert pc2.flush() is True
+    assert pc1.get('key2') == 'value2'
+    assert pc1.get('key4') == 'value4'
+
+    pc3 = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, journal=journal)
+    assert set(pc3.keys()) == {'key1', 'key2', 'key3', 'key4'}
+
+    # Removals are merged too
+    del pc1['key3']
+    assert pc2.set('key5', 'value5') is True
+    assert pc2.flush() is True
+    assert set(pc3.keys()) == {'key1', 'key2', 'key4', 'key5'}
+
+    # Renewing our content is not detected as a change to it
+    with mock.patch.object(pc3, '_PersistentStore__read_cache') as mock_read:
+        assert pc3.get('key1') == 'updated'
+        assert pc3.flush() is True
+        assert pc3.get('key1') == 'updated'
+        assert mock_read.call_count == 0
+
+    # Our files are only looked at once when checking for changes
+    assert pc1.set('key1', 'changed') is True
+    with mock.patch('os.stat', wraps=os.stat) as mock_stat:
+        assert pc2.get('key1') == 'changed'
+        stats = [c[0][0] for c in mock_stat.call_args_list]
+        assert stats.count(pc2.cache_file) == 1
+        assert stats.count(pc2.journal_file) == 1
+
+        # Nothing changed
+        mock_stat.reset_mock()
+        assert pc2.get('key1') == 'changed'
+        assert mock_stat.call_count == 2
+
+    if journal:
+        # Our journal was compacted (replaced) before we could read it
+        assert pc1.set('key1', 'compacted') is True
+        with mock.patch('os.fstat', return_value=mock.Mock(st_ino=-1)), \
+                mock.patch.object(
+                    pc2, '_PersistentStore__read_cache',
+                    wraps=pc2._PersistentStore__read_cache) as mock_read:
+            assert pc2.get('key1') == 'compacted'
+            assert mock_read.call_count == 1
+
+    # We gracefully handle not being able to lock our namespace
+    with mock.patch('fcntl.flock', side_effect=OSError()):
+        assert pc1.set('key6', 'value6') is True
+    assert pc2.get('key6') == 'value6'
+
+    # Locking isn't available on all platforms
+    with mock.patch('apprise.persistent_store.fcntl', None):
+        assert pc1.set('key7', 'value7') is True
+        assert pc2.get('key7') == 'value7'
+
+    # We gracefully handle not being able to reload our content
+    assert pc1.set('key8', 'value8') is True
+    with mock.patch('gzip.open', side_effect=OSError()), \
+            mock.patch('builtins.open', side_effect=OSError()):
+        assert pc2.get('key8') is None
+    assert pc2.get('key8') == 'value8'
+
+
+def test_persistent_storage_write_behind(tmpdir):
+    """
+    Persistent Storage Write-Behind Testing
+
+    """
+    namespace = 'abc'
+
+    asset = AppriseAsset(storage_path=str(tmpdir), storage_flush_interval=2)
+    assert asset.storage_flush_interval == 2
+    assert AppriseAsset().storage_flush_interval == 0
+    with pytest.raises(ValueError):
+        AppriseAsset(storage_flush_interval=-1)
+    with pytest.raises(ValueError):
+        AppriseAsset(storage_flush_interval='invalid')
+
+    for interval in (-1, 'invalid', object()):
+        with pytest.raises(AttributeError):
+            PersistentStore(
+                namespace=namespace, path=str(tmpdir),
+                mode=PersistentStoreMode.FLUSH, flush_interval=interval)
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, flush_interval=60)
+    assert pc.flush_interval == 60.0
+
+    # Our changes are held in memory
+    with mock.patch('threading.Timer') as mock_timer:
+        assert pc.set('key1', 'value1') is True
+        assert pc.set('key2', 'value2') is True
+        assert pc.clear('key2') is True
+        assert not os.path.exists(pc.cache_file)
+
+        # Only one timer is started for our batch of changes
+        assert mock_timer.call_count == 1
+        interval, callback = mock_timer.call_args[0]
+        assert interval == 60.0
+
+        # Our timer writes our changes to disk
+        callback()
+        assert os.path.isfile(pc.cache_file)
+        assert PersistentStore(
+            namespace=namespace, path=str(tmpdir)).get('key1') == 'value1'
+
+        # A new batch starts a new timer
+        assert pc.set('key3', 'value3') is True
+        assert mock_timer.call_count == 2
+
+        # Flushing ourselves cancels it
+        assert pc.flush() is True
+        assert mock_timer.return_value.cancel.call_count == 1
+        assert PersistentStore(
+            namespace=namespace, path=str(tmpdir)).get('key3') == 'value3'
+
+        # Too many changes are written to disk immediately
+        with mock.patch.object(pc, 'flush_max_changes', 2):
+            assert pc.set('key4', 'value4') is True
+            assert pc.set('key5', 'value5') is True
+            assert PersistentStore(
+                namespace=namespace,
+                path=str(tmpdir)).get('key5') == 'value5'
+
+        # Outstanding changes are written when our interpreter exits
+        assert pc.set('key6', 'value6') is True
+        _flush_pending_stores()
+        assert PersistentStore(
+            namespace=namespace, path=str(tmpdir)).get('key6') == 'value6'
+
+    # Our timer fires on it's own too
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, flush_interval=0.01)
+    assert pc.set('key7', 'value7') is True
+    for _ in range(200):
+        if PersistentStore(
+                namespace=namespace, path=str(tmpdir)).get('key7'):
+            break
+        time.sleep(0.01)
+    assert PersistentStore(
+        namespace=namespace, path=str(tmpdir)).get('key7') == 'value7'
+
+    # Memory based stores never write anything
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.MEMORY, flush_interval=60)
+    assert pc.set('key8', 'value8') is True
+    _flush_pending_stores()
+    assert PersistentStore(
+        namespace=namespace, path=str(tmpdir)).get('key8') is None
+
+
+@pytest.mark.parametrize('codec', PERSISTENT_STORE_CODECS)
+def test_persistent_storage_codecs(tmpdir, codec):
+    """
+    Persistent Storage Codec Testing
+
+    """
+    namespace = 'abc'
+
+    asset = AppriseAsset(storage_path=str(tmpdir), storage_codec=codec)
+    assert asset.storage_codec == codec
+    assert AppriseAsset().storage_codec == PersistentStoreCodec.GZIP
+    with pytest.raises(ValueError):
+        AppriseAsset(storage_codec='invalid')
+    with pytest.raises(AttributeError):
+        PersistentStore(namespace=namespace, path=str(tmpdir), codec='bad')
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, codec=codec)
+    if codec == PersistentStoreCodec.MSGPACK and not MSGPACK_SUPPORT:
+        # We fall back to a codec we can support
+        assert pc.codec == PersistentStoreCodec.ZLIB
+
+    else:
+        assert pc.codec == codec
+
+    now = datetime.now(tz=timezone.utc)
+    assert pc.set('str', 'value') is True
+    assert pc.set('int', 42) is True
+    assert pc.set('bytes', b'\x00\x01value') is True
+    assert pc.set('datetime', now) is True
+    assert pc.set('list', [1, 'two', 3.0]) is True
+    assert pc.set('expires', 'value', expires=3600) is True
+
+    with open(pc.cache_file, 'rb') as f:
+        header = f.read(len(CACHE_HEADER_MAGIC))
+    if pc.codec == PersistentStoreCodec.GZIP:
+        # Our original format has no header
+        assert header[:2] == b'\x1f\x8b'
+
+    else:
+        assert header == CACHE_HEADER_MAGIC
+
+    # Our content is read back regardless of the codec we've been set to
+    # write with
+    for _codec in (codec, PersistentStoreCodec.GZIP,
+                   PersistentStoreCodec.JSON):
+        pc = PersistentStore(
+            namespace=namespace, path=str(tmpdir),
+            mode=PersistentStoreMode.FLUSH, codec=_codec)
+        assert pc.get('str') == 'value'
+        assert pc.get('int') == 42
+        assert pc.get('bytes') == b'\x00\x01value'
+        assert pc.get('datetime') == now
+        assert pc.get('list') == [1, 'two', 3.0]
+        assert pc.get('expires') == 'value'
+
+    # Our last store re-writes our cache in it's own format
+    assert pc.set('str', 'updated') is True
+    with open(pc.cache_file, 'rb') as f:
+        assert f.read(len(CACHE_HEADER_MAGIC) + 2) == \
+            CACHE_HEADER_MAGIC + b'\x01\x01'
+
+    # Content that can't be encoded is not written
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, codec=codec)
+    assert pc.set('bad', object()) is False
+    pc.clear('bad')
+    assert pc.get('str') == 'updated'
+
+    # Cache files we don't recognize are treated as corrupted
+    for content in (
+            b'{}',
+            CACHE_HEADER_MAGIC,
+            # Content not matching our codec
+            CACHE_HEADER_MAGIC + b'\x01\x02{}',
+            CACHE_HEADER_MAGIC + b'\x01\x01\xff\xfe'):
+
+        with open(pc.cache_file, 'wb') as f:
+            f.write(content)
+
+        pc = PersistentStore(
+            namespace=namespace, path=str(tmpdir),
+            mode=PersistentStoreMode.FLUSH, codec=codec)
+        assert pc.get('str') is None
+        assert not os.path.exists(pc.cache_file)
+
+    # Cache files written in a format we recognize but can't decode are
+    # left alone; they may belong to another (newer) process
+    for content in (
+            # Unsupported header version
+            CACHE_HEADER_MAGIC + b'\x02\x01{}',
+            # Unsupported codec
+            CACHE_HEADER_MAGIC + b'\x01\xff{}'):
+
+        with open(pc.cache_file, 'wb') as f:
+            f.write(content)
+
+        pc = PersistentStore(
+            namespace=namespace, path=str(tmpdir),
+            mode=PersistentStoreMode.FLUSH, codec=codec)
+        assert pc.get('str') is None
+        assert pc.set('str', 'value') is False
+        with open(pc.cache_file, 'rb') as f:
+            assert f.read() == content
+
+
+@pytest.mark.skipif(
+    not MSGPACK_SUPPORT, reason="Requires msgpack")
+def test_persistent_storage_msgpack(tmpdir):
+    """
+    Persistent Storage msgpack Codec Testing
+
+    """
+    namespace = 'abc'
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH, codec=PersistentStoreCodec.MSGPACK)
+    assert pc.codec == PersistentStoreCodec.MSGPACK
+
+    now = datetime.now(tz=timezone.utc)
+    assert pc.set('str', 'value') is True
+    assert pc.set('bytes', b'\x00\x01value') is True
+    assert pc.set('datetime', now) is True
+
+    with open(pc.cache_file, 'rb') as f:
+        header = f.read(len(CACHE_HEADER_MAGIC) + 2)
+        content = f.read()
+    assert header == CACHE_HEADER_MAGIC + b'\x01\x03'
+
+    # Our content is genuine msgpack; binary content is stored as is
+    data = msgpack.unpackb(content, raw=False)
+    assert set(data.keys()) == {'str', 'bytes', 'datetime'}
+    assert isinstance(data['bytes']['v'], bytes)
+
+    # It is read back again by a new object
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH)
+    assert pc.get('str') == 'value'
+    assert pc.get('bytes') == b'\x00\x01value'
+    assert pc.get('datetime') == now
+
+    # A process without msgpack can't read our cache, but leaves it be
+    with mock.patch('apprise.persistent_store.MSGPACK_SUPPORT', False):
+        pc = PersistentStore(
+            namespace=namespace, path=str(tmpdir),
+            mode=PersistentStoreMode.FLUSH)
+        assert pc.get('str') is None
+        assert pc.set('str', 'updated') is False
+
+    with open(pc.cache_file, 'rb') as f:
+        assert f.read() == header + content
+
+    # Corrupted msgpack content is still removed
+    with open(pc.cache_file, 'wb') as f:
+        f.write(header + b'\xc1')
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir),
+        mode=PersistentStoreMode.FLUSH)
+    assert pc.get('str') is None
+    assert not os.path.exists(pc.cache_file)
+
+
+def test_persistent_storage_index(tmpdir):
+    """
+    Persistent Storage Index Testing
+
+    """
+
+    asset = AppriseAsset(storage_path=str(tmpdir), storage_prune_interval=60)
+    assert asset.storage_prune_interval == 60
+    assert AppriseAsset().storage_prune_interval == 0
+    for interval in (-1, 'invalid'):
+        with pytest.raises(ValueError):
+            AppriseAsset(storage_prune_interval=interval)
+        with pytest.raises(AttributeError):
+            PersistentStore(
+                namespace='abc', path=str(tmpdir), prune_interval=interval)
+
+    # Our size is tracked as we write to disk without re-scanning
+    pc = PersistentStore(
+        namespace='abc', path=str(tmpdir), mode=PersistentStoreMode.FLUSH)
+    assert pc.size() == 0
+    with mock.patch('glob.glob') as mock_glob:
+        assert pc.set('key', 'value') is True
+        assert pc.write(b'data', key='io') is True
+        assert pc.write(b'more-data', key='io') is True
+        assert pc.set('key', 'value2') is True
+        assert mock_glob.call_count == 0
+
+        size = pc.size()
+        files = pc.files()
+        assert size > 0
+        assert len(files) == 2
+        assert mock_glob.call_count == 0
+
+    assert pc.size(lazy=False) == size
+    assert sorted(pc.files(lazy=False)) == sorted(files)
+    assert pc.size(exclude=False) > size
+
+    # Our namespace was indexed when it was created
+    index = PersistentStoreIndex(str(tmpdir))
+    entries = index.load()
+    assert set(entries.keys()) == {'abc'}
+    assert entries['abc']['s'] == 0
+    assert entries['abc']['o'] is None
+
+    # ... but our index is never touched as we write to it
+    with mock.patch.object(PersistentStoreIndex, 'append') as mock_append:
+        assert pc.set('key', 'value3') is True
+        assert pc.write(b'data', key='io2') is True
+        assert pc.delete('io2') is True
+        assert mock_append.call_count == 0
+
+    # Namespaces we've yet to index are still detected
+    os.mkdir(os.path.join(str(tmpdir), 'def'))
+    with open(os.path.join(str(tmpdir), 'def', 'unindexed'), 'wb') as f:
+        f.write(b'12345')
+
+    with open(index.path, 'rb') as f:
+        content = f.read()
+
+    assert PersistentStore.disk_usage(str(tmpdir)) == {
+        'abc': pc.size(exclude=False), 'def': 5}
+    assert PersistentStore.disk_usage(str(tmpdir), namespace='d') == {
+        'def': 5}
+    assert sorted(PersistentStore.disk_scan(str(tmpdir))) == ['abc', 'def']
+
+    # Listing our namespaces never writes to our index
+    with open(index.path, 'rb') as f:
+        assert f.read() == content
+
+    # Indexed namespaces are not verified
+    with mock.patch('os.path.isdir', return_value=False) as mock_isdir:
+        assert PersistentStore.disk_scan(str(tmpdir)) == ['abc']
+        assert mock_isdir.call_count == 1
+
+    # Our index is updated when we prune
+    results = PersistentStore.disk_prune(path=str(tmpdir), expires=30)
+    assert results == {'abc': [], 'def': []}
+    entries = index.load()
+    assert entries['abc']['s'] == pc.size(exclude=False)
+    assert entries['abc']['o'] <= time.time()
+    assert entries['def']['s'] == 5
+
+    # Only the namespaces holding expired content are pruned
+    with mock.patch('os.path.getmtime') as mock_getmtime:
+        results = PersistentStore.disk_prune(path=str(tmpdir), expires=30)
+        assert results == {'abc': [], 'def': []}
+        assert mock_getmtime.call_count == 0
+
+    results = PersistentStore.disk_prune(path=str(tmpdir), expires=0)
+    assert len(results['abc']) == 4
+    assert len(results['def']) == 0
+    assert index.pruned is None
+
+    results = PersistentStore.disk_prune(
+        path=str(tmpdir), expires=0, action=True)
+    assert len(results['abc']) == 4
+    assert not os.path.exists(os.path.join(str(tmpdir), 'abc'))
+    index.load()
+    assert index.pruned is not None
+
+    # Removed namespaces are dropped from our index
+    assert set(index.load().keys()) == {'def'}
+    shutil.rmtree(os.path.join(str(tmpdir), 'def'))
+    assert PersistentStore.disk_usage(str(tmpdir)) == {}
+    assert set(index.load().keys()) == {'def'}
+    assert PersistentStore.disk_prune(path=str(tmpdir)) == {}
+    assert index.load() == {}
+
+    # Torn records are ignored
+    with open(index.path, 'ab') as f:
+        f.write(b'{"n":"abc","s"\n\xff\xfe\n[]\n{"n": "abc", "s": 1}\n')
+    assert set(index.load().keys()) == {'abc'}
+
+    # Our index is compacted as it grows
+    with mock.patch.object(PersistentStoreIndex, 'compact_threshold', 2):
+        for _ in range(4):
+            assert index.update('xyz', 1) is True
+        assert index.remove('xyz') is True
+        assert index.remove() is True
+        assert set(index.load().keys()) == {'abc'}
+        with open(index.path, 'rb') as f:
+            assert len(f.readlines()) == 2
+
+        # ... even when it is only ever appended to
+        for _ in range(50):
+            assert index.update('xyz', 1) is True
+        with open(index.path, 'rb') as f:
+            assert len(f.readlines()) <= 6
+        assert set(index.load().keys()) == {'abc', 'xyz'}
+        assert index.remove('xyz') is True
+
+    # Records appended by others while we compact are never lost
+    other = PersistentStoreIndex(str(tmpdir))
+    entries = index.load()
+    assert other.update('new', 1) is True
+    assert index.compact() is True
+    assert set(index.load().keys()) == set(entries.keys()) | {'new'}
+
+    # Index errors are gracefully handled
+    with mock.patch('os.replace', side_effect=OSError()):
+        assert index.compact() is False
+    with mock.patch('fcntl.flock', side_effect=OSError()):
+        assert index.update('xyz', 1) is True
+    with mock.patch('builtins.open', side_effect=OSError()):
+        assert index.update('xyz', 1) is False
+        assert index.load() == {}
+
+
+def test_persistent_storage_background_prune(tmpdir):
+    """
+    Persistent Storage Background Prune Testing
+
+    """
+
+    path = str(tmpdir)
+    pc = PersistentStore(
+        namespace='abc', path=path, mode=PersistentStoreMode.FLUSH)
+    assert pc.set('key', 'value') is True
+
+    # Make our content appear old
+    expired = time.time() - PersistentStore.default_file_expiry - 60
+    os.utime(pc.cache_file, (expired, expired))
+    index = PersistentStoreIndex(path)
+    index.update('abc', pc.size(exclude=False), expired)
+
+    # Our prune takes place in the background the first time a store is
+    # initialized for our path
+    with mock.patch.dict(
+            'apprise.persistent_store._PRUNE_SCHEDULE', clear=True):
+        with mock.patch('threading.Thread') as mock_thread:
+            PersistentStore(namespace='def', path=path, prune_interval=60)
+            assert mock_thread.call_count == 1
+
+            # ... but not again until it's due
+            PersistentStore(namespace='def', path=path, prune_interval=60)
+            assert mock_thread.call_count == 1
+
+            # Memory stores are never pruned
+            PersistentStore(
+                namespace='def', path=path, prune_interval=60,
+                mode=PersistentStoreMode.MEMORY)
+            assert mock_thread.call_count == 1
+
+            _prune = mock_thread.call_args[1]['target']
+
+        _prune()
+        assert not os.path.exists(pc.cache_file)
+        index.load()
+        assert index.pruned is not None
+
+    # Another process pruned our path recently
+    with mock.patch.dict(
+            'apprise.persistent_store._PRUNE_SCHEDULE', clear=True):
+        pc = PersistentStore(
+            namespace='abc', path=path, mode=PersistentStoreMode.FLUSH)
+        assert pc.set('key', 'value') is True
+        os.utime(pc.cache_file, (expired, expired))
+        index.update('abc', pc.size(exclude=False), expired)
+
+        thread = PersistentStore.disk_prune_schedule(path, 60)
+        thread.join()
+        assert os.path.exists(pc.cache_file)
+        assert PersistentStore.disk_prune_schedule(path, 60) is None
+
+
+def test_persistent_storage_registry(tmpdir):
+    """
+    Persistent Storage Registry Testing
+
+    """
+
+    registry = PersistentStoreRegistry()
+    path = str(tmpdir)
+
+    # The same namespace (and settings) share the same store
+    pc1 = registry.acquire(namespace='abc', path=path)
+    pc2 = registry.acquire(namespace='abc', path=path)
+    assert pc1 is pc2
+    assert len(registry) == 1
+
+    # Anything different is not shared
+    others = (
+        registry.acquire(namespace='def', path=path),
+        registry.acquire(
+            namespace='abc', path=path, mode=PersistentStoreMode.FLUSH),
+        registry.acquire(namespace='abc', path=path, journal=True),
+    )
+    assert not any(pc is pc1 for pc in others)
+    assert len(registry) == 4
+
+    # Memory based stores are never shared
+    pc3 = registry.acquire(namespace='abc')
+    assert pc3.mode == PersistentStoreMode.MEMORY
+    assert registry.acquire(namespace='abc') is not pc3
+    assert registry.acquire(
+        namespace='abc', path=path, mode=PersistentStoreMode.MEMORY) \
+        is not pc3
+    with mock.patch('os.makedirs', side_effect=OSError()):
+        assert registry.acquire(namespace='ghi', path=path).mode == \
+            PersistentStoreMode.MEMORY
+    assert len(registry) == 4
+    registry.release(pc3)
+
+    # Our changes are written to disk once our last reference is released
+    assert pc1.set('key', 'value') is True
+    assert not os.path.exists(pc1.cache_file)
+    registry.release(pc1)
+    assert not os.path.exists(pc1.cache_file)
+    registry.release(pc2)
+    assert os.path.exists(pc1.cache_file)
+
+    # Idle stores are re-used without being re-loaded from disk
+    with mock.patch('gzip.open') as mock_open:
+        pc = registry.acquire(namespace='abc', path=path)
+        assert pc is pc1
+        assert pc.get('key') == 'value'
+        assert mock_open.call_count == 0
+    registry.release(pc)
+
+    # ... up to a point
+    with mock.patch.object(registry, 'max_idle', 1):
+        for pc in others:
+            registry.release(pc)
+
+        # Only our most recently released store is kept
+        assert len(registry) == 1
+        assert registry.acquire(namespace='abc', path=path) is not pc1
+        assert registry.acquire(namespace='abc', path=path, journal=True) \
+            is others[2]
+
+    # Releasing stores we don't manage has no effect
+    registry.release(pc1)
+
+    registry.clear()
+    assert len(registry) == 0
+
+    # Plugins share stores through our process-wide registry
+    asset = AppriseAsset(storage_path=path)
+    obj1 = Apprise.instantiate('json://localhost', asset=asset)
+    obj2 = Apprise.instantiate('json://localhost', asset=asset)
+    assert obj1.store is obj2.store
+    assert obj1.store is not Apprise.instantiate(
+        'json://localhost', asset=AppriseAsset()).store
+
+    pc = obj1.store
+    assert pc.set('key', 'value') is True
+    del obj1
+    assert not os.path.exists(pc.cache_file)
+    del obj2
+    assert os.path.exists(pc.cache_file)
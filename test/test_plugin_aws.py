@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2024, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+from datetime import datetime
+from datetime import timezone
+from unittest import mock
+
+import requests
+from apprise import Apprise
+from apprise.plugins import aws
+from apprise.plugins.aws import SIGNING_KEY_CACHE
+from apprise.plugins.aws import aws_signing_key
+from apprise.plugins.aws import aws_prepare_request
+from apprise.plugins.aws import aws_response_to_dict
+
+# Disable logging for a cleaner testing output
+import logging
+logging.disable(logging.CRITICAL)
+
+
+def test_plugin_aws_signing_key():
+    """
+    AWS Signing Key Derivation
+
+    """
+
+    # Source: https://docs.aws.amazon.com/general/latest/gr/\
+    #             signature-v4-examples.html
+    assert aws_signing_key(
+        'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY', '20120215',
+        'us-east-1', 'iam').hex() == \
+        'f4780e2d9f65fa895f9c67b32ce1baf0b0d8a43505a000a1a9e090d414db404d'
+
+    assert len(SIGNING_KEY_CACHE) == 0
+    assert SIGNING_KEY_CACHE.hits == 0
+    assert SIGNING_KEY_CACHE.misses == 0
+
+    key = SIGNING_KEY_CACHE.get('secret', '20240501', 'us-east-1', 'sns')
+    assert key == aws_signing_key('secret', '20240501', 'us-east-1', 'sns')
+    assert len(SIGNING_KEY_CACHE) == 1
+    assert SIGNING_KEY_CACHE.misses == 1
+
+    with mock.patch.object(
+            aws, 'aws_signing_key', wraps=aws_signing_key) as mock_derive:
+
+        # Our key is only derived once
+        for _ in range(3):
+            assert SIGNING_KEY_CACHE.get(
+                'secret', '20240501', 'us-east-1', 'sns') == key
+        assert mock_derive.call_count == 0
+        assert SIGNING_KEY_CACHE.hits == 3
+
+        # Each region, service and secret have their own key
+        assert SIGNING_KEY_CACHE.get(
+            'secret', '20240501', 'us-west-2', 'sns') != key
+        assert SIGNING_KEY_CACHE.get(
+            'secret', '20240501', 'us-east-1', 'ses') != key
+        assert SIGNING_KEY_CACHE.get(
+            'secret2', '20240501', 'us-east-1', 'sns') != key
+        assert mock_derive.call_count == 3
+        assert len(SIGNING_KEY_CACHE) == 4
+
+        # A new day replaces our key
+        assert SIGNING_KEY_CACHE.get(
+            'secret', '20240502', 'us-east-1', 'sns') != key
+        assert mock_derive.call_count == 4
+        assert len(SIGNING_KEY_CACHE) == 4
+
+    SIGNING_KEY_CACHE.clear()
+    assert len(SIGNING_KEY_CACHE) == 0
+    assert SIGNING_KEY_CACHE.hits == 0
+    assert SIGNING_KEY_CACHE.misses == 0
+
+
+def test_plugin_aws_prepare_request():
+    """
+    AWS Request Signing
+
+    """
+
+    reference = datetime(2024, 5, 1, 12, 30, 15, tzinfo=timezone.utc)
+    headers = aws_prepare_request(
+        'Action=Publish&Message=test',
+        access_key_id='AHIAJGNT76XIMXDBIJYA',
+        secret_access_key='bu1dHSdO22pfaaVy/wmNsdljF4C07D3bndi9PQJ9',
+        region='us-east-2', service='sns',
+        host='sns.us-east-2.amazonaws.com', user_agent='Apprise',
+        reference=reference)
+
+    assert headers['User-Agent'] == 'Apprise'
+    assert headers['Content-Length'] == '27'
+    assert headers['X-Amz-Date'] == '20240501T123015Z'
+    assert headers['Authorization'].startswith(
+        'AWS4-HMAC-SHA256 Credential=AHIAJGNT76XIMXDBIJYA/'
+        '20240501/us-east-2/sns/aws4_request, '
+        'SignedHeaders=content-type;host;x-amz-date, Signature=')
+    assert headers['Authorization'].endswith(
+        '494e776cabf3a6e0d5d43fc0008079d73e623ef3aa78255d73ee675aa18c63aa')
+
+    # Signing the same request again yields the same headers and re-uses
+    # our derived signing key
+    assert aws_prepare_request(
+        'Action=Publish&Message=test',
+        access_key_id='AHIAJGNT76XIMXDBIJYA',
+        secret_access_key='bu1dHSdO22pfaaVy/wmNsdljF4C07D3bndi9PQJ9',
+        region='us-east-2', service='sns',
+        host='sns.us-east-2.amazonaws.com', user_agent='Apprise',
+        reference=reference) == headers
+    assert SIGNING_KEY_CACHE.misses == 1
+    assert SIGNING_KEY_CACHE.hits == 1
+
+
+@mock.patch('requests.post')
+def test_plugin_aws_shared_signing_keys(mock_post):
+    """
+    AWS Signing Keys shared between notifications
+
+    """
+
+    response = mock.Mock()
+    response.text = ''
+    response.status_code = requests.codes.ok
+    mock_post.return_value = response
+
+    a = Apprise()
+    assert a.add(
+        'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnl/us-east-1/12223334444')
+    assert a.add(
+        'ses://user@example.com/T1JJ3T3L2/A1BRTD4JD/TIiajkdnl/us-east-1/'
+        'user2@example.com')
+
+    for _ in range(3):
+        assert a.notify(title='title', body='body') is True
+
+    assert mock_post.call_count == 6
+
+    # One signing key was derived for each of our services
+    assert len(SIGNING_KEY_CACHE) == 2
+    assert SIGNING_KEY_CACHE.misses == 2
+    assert SIGNING_KEY_CACHE.hits == 4
+
+
+def test_plugin_aws_response_to_dict():
+    """
+    AWS Response Handling
+
+    """
+
+    assert aws_response_to_dict(None) == {
+        'type': None, 'request_id': None, 'message_id': None}
+    assert aws_response_to_dict('<Bad') == {
+        'type': None, 'request_id': None, 'message_id': None}
+
+    response = aws_response_to_dict(
+        """
+        <PublishResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+            <PublishResult>
+                <MessageId>5e16935a-d1fb-5a31-a716-c7805e5c1d2e</MessageId>
+            </PublishResult>
+            <ResponseMetadata>
+                <RequestId>dc258024-d0e6-56bb-af1b-d4fe5f4181a4</RequestId>
+            </ResponseMetadata>
+        </PublishResponse>
+        """)
+    assert response == {
+        'type': 'PublishResponse',
+        'request_id': 'dc258024-d0e6-56bb-af1b-d4fe5f4181a4',
+        'message_id': '5e16935a-d1fb-5a31-a716-c7805e5c1d2e',
+    }
@@ -76,6 +76,13 @@ apprise_url_tests = (
         # reference to to= and from=
         'instance': NotifyMessageBird,
     }),
+    ('msgbird://{}/15551232000/15551232001/15551232002?batch=yes'.format(
+        'a' * 25), {
+        # test batch mode
+        'instance': NotifyMessageBird,
+        # Our expected url(privacy=True) startswith() response:
+        'privacy_url': 'msgbird://a...a/15551232000',
+    }),
     ('msgbird://{}/15551232000'.format('a' * 25), {
         'instance': NotifyMessageBird,
         # force a failure
@@ -130,3 +137,51 @@ def test_plugin_messagebird_edge_cases(mock_post):
         NotifyMessageBird(apikey=None, source=source)
     with pytest.raises(TypeError):
         NotifyMessageBird(apikey="     ", source=source)
+
+
+@mock.patch('requests.post')
+def test_plugin_messagebird_batch(mock_post):
+    """
+    NotifyMessageBird() Batch Mode
+
+    """
+
+    # Prepare our response
+    response = requests.Request()
+    response.status_code = requests.codes.ok
+
+    # Track the recipients of each post made (our payload is re-used)
+    recipients = []
+
+    def _post(*args, **kwargs):
+        recipients.append(kwargs['data']['recipients'])
+        return response
+
+    # Prepare Mock
+    mock_post.side_effect = _post
+
+    source = '15551233000'
+    targets = ['1555123{:04d}'.format(no) for no in range(120)]
+
+    # Without batch mode, each target is notified separately
+    obj = NotifyMessageBird(
+        apikey='a' * 25, source=source, targets=targets)
+    assert len(obj) == 120
+    assert obj.notify(body='body') is True
+    assert mock_post.call_count == 120
+    assert recipients[0] == '+15551230000'
+
+    mock_post.reset_mock()
+    del recipients[:]
+
+    # With batch mode, our targets are grouped together
+    obj = NotifyMessageBird(
+        apikey='a' * 25, source=source, targets=targets, batch=True)
+    assert len(obj) == 3
+    assert 'batch=yes' in obj.url()
+    assert obj.notify(body='body') is True
+    assert mock_post.call_count == 3
+    assert recipients[0].split(',') == \
+        ['+{}'.format(t) for t in targets[:50]]
+    assert recipients[2].split(',') == \
+        ['+{}'.format(t) for t in targets[100:]]
@@ -27,6 +27,8 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import re
+import time
+import threading
 from unittest import mock
 import pytest
 
@@ -38,6 +40,8 @@ import logging
 logging.disable(logging.CRITICAL)
 
 from apprise.plugins.rsyslog import NotifyRSyslog  # noqa E402
+from apprise.plugins.rsyslog import RSyslogTransport  # noqa E402
+from apprise.plugins.rsyslog import RSYSLOG_POOL  # noqa E402
 
 
 @mock.patch('socket.socket')
@@ -177,3 +181,296 @@ def test_plugin_rsyslog_edge_cases():
 
     with pytest.raises(TypeError):
         NotifyRSyslog(host="localhost", facility=object)
+
+
+@mock.patch('socket.getaddrinfo', wraps=socket.getaddrinfo)
+@mock.patch('socket.socket')
+@mock.patch('os.getpid')
+def test_plugin_rsyslog_udp_reuse(mock_getpid, mock_socket, mock_resolve):
+    """
+    NotifyRSyslog() UDP Socket Re-use
+
+    """
+    mock_getpid.return_value = 123
+    mock_connection = mock.Mock()
+    mock_connection.sendto.return_value = 16
+    mock_socket.return_value = mock_connection
+
+    obj = apprise.Apprise.instantiate('rsyslog://localhost')
+    assert isinstance(obj, NotifyRSyslog)
+    assert obj.mode == 'udp'
+    assert re.search(r'mode=udp', obj.url()) is not None
+
+    # Our socket is only created (and our host resolved) once
+    for _ in range(3):
+        assert obj.notify(body='test') is True
+
+    assert mock_socket.call_count == 1
+    assert mock_resolve.call_count == 1
+    assert mock_connection.sendto.call_count == 3
+    assert mock_connection.close.call_count == 0
+    assert mock_connection.sendto.call_args[0][0] == b'<70>- 123 - test'
+
+    # Other instances share our socket
+    obj2 = apprise.Apprise.instantiate('rsyslog://localhost/?logpid=no')
+    mock_connection.sendto.return_value = 10
+    assert obj2.notify(body='test') is True
+    assert mock_socket.call_count == 1
+    assert len(RSYSLOG_POOL) == 1
+
+    # Our address is resolved again once it's no longer trusted
+    with mock.patch('time.monotonic',
+                    return_value=time.monotonic() + 3600):
+        assert obj2.notify(body='test') is True
+
+    assert mock_connection.close.call_count == 1
+    assert mock_socket.call_count == 2
+    assert mock_resolve.call_count == 2
+
+    # An error closes our socket; a new one is created the next time
+    mock_connection.sendto.side_effect = OSError()
+    assert obj2.notify(body='test') is False
+    assert mock_connection.close.call_count == 2
+
+    mock_connection.sendto.side_effect = None
+    assert obj2.notify(body='test') is True
+    assert mock_socket.call_count == 3
+
+    # Our host can not be resolved
+    mock_resolve.side_effect = socket.gaierror()
+    obj = apprise.Apprise.instantiate('rsyslog://localhost:9000')
+    assert obj.notify(body='test') is False
+    assert mock_socket.call_count == 3
+
+
+@mock.patch('socket.socket')
+@mock.patch('os.getpid')
+def test_plugin_rsyslog_tcp(mock_getpid, mock_socket):
+    """
+    NotifyRSyslog() TCP (Octet Counting)
+
+    """
+    mock_getpid.return_value = 123
+    mock_connection = mock.Mock()
+    mock_connection.send.side_effect = len
+    mock_socket.return_value = mock_connection
+
+    obj = apprise.Apprise.instantiate('rsyslog://localhost/?mode=TCP')
+    assert isinstance(obj, NotifyRSyslog)
+    assert obj.mode == 'tcp'
+    assert re.search(r'mode=tcp', obj.url()) is not None
+
+    # Our mode makes up our URL ID (unless it is our default)
+    assert obj.url_id() != \
+        apprise.Apprise.instantiate('rsyslog://localhost').url_id()
+    assert apprise.Apprise.instantiate(
+        'rsyslog://localhost/?mode=udp').url_id() == \
+        apprise.Apprise.instantiate('rsyslog://localhost').url_id()
+    assert 'udp' not in apprise.Apprise.instantiate(
+        'rsyslog://localhost').url_identifier
+
+    assert obj.notify(body='test') is True
+    assert obj.notify(body='test') is True
+
+    # We connected once and framed our messages
+    assert mock_socket.call_count == 1
+    assert mock_socket.call_args[0][1] == socket.SOCK_STREAM
+    assert mock_connection.connect.call_count == 1
+    assert mock_connection.send.call_count == 2
+    assert mock_connection.send.call_args[0][0] == \
+        b'16 <70>- 123 - test'
+    assert mock_connection.sendto.call_count == 0
+
+    # Partial writes are continued
+    mock_connection.reset_mock()
+    mock_connection.send.side_effect = (3, 16)
+    assert obj.notify(body='test') is True
+    assert mock_connection.send.call_count == 2
+    assert mock_connection.send.call_args[0][0] == b'<70>- 123 - test'
+
+    # We check that our idle connection is still open before we use it
+    assert mock_connection.recv.call_count == 1
+    assert mock_connection.recv.call_args[0] == (1, socket.MSG_PEEK)
+
+    # The server closed our idle connection; we notice before we write
+    mock_connection.reset_mock()
+    mock_connection.send.side_effect = len
+    mock_connection.recv.return_value = b''
+    assert obj.notify(body='test') is True
+    assert mock_connection.close.call_count == 1
+    assert mock_connection.connect.call_count == 1
+    assert mock_connection.send.call_count == 1
+    assert mock_connection.sendall.call_count == 0
+
+    # Nothing to read (or an unusable connection)
+    for error in (BlockingIOError(), ConnectionResetError()):
+        mock_connection.reset_mock()
+        mock_connection.recv.side_effect = error
+        assert obj.notify(body='test') is True
+        assert mock_connection.connect.call_count == \
+            (1 if isinstance(error, ConnectionResetError) else 0)
+        assert mock_connection.send.call_count == 1
+
+    mock_connection.recv.side_effect = None
+    mock_connection.recv.return_value = b'x'
+
+    # The server dropped our connection; we reconnect and try again
+    mock_connection.reset_mock()
+    mock_connection.send.side_effect = BrokenPipeError()
+    assert obj.notify(body='test') is True
+    assert mock_connection.close.call_count == 1
+    assert mock_connection.connect.call_count == 1
+    assert mock_connection.send.call_count == 1
+    assert mock_connection.sendall.call_count == 1
+    assert mock_connection.sendall.call_args[0][0] == \
+        b'16 <70>- 123 - test'
+
+    # ... but never once we've written part of our batch
+    mock_connection.reset_mock()
+    mock_connection.send.side_effect = (4, BrokenPipeError())
+    assert obj.notify(body='test') is False
+    assert mock_connection.close.call_count == 1
+    assert mock_connection.sendall.call_count == 0
+
+    # We can't reconnect
+    mock_connection.reset_mock()
+    mock_connection.send.side_effect = ConnectionResetError()
+    mock_connection.connect.side_effect = ConnectionRefusedError()
+    assert obj.notify(body='test') is False
+
+    mock_connection.send.side_effect = len
+    mock_connection.connect.side_effect = socket.timeout()
+    assert obj.notify(body='test') is False
+
+    mock_connection.connect.side_effect = None
+    assert obj.notify(body='test') is True
+
+
+@mock.patch('socket.socket')
+@mock.patch('os.getpid')
+def test_plugin_rsyslog_tcp_batching(mock_getpid, mock_socket):
+    """
+    NotifyRSyslog() TCP Batching
+
+    """
+    mock_getpid.return_value = 123
+    mock_connection = mock.Mock()
+    mock_socket.return_value = mock_connection
+
+    # Hold our first write until our other messages have been queued
+    writing = threading.Event()
+    release = threading.Event()
+
+    def send(data):
+        if not writing.is_set():
+            writing.set()
+            assert release.wait(10)
+        return len(data)
+
+    mock_connection.send.side_effect = send
+
+    results = []
+    obj = apprise.Apprise.instantiate('rsyslog://localhost/?mode=tcp')
+
+    def notify(body):
+        results.append(obj.notify(body=body))
+
+    first = threading.Thread(target=notify, args=('first', ))
+    first.start()
+    assert writing.wait(10)
+
+    others = [threading.Thread(target=notify, args=(body, ))
+              for body in ('second', 'third')]
+    for thread in others:
+        thread.start()
+
+    # Give our other threads a chance to queue their messages
+    while len(RSYSLOG_POOL.acquire(
+            'localhost', 514, mode='tcp',
+            timeout=obj.socket_connect_timeout)
+            ._RSyslogTransport__queue) < 2:
+        time.sleep(0.01)
+
+    release.set()
+    for thread in [first] + others:
+        thread.join(10)
+
+    assert results == [True, True, True]
+
+    # Our queued messages were written at once
+    assert mock_connection.send.call_count == 2
+    data = mock_connection.send.call_args[0][0]
+    assert data in (
+        b'18 <70>- 123 - second17 <70>- 123 - third',
+        b'17 <70>- 123 - third18 <70>- 123 - second')
+
+
+def test_plugin_rsyslog_transport_edge_cases():
+    """
+    NotifyRSyslog() Transport Edge Cases
+
+    """
+
+    with pytest.raises(TypeError):
+        NotifyRSyslog(host="localhost", mode='invalid')
+
+    obj = NotifyRSyslog(host="localhost", mode=None)
+    assert obj.mode == 'udp'
+
+    # Closing a transport that was never opened (or can not be closed)
+    transport = RSyslogTransport('localhost', 514)
+    transport.close()
+
+    transport.sock = mock.Mock()
+    transport.sock.close.side_effect = OSError()
+    transport.close()
+    assert transport.sock is None
+
+    # Our pool closes our sockets
+    transport = RSYSLOG_POOL.acquire('localhost', 514)
+    assert RSYSLOG_POOL.acquire('localhost', 514) is transport
+
+    # Transports are not shared between different timeouts
+    other = RSYSLOG_POOL.acquire('localhost', 514, timeout=5)
+    assert other is not transport
+    assert other.timeout == 5
+    assert len(RSYSLOG_POOL) == 2
+    sock = mock.Mock()
+    transport.sock = sock
+    RSYSLOG_POOL.clear()
+    assert len(RSYSLOG_POOL) == 0
+    assert sock.close.call_count == 1
+
+
+def test_plugin_rsyslog_tcp_server_close():
+    """
+    NotifyRSyslog() TCP connections closed by the server while idle
+
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(2)
+    server.settimeout(10)
+    port = server.getsockname()[1]
+
+    obj = apprise.Apprise.instantiate(
+        'rsyslog://127.0.0.1:{}/?mode=tcp'.format(port))
+
+    try:
+        assert obj.notify(body='first') is True
+        conn, _ = server.accept()
+        conn.settimeout(10)
+        assert conn.recv(1024).endswith(b'first')
+
+        # The server closes our (idle) connection
+        conn.close()
+
+        # We detect this and deliver our message over a new one
+        assert obj.notify(body='second') is True
+        conn, _ = server.accept()
+        conn.settimeout(10)
+        assert conn.recv(1024).endswith(b'second')
+        conn.close()
+
+    finally:
+        server.close()
@@ -31,7 +31,9 @@ from unittest import mock
 import pytest
 import requests
 from apprise import Apprise
+from apprise.plugins.base import TARGET_EXECUTOR
 from apprise.plugins.sns import NotifySNS
+from apprise.plugins.sns import TOPIC_ARN_CACHE
 from helpers import AppriseURLTester
 
 # Disable logging for a cleaner testing output
@@ -412,6 +414,11 @@ def test_plugin_sns_aws_topic_handling(mock_post):
     # Disable our side effect
     mock_post.side_effect = None
 
+    # Our Topic ARNs were cached above; drop them so they're looked up again
+    TOPIC_ARN_CACHE.clear()
+    for server in a:
+        server.store.clear()
+
     # Handle case where TopicArn is missing:
     robj = mock.Mock()
     robj.text = "<CreateTopicResponse></CreateTopicResponse>"
@@ -435,3 +442,191 @@ def test_plugin_sns_aws_topic_handling(mock_post):
     mock_post.return_value = robj
     # We would have failed to make Post
     assert a.notify(title='', body='test') is True
+
+
+@mock.patch('requests.post')
+def test_plugin_sns_topic_arn_cache(mock_post):
+    """
+    NotifySNS() Topic ARN Caching
+
+    """
+
+    arn_response = \
+        """
+         <CreateTopicResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+           <CreateTopicResult>
+             <TopicArn>arn:aws:sns:us-east-1:000000000000:abcd</TopicArn>
+                </CreateTopicResult>
+            <ResponseMetadata>
+                <RequestId>604bef0f-369c-50c5-a7a4-bbd474c83d6a</RequestId>
+            </ResponseMetadata>
+        </CreateTopicResponse>
+        """
+
+    not_found_response = \
+        """
+        <ErrorResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+            <Error>
+                <Type>Sender</Type>
+                <Code>NotFound</Code>
+                <Message>Topic does not exist</Message>
+            </Error>
+            <RequestId>b5614883-babe-56ca-93b2-1c592ba6191e</RequestId>
+        </ErrorResponse>
+        """
+
+    def post(url, data, **kwargs):
+        robj = mock.Mock()
+        robj.text = arn_response if data.find('=CreateTopic') >= 0 else ''
+        robj.status_code = requests.codes.ok
+        return robj
+
+    mock_post.side_effect = post
+
+    def actions():
+        return [c[1]['data'].split('&')[0] for c in mock_post.call_args_list]
+
+    obj = Apprise.instantiate(
+        'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnl/us-east-1/TopicA')
+    assert isinstance(obj, NotifySNS)
+
+    # Our first notification creates our topic
+    assert obj.notify(body='test') is True
+    assert actions() == ['Action=CreateTopic', 'Action=Publish']
+    assert len(TOPIC_ARN_CACHE) == 1
+    assert obj.store.get('topic_arn:TopicA') == \
+        'arn:aws:sns:us-east-1:000000000000:abcd'
+
+    # Our Topic ARN is re-used from here on
+    mock_post.reset_mock()
+    assert obj.notify(body='test') is True
+    assert actions() == ['Action=Publish']
+
+    # Other instances sharing the same credentials benefit too
+    mock_post.reset_mock()
+    obj2 = Apprise.instantiate(
+        'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnl/us-east-1/TopicA')
+    assert obj2.notify(body='test') is True
+    assert actions() == ['Action=Publish']
+
+    # Our persistent store is consulted if our memory cache is empty
+    TOPIC_ARN_CACHE.clear()
+    mock_post.reset_mock()
+    assert obj.notify(body='test') is True
+    assert actions() == ['Action=Publish']
+    assert len(TOPIC_ARN_CACHE) == 1
+
+    # A different region never shares our cached entry
+    mock_post.reset_mock()
+    obj3 = Apprise.instantiate(
+        'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnl/us-west-2/TopicA')
+    assert obj3.notify(body='test') is True
+    assert actions() == ['Action=CreateTopic', 'Action=Publish']
+    assert len(TOPIC_ARN_CACHE) == 2
+
+    # Our topic was removed; it is recreated and our message is re-sent
+    state = {'published': False}
+
+    def post(url, data, **kwargs):
+        robj = mock.Mock()
+        robj.text = ''
+        robj.status_code = requests.codes.ok
+        if data.find('=CreateTopic') >= 0:
+            robj.text = arn_response
+
+        elif not state['published']:
+            state['published'] = True
+            robj.text = not_found_response
+            robj.status_code = requests.codes.not_found
+
+        return robj
+
+    mock_post.side_effect = post
+    mock_post.reset_mock()
+    assert obj.notify(body='test') is True
+    assert actions() == \
+        ['Action=Publish', 'Action=CreateTopic', 'Action=Publish']
+
+    # The recreation of our topic fails
+    def post(url, data, **kwargs):
+        robj = mock.Mock()
+        robj.text = not_found_response
+        robj.status_code = requests.codes.not_found
+        return robj
+
+    mock_post.side_effect = post
+    mock_post.reset_mock()
+    assert obj.notify(body='test') is False
+    assert actions() == ['Action=Publish', 'Action=CreateTopic']
+    assert obj.store.get('topic_arn:TopicA') is None
+
+    # Other errors do not invalidate our cache
+    mock_post.side_effect = None
+    mock_post.return_value = mock.Mock(
+        text=arn_response, status_code=requests.codes.ok)
+    assert obj.notify(body='test') is True
+    mock_post.return_value = mock.Mock(
+        text='', status_code=requests.codes.internal_server_error)
+    mock_post.reset_mock()
+    assert obj.notify(body='test') is False
+    assert actions() == ['Action=Publish']
+    assert obj.store.get('topic_arn:TopicA') == \
+        'arn:aws:sns:us-east-1:000000000000:abcd'
+
+
+@mock.patch('requests.post')
+def test_plugin_sns_concurrency(mock_post):
+    """
+    NotifySNS() Concurrent Publishing
+
+    """
+
+    robj = mock.Mock()
+    robj.text = \
+        """
+         <CreateTopicResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+           <CreateTopicResult>
+             <TopicArn>arn:aws:sns:us-east-1:000000000000:abcd</TopicArn>
+                </CreateTopicResult>
+        </CreateTopicResponse>
+        """
+    robj.status_code = requests.codes.ok
+    mock_post.return_value = robj
+
+    obj = Apprise.instantiate(
+        'sns://T1JJ3T3L2/A1BRTD4JD/TIiajkdnl/us-east-1/'
+        '12223334444/12223334445/12223334446/TopicA/TopicB')
+    assert isinstance(obj, NotifySNS)
+
+    # Deliver to our targets in parallel
+    obj.target_concurrency = 4
+
+    with mock.patch.object(TARGET_EXECUTOR, 'submit',
+                           wraps=TARGET_EXECUTOR.submit) as mock_submit:
+        assert obj.notify(body='test') is True
+        assert mock_submit.call_count == 5
+
+    # 3 phone numbers, and a CreateTopic and Publish for each topic
+    assert mock_post.call_count == 7
+
+    # A failure to any one target is reported
+    def post(url, data, **kwargs):
+        response = mock.Mock()
+        response.text = robj.text
+        response.status_code = requests.codes.bad_request \
+            if data.find('12223334445') >= 0 else requests.codes.ok
+        return response
+
+    mock_post.side_effect = post
+    mock_post.reset_mock()
+    assert obj.notify(body='test') is False
+    assert mock_post.call_count == 5
+
+    # Concurrency can be disabled
+    obj.target_concurrency = 1
+    mock_post.side_effect = None
+    mock_post.reset_mock()
+    with mock.patch.object(TARGET_EXECUTOR, 'submit') as mock_submit:
+        assert obj.notify(body='test') is True
+        assert mock_submit.call_count == 0
+    assert mock_post.call_count == 5
@@ -1142,11 +1142,15 @@ def test_plugin_telegram_html_formatting(mock_post):
         'Another line after the set of text\r\nMore text\r\nlabel'
 
 
+@mock.patch.object(NotifyTelegram, 'target_concurrency', 1)
 @mock.patch('requests.post')
 def test_plugin_telegram_threads(mock_post):
     """
     NotifyTelegram() Threads/Topics
 
+    Our chats are messaged one at a time so that our requests can be
+    verified in order
+
     """
     # Prepare Mock
     mock_post.return_value = requests.Request()
@@ -1327,3 +1331,131 @@ def test_plugin_telegram_markdown_v2(mock_post):
             f'bad character: \\{c}, and already escapped \\{c}'
 
         mock_post.reset_mock()
+
+
+@mock.patch('requests.post')
+def test_plugin_telegram_media_reuse(mock_post):
+    """
+    NotifyTelegram() Uploaded media is referenced by all of our targets
+
+    """
+    # Track the media provided with each of our posts
+    posts = []
+
+    def _post(url, data=None, files=None, **kwargs):
+        posts.append((
+            url.rsplit('/', 1)[-1],
+            dict(data) if isinstance(data, dict) else loads(data),
+            bool(files)))
+
+        response = mock.Mock()
+        response.status_code = requests.codes.ok
+        response.content = dumps({
+            "ok": True,
+            "result": {
+                "message_id": 1,
+                "photo": [
+                    {"file_id": "small-id"},
+                    {"file_id": "photo-id"},
+                ],
+            },
+        })
+        return response
+
+    mock_post.side_effect = _post
+
+    obj = Apprise.instantiate(
+        'tgram://123456789:abcdefg_hijklmnop/1234/5678/9012/')
+    assert isinstance(obj, NotifyTelegram)
+
+    attach = AppriseAttachment(
+        os.path.join(TEST_VAR_DIR, 'apprise-test.jpeg'))
+    assert obj.notify(body='body', attach=attach) is True
+
+    media = [p for p in posts if p[0] == 'sendPhoto']
+    assert len(media) == 3
+
+    # Our content was only uploaded once
+    assert media[0][2] is True
+    assert 'photo' not in media[0][1]
+
+    # Our remaining targets referenced it instead
+    for _, payload, uploaded in media[1:]:
+        assert uploaded is False
+        assert payload['photo'] == 'photo-id'
+
+    # Each of our targets received the content
+    assert sorted(p[1]['chat_id'] for p in media) == [1234, 5678, 9012]
+
+    # Our reference is kept for future notifications
+    del posts[:]
+    assert obj.notify(body='body', attach=attach) is True
+    media = [p for p in posts if p[0] == 'sendPhoto']
+    assert len(media) == 3
+    assert not any(p[2] for p in media)
+
+    # A reference Telegram no longer recognizes causes us to upload again
+    del posts[:]
+    bad_response = mock.Mock()
+    bad_response.status_code = requests.codes.bad_request
+    bad_response.content = dumps({
+        "ok": False,
+        "error_code": 400,
+        "description":
+            "Bad Request: wrong file identifier/HTTP URL specified",
+    })
+
+    failures = [bad_response]
+
+    def _post_once(url, *args, **kwargs):
+        # Our first attachment post fails, the remainder succeed
+        if failures and url.endswith('/sendPhoto'):
+            return failures.pop()
+        return _post(url, *args, **kwargs)
+
+    cache_key = 'media_sendphoto_{}_{}'.format(
+        attach[0].sha256(), attach[0].name)
+
+    mock_post.side_effect = _post_once
+    obj = Apprise.instantiate('tgram://123456789:abcdefg_hijklmnop/1234/')
+    obj.store.set(cache_key, 'old-id')
+    assert obj.notify(body='body', attach=attach) is True
+    assert not failures
+    media = [p for p in posts if p[0] == 'sendPhoto']
+    assert len(media) == 1
+    assert media[0][2] is True
+    assert obj.store.get(cache_key) == 'photo-id'
+
+    # Any other failure leaves our reference alone and is not retried
+    for status_code, content in (
+            (requests.codes.forbidden, dumps({
+                "ok": False, "error_code": 403,
+                "description": "Forbidden: bot was blocked by the user"})),
+            (requests.codes.too_many_requests, b''),
+            (requests.codes.bad_request, dumps({
+                "ok": False, "error_code": 400,
+                "description": "Bad Request: chat not found"})),
+            (requests.codes.bad_request, b'{')):
+
+        del posts[:]
+        bad_response = mock.Mock()
+        bad_response.status_code = status_code
+        bad_response.content = content
+        failures.append(bad_response)
+
+        obj.store.set(cache_key, 'photo-id')
+        assert obj.notify(body='body', attach=attach) is False
+        media = [p for p in posts if p[0] == 'sendPhoto']
+        assert not media
+        assert not failures
+        assert obj.store.get(cache_key) == 'photo-id'
+
+    # The same content sent under a different name is uploaded again
+    del posts[:]
+    renamed = AppriseAttachment('file://{}?name=other.jpeg'.format(
+        os.path.join(TEST_VAR_DIR, 'apprise-test.jpeg')))
+    assert renamed[0].sha256() == attach[0].sha256()
+    assert obj.notify(body='body', attach=renamed) is True
+    media = [p for p in posts if p[0] == 'sendPhoto']
+    assert len(media) == 1
+    assert media[0][2] is True
@@ -37,8 +37,10 @@ from string import digits as str_num
 from apprise import NotifyBase
 from apprise import NotifyFormat
 from apprise import OverflowMode
+from apprise import OverflowUnit
 from apprise import AppriseAsset
 from apprise import Apprise
+from apprise.plugins.base import OverflowCounter
 
 # Disable logging for a cleaner testing output
 import logging
@@ -3920,6 +3922,194 @@ def test_notify_overflow_split_no_amalgamation_force_title_once():
         offset += (len(_body) + ws_diff)
 
 
+def test_notify_overflow_units():
+    """
+    API: Overflow measured in bytes and SMS segments
+
+    """
+
+    class TestNotification(NotifyBase):
+
+        # Test body max length
+        body_maxlen = 160
+
+        # No title
+        title_maxlen = 0
+
+        # Measure by the SMS segment
+        overflow_unit = OverflowUnit.SMS
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(**kwargs)
+
+        def notify(self, *args, **kwargs):
+            # Pretend everything is okay
+            return True
+
+    obj = TestNotification(overflow=OverflowMode.SPLIT)
+
+    # GSM 03.38 content fits 160 characters to a message
+    body = 'a' * 160
+    chunks = obj._apply_overflow(body=body)
+    assert len(chunks) == 1
+    assert chunks[0]['body'] == body
+
+    # Characters in the extension table cost us 2
+    body = '{}' * 20 + 'a' * 81
+    chunks = obj._apply_overflow(body=body)
+    assert len(chunks) == 2
+    assert chunks[0]['body'] == '{}' * 20 + 'a' * 80
+    assert chunks[1]['body'] == 'a'
+
+    # Content outside of the GSM 03.38 alphabet is sent as UCS-2 which only
+    # fits 70 characters to a message
+    body = '\u2603' * 70
+    chunks = obj._apply_overflow(body=body)
+    assert len(chunks) == 1
+    body = ('\u00e9t\u00e9 \u2603 ' * 40).strip()
+    chunks = obj._apply_overflow(body=body)
+    assert len(chunks) == 4
+    for chunk in chunks:
+        assert len(chunk['body']) <= 70
+
+        # We prefer to split on our word boundaries
+        assert set(chunk['body'].split(' ')) == {'\u00e9t\u00e9', '\u2603'}
+
+    # Content is never lost
+    assert ' '.join(c['body'] for c in chunks) == body
+
+    # Line boundaries are preferred over words
+    body = ('word ' * 20).strip() + '\r\n' + 'a b c ' * 20
+    chunks = obj._apply_overflow(body=body)
+    assert len(chunks) == 2
+    assert chunks[0]['body'] == ('word ' * 20).strip()
+    assert chunks[1]['body'] == ('a b c ' * 20).strip()
+
+    # Content without boundaries is split where it has to be
+    body = 'a' * 400
+    chunks = obj._apply_overflow(body=body)
+    assert [len(c['body']) for c in chunks] == [160, 160, 80]
+
+    # Our title is placed into the body and measured along with it; each
+    # message is measured on its own so only the first is sent as UCS-2
+    chunks = obj._apply_overflow(body='a' * 158, title='\u2603')
+    assert len(chunks) == 2
+    assert chunks[0]['body'] == '\u2603\r\n' + 'a' * 67
+    assert chunks[1]['body'] == 'a' * 91
+
+    # A boundary is only used if it leaves our message at least half full
+    body = 'Hi ' + 'a' * 300
+    chunks = obj._apply_overflow(body=body)
+    assert [len(c['body']) for c in chunks] == [160, 143]
+    chunks = obj._apply_overflow(
+        body='Hi\r\n' + 'a' * 300)
+    assert [len(c['body']) for c in chunks] == [160, 144]
+
+    # Truncation
+    body = ('word ' * 40).strip()
+    chunks = obj._apply_overflow(body=body, overflow=OverflowMode.TRUNCATE)
+    assert len(chunks) == 1
+    assert chunks[0]['body'] == ('word ' * 32).strip()
+
+    # We keep as much of our content as fits; word boundaries don't matter
+    chunks = obj._apply_overflow(
+        body='Hi ' + 'a' * 300, overflow=OverflowMode.TRUNCATE)
+    assert chunks[0]['body'] == 'Hi ' + 'a' * 157
+
+    # Measuring by the byte
+    TestNotification.overflow_unit = OverflowUnit.BYTE
+    TestNotification.body_maxlen = 10
+    obj = TestNotification(overflow=OverflowMode.SPLIT)
+
+    # 2 bytes per character
+    chunks = obj._apply_overflow(body='\u00e9' * 12)
+    assert [c['body'] for c in chunks] == ['\u00e9' * 5] * 2 + ['\u00e9' * 2]
+
+    # A character never gets split
+    chunks = obj._apply_overflow(body='\U0001f600' * 3)
+    assert [c['body'] for c in chunks] == ['\U0001f600' * 2, '\U0001f600']
+
+    chunks = obj._apply_overflow(
+        body='\U0001f600' * 3, overflow=OverflowMode.TRUNCATE)
+    assert chunks[0]['body'] == '\U0001f600' * 2
+
+    # Characters are counted as they always have been by default
+    TestNotification.overflow_unit = OverflowUnit.CHARACTER
+    obj = TestNotification(overflow=OverflowMode.SPLIT)
+    chunks = obj._apply_overflow(body='\u00e9' * 12)
+    assert [c['body'] for c in chunks] == ['\u00e9' * 10, '\u00e9' * 2]
+
+
+def test_notify_overflow_counter():
+    """
+    API: OverflowCounter() measurements
+
+    """
+
+    # Characters
+    counter = OverflowCounter('abc\u00e9')
+    assert counter.length() == 4
+    assert counter.length(1, 3) == 2
+    assert list(counter.spans(3)) == [(0, 3), (3, 4)]
+    assert list(counter.spans(3, start=2)) == [(2, 4)]
+    assert counter.truncate(2) == 'ab'
+
+    # Nothing fits within a limit of zero
+    assert list(counter.spans(0)) == []
+    assert list(counter.spans(-1)) == []
+
+    # Bytes
+    counter = OverflowCounter(
+        'a\u00e9\u2603\U0001f600', OverflowUnit.BYTE)
+    assert counter.length() == 1 + 2 + 3 + 4
+    assert counter.length(1, 3) == 5
+    assert counter.truncate(0) == ''
+    assert counter.truncate(6) == 'a\u00e9\u2603'
+    assert counter.truncate(5) == 'a\u00e9'
+    assert counter.truncate(100) == counter.text
+    assert list(counter.spans(0)) == []
+
+    # A character larger than our limit is still returned on its own
+    assert list(counter.spans(2)) == [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+    # Nothing to split
+    assert list(OverflowCounter('', OverflowUnit.BYTE).spans(10)) == []
+
+    # SMS
+    counter = OverflowCounter('hello\r\n[world]', OverflowUnit.SMS)
+    assert counter.length() == 16
+    assert counter.length(0, 5) == 5
+
+    # Once we have to use UCS-2, every character costs more
+    counter = OverflowCounter('hello \u2603', OverflowUnit.SMS)
+    assert counter.length() == 16
+    assert counter.length(0, 6) == 6
+
+    # An astral character takes up 2 UCS-2 characters
+    counter = OverflowCounter('\U0001f600', OverflowUnit.SMS)
+    assert counter.length() == 5
+
+    # Our text as a whole is measured without building any running totals
+    with mock.patch.object(
+            OverflowCounter, '_OverflowCounter__totals') as mock_totals:
+        assert OverflowCounter(
+            'a\u00e9\u2603\U0001f600' * 100,
+            OverflowUnit.BYTE).length() == 1000
+        assert OverflowCounter(
+            'hello [world]' * 10, OverflowUnit.SMS).length() == 150
+        assert OverflowCounter(
+            'hello \u2603\U0001f600' * 10, OverflowUnit.SMS).length() == 206
+        assert mock_totals.call_count == 0
+
+    # ... and agrees with them once they are
+    counter = OverflowCounter('hello \u2603\U0001f600' * 10, OverflowUnit.SMS)
+    assert counter.length(0, 79) == 202
+    assert counter.length(1) == 204
+    assert counter.length() == 206
+    counter = OverflowCounter('a\u00e9\ud800', OverflowUnit.BYTE)
+    assert counter.length() == counter.length(0, 2) + counter.length(2) == 6
+
+
 def test_notify_markdown_general():
     """
     API: Markdown General Testing